@@ -1,12 +1,18 @@
-from app.adapters.gitlab_adapter import GitLabAdapter
+from app.adapters.gitlab_adapter import GitLabAdapter, discard_gitlab_adapter, get_gitlab_adapter
 from app.adapters.figma_adapter import FigmaAdapter
-from app.adapters.slack_adapter import SlackAdapter
+from app.adapters.http_client import get_http_client
+from app.adapters.slack_adapter import SlackAdapter, discard_slack_adapter, get_slack_adapter
 from app.adapters.monitoring_adapter import DatadogAdapter, SentryAdapter
 
 __all__ = [
     "GitLabAdapter",
+    "get_gitlab_adapter",
+    "discard_gitlab_adapter",
     "FigmaAdapter",
     "SlackAdapter",
+    "get_slack_adapter",
+    "discard_slack_adapter",
+    "get_http_client",
     "DatadogAdapter",
     "SentryAdapter",
 ]
@@ -5,6 +5,8 @@ from typing import Any, Optional
 
 import httpx
 
+from app.adapters.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 FIGMA_API = "https://api.figma.com/v1"
@@ -13,20 +15,20 @@ FIGMA_API = "https://api.figma.com/v1"
 class FigmaAdapter:
     """Client for Figma REST API."""
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, client: Optional[httpx.AsyncClient] = None):
         self._headers = {"X-Figma-Token": token}
+        self._client = client  # falls back to the shared pooled client
 
     async def _request(self, method: str, path: str, **kwargs) -> Any:
-        async with httpx.AsyncClient() as client:
-            resp = await client.request(
-                method,
-                f"{FIGMA_API}{path}",
-                headers=self._headers,
-                timeout=30.0,
-                **kwargs,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await (self._client or get_http_client()).request(
+            method,
+            f"{FIGMA_API}{path}",
+            headers=self._headers,
+            timeout=30.0,
+            **kwargs,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def test_connection(self) -> dict:
         return await self._request("GET", "/me")
@@ -1,6 +1,8 @@
 """GitLab REST API v4 adapter."""
 
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import Any, Optional
 from urllib.parse import quote
 
@@ -8,6 +10,19 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+_MAX_KEEPALIVE_CONNECTIONS = 20
+# Cap in-flight requests per GitLab instance so bursts of agent activity
+# stay under its rate limit instead of collecting 429s
+_MAX_CONCURRENT_REQUESTS = 8
+_semaphores: dict[str, asyncio.Semaphore] = {}
+
+# Long-lived adapters keyed by (base_url, token) so connections are reused;
+# least recently used ones are closed once the pool is full
+_MAX_POOLED_ADAPTERS = 64
+_adapter_pool: OrderedDict[tuple[str, str], "GitLabAdapter"] = OrderedDict()
+# Strong refs to in-flight aclose() tasks for evicted adapters
+_closing: set[asyncio.Task] = set()
+
 
 class GitLabAdapter:
     """Client for GitLab REST API v4."""
@@ -16,20 +31,37 @@ class GitLabAdapter:
         self.base_url = base_url.rstrip("/")
         self.api_url = f"{self.base_url}/api/v4"
         self._headers = {"PRIVATE-TOKEN": token}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _request(
         self, method: str, path: str, **kwargs
     ) -> Any:
-        async with httpx.AsyncClient() as client:
-            resp = await client.request(
+        semaphore = _semaphores.get(self.base_url)
+        if semaphore is None:
+            semaphore = _semaphores[self.base_url] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        async with semaphore:
+            resp = await self.client.request(
                 method,
                 f"{self.api_url}{path}",
                 headers=self._headers,
                 timeout=30.0,
                 **kwargs,
             )
-            resp.raise_for_status()
-            return resp.json() if resp.content else None
+        resp.raise_for_status()
+        return resp.json() if resp.content else None
 
     async def test_connection(self) -> dict:
         return await self._request("GET", "/user")
@@ -86,7 +118,9 @@ class GitLabAdapter:
 
     async def get_mr_diff(self, project_id: int, mr_iid: int) -> list[dict]:
         return await self._request(
-            "GET", f"/projects/{project_id}/merge_requests/{mr_iid}/diffs"
+            "GET",
+            f"/projects/{project_id}/merge_requests/{mr_iid}/diffs",
+            params={"per_page": 100},
         )
 
     async def add_mr_comment(
@@ -98,6 +132,15 @@ class GitLabAdapter:
             json={"body": body},
         )
 
+    async def create_mr_discussion(
+        self, project_id: int, mr_iid: int, body: str
+    ) -> dict:
+        return await self._request(
+            "POST",
+            f"/projects/{project_id}/merge_requests/{mr_iid}/discussions",
+            json={"body": body},
+        )
+
     async def merge_mr(self, project_id: int, mr_iid: int) -> dict:
         return await self._request(
             "PUT", f"/projects/{project_id}/merge_requests/{mr_iid}/merge"
@@ -156,3 +199,36 @@ class GitLabAdapter:
         return await self._request(
             "POST", f"/projects/{project_id}/pipeline", json=data
         )
+
+
+def get_gitlab_adapter(base_url: str, token: str) -> GitLabAdapter:
+    """Return the pooled adapter for (base_url, token), creating it on first use."""
+    key = (base_url.rstrip("/"), token)
+    adapter = _adapter_pool.get(key)
+    if adapter is not None:
+        _adapter_pool.move_to_end(key)
+        return adapter
+    adapter = _adapter_pool[key] = GitLabAdapter(base_url, token)
+    while len(_adapter_pool) > _MAX_POOLED_ADAPTERS:
+        _, evicted = _adapter_pool.popitem(last=False)
+        task = asyncio.get_running_loop().create_task(evicted.aclose())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+    return adapter
+
+
+async def discard_gitlab_adapter(base_url: Optional[str], token: Optional[str]) -> None:
+    """Close and forget the pooled adapter for a connection that changed or was removed."""
+    if not base_url or not token:
+        return
+    adapter = _adapter_pool.pop((base_url.rstrip("/"), token), None)
+    if adapter is not None:
+        await adapter.aclose()
+
+
+async def close_gitlab_adapters() -> None:
+    """Close every pooled adapter's HTTP client (called on app shutdown)."""
+    adapters = list(_adapter_pool.values())
+    _adapter_pool.clear()
+    for adapter in adapters:
+        await adapter.aclose()
@@ -5,31 +5,39 @@ from typing import Any, Optional
 
 import httpx
 
+from app.adapters.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
 class DatadogAdapter:
     """Client for Datadog API."""
 
-    def __init__(self, api_key: str, app_key: str, site: str = "datadoghq.com"):
+    def __init__(
+        self,
+        api_key: str,
+        app_key: str,
+        site: str = "datadoghq.com",
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.base_url = f"https://api.{site}/api/v1"
         self._headers = {
             "DD-API-KEY": api_key,
             "DD-APPLICATION-KEY": app_key,
             "Content-Type": "application/json",
         }
+        self._client = client  # falls back to the shared pooled client
 
     async def _request(self, method: str, path: str, **kwargs) -> Any:
-        async with httpx.AsyncClient() as client:
-            resp = await client.request(
-                method,
-                f"{self.base_url}{path}",
-                headers=self._headers,
-                timeout=30.0,
-                **kwargs,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await (self._client or get_http_client()).request(
+            method,
+            f"{self.base_url}{path}",
+            headers=self._headers,
+            timeout=30.0,
+            **kwargs,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def test_connection(self) -> dict:
         return await self._request("GET", "/validate")
@@ -63,24 +71,29 @@ class DatadogAdapter:
 class SentryAdapter:
     """Client for Sentry API."""
 
-    def __init__(self, token: str, base_url: str = "https://sentry.io"):
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "https://sentry.io",
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.base_url = f"{base_url.rstrip('/')}/api/0"
         self._headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        self._client = client  # falls back to the shared pooled client
 
     async def _request(self, method: str, path: str, **kwargs) -> Any:
-        async with httpx.AsyncClient() as client:
-            resp = await client.request(
-                method,
-                f"{self.base_url}{path}",
-                headers=self._headers,
-                timeout=30.0,
-                **kwargs,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await (self._client or get_http_client()).request(
+            method,
+            f"{self.base_url}{path}",
+            headers=self._headers,
+            timeout=30.0,
+            **kwargs,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def test_connection(self) -> dict:
         orgs = await self._request("GET", "/organizations/")
@@ -1,6 +1,8 @@
 """Slack Web API adapter."""
 
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import Any, Optional
 
 import httpx
@@ -9,6 +11,13 @@ logger = logging.getLogger(__name__)
 
 SLACK_API = "https://slack.com/api"
 
+# Long-lived adapters keyed by bot token so the TLS connection is reused;
+# least recently used ones are closed once the pool is full
+_MAX_POOLED_ADAPTERS = 64
+_adapter_pool: OrderedDict[str, "SlackAdapter"] = OrderedDict()
+# Strong refs to in-flight aclose() tasks for evicted adapters
+_closing: set[asyncio.Task] = set()
+
 
 class SlackAdapter:
     """Client for Slack Web API."""
@@ -18,21 +27,32 @@ class SlackAdapter:
             "Authorization": f"Bearer {bot_token}",
             "Content-Type": "application/json",
         }
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient()
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _request(self, method: str, endpoint: str, **kwargs) -> dict:
-        async with httpx.AsyncClient() as client:
-            resp = await client.request(
-                method,
-                f"{SLACK_API}/{endpoint}",
-                headers=self._headers,
-                timeout=15.0,
-                **kwargs,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            if not data.get("ok"):
-                raise Exception(f"Slack API error: {data.get('error', 'unknown')}")
-            return data
+        resp = await self.client.request(
+            method,
+            f"{SLACK_API}/{endpoint}",
+            headers=self._headers,
+            timeout=15.0,
+            **kwargs,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        if not data.get("ok"):
+            raise Exception(f"Slack API error: {data.get('error', 'unknown')}")
+        return data
 
     async def test_connection(self) -> dict:
         return await self._request("POST", "auth.test")
@@ -78,3 +98,35 @@ class SlackAdapter:
             "reactions.add",
             json={"channel": channel, "timestamp": timestamp, "name": emoji},
         )
+
+
+def get_slack_adapter(bot_token: str) -> SlackAdapter:
+    """Return the pooled adapter for a bot token, creating it on first use."""
+    adapter = _adapter_pool.get(bot_token)
+    if adapter is not None:
+        _adapter_pool.move_to_end(bot_token)
+        return adapter
+    adapter = _adapter_pool[bot_token] = SlackAdapter(bot_token)
+    while len(_adapter_pool) > _MAX_POOLED_ADAPTERS:
+        _, evicted = _adapter_pool.popitem(last=False)
+        task = asyncio.get_running_loop().create_task(evicted.aclose())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+    return adapter
+
+
+async def discard_slack_adapter(bot_token: Optional[str]) -> None:
+    """Close and forget the pooled adapter for a connection that changed or was removed."""
+    if not bot_token:
+        return
+    adapter = _adapter_pool.pop(bot_token, None)
+    if adapter is not None:
+        await adapter.aclose()
+
+
+async def close_slack_adapters() -> None:
+    """Close every pooled adapter's HTTP client (called on app shutdown)."""
+    adapters = list(_adapter_pool.values())
+    _adapter_pool.clear()
+    for adapter in adapters:
+        await adapter.aclose()
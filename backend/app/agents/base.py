@@ -1,12 +1,13 @@
 """Base agent class with common infrastructure for all agents."""
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Awaitable, Optional
 
 from app.agents.event_bus import Event, EventBus, EventType, event_bus
 from app.db.database import async_session
@@ -31,6 +32,40 @@ class AgentMetrics:
     _total_ms: float = field(default=0.0, repr=False)
 
 
+# GitLab API limit is ~1MB; MR comments are capped well below that
+MAX_MR_COMMENT_LEN = 60000
+_TRUNCATED_MARKER = "\n\n*...truncated*"
+
+
+class CommentBuilder:
+    """Accumulates MR comment text, dropping everything past ``max_len``.
+
+    The cap is enforced while appending, so an oversized AI response never
+    gets built into a multi-MB string only to be sliced afterwards.
+    """
+
+    def __init__(self, max_len: int = MAX_MR_COMMENT_LEN):
+        self._parts: list[str] = []
+        self._remaining = max_len
+        self.truncated = False
+
+    def append(self, text: str) -> bool:
+        """Add text; returns False once the comment is full."""
+        if self.truncated:
+            return False
+        if len(text) > self._remaining:
+            self._parts.append(text[: self._remaining])
+            self._parts.append(_TRUNCATED_MARKER)
+            self.truncated = True
+            return False
+        self._parts.append(text)
+        self._remaining -= len(text)
+        return True
+
+    def build(self) -> str:
+        return "".join(self._parts)
+
+
 class BaseAgent(ABC):
     """Abstract base class for all ShipIt agents."""
 
@@ -67,6 +102,9 @@ class BaseAgent(ABC):
         for event_type in self.subscribed_events:
             self.bus.unsubscribe(event_type, self._on_event)
 
+    async def stop(self) -> None:
+        """Finish buffered work at shutdown; runs after the bus stops, before adapters close."""
+
     async def _on_event(self, event: Event) -> None:
         if not self._enabled:
             return
@@ -105,6 +143,16 @@ class BaseAgent(ABC):
     async def publish(self, event: Event) -> None:
         await self.bus.publish(event)
 
+    async def gather_logged(self, *aws: Awaitable[Any]) -> list[Any]:
+        """Run independent side effects concurrently; log failures instead of raising."""
+        results = await asyncio.gather(*aws, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Agent {self.name} side effect failed: {result!r}", exc_info=result
+                )
+        return results
+
     async def ai_completion(
         self,
         system_prompt: str,
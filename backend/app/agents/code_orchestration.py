@@ -204,7 +204,7 @@ class CodeOrchestrationAgent(BaseAgent):
         try:
             from sqlalchemy import select
             from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
+            from app.adapters.gitlab_adapter import get_gitlab_adapter
 
             async with self.get_db_session() as db:
                 result = await db.execute(
@@ -216,7 +216,7 @@ class CodeOrchestrationAgent(BaseAgent):
                 )
                 conn = result.scalars().first()
                 if conn:
-                    return GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
+                    return get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
         except Exception:
             logger.exception("Failed to get GitLab adapter")
         return None
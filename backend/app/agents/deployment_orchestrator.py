@@ -172,7 +172,7 @@ class DeploymentOrchestratorAgent(BaseAgent):
         try:
             from sqlalchemy import select
             from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
+            from app.adapters.gitlab_adapter import get_gitlab_adapter
 
             async with self.get_db_session() as db:
                 result = await db.execute(
@@ -186,7 +186,7 @@ class DeploymentOrchestratorAgent(BaseAgent):
                 if not conn:
                     return {"status": "skipped", "reason": "no gitlab connection"}
 
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
+                gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
                 gl_project_id = (conn.config or {}).get("project_id")
                 if not gl_project_id:
                     return {"status": "skipped", "reason": "no gitlab project_id"}
@@ -207,7 +207,7 @@ class DeploymentOrchestratorAgent(BaseAgent):
         try:
             from sqlalchemy import select
             from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
+            from app.adapters.gitlab_adapter import get_gitlab_adapter
 
             async with self.get_db_session() as db:
                 result = await db.execute(
@@ -219,7 +219,7 @@ class DeploymentOrchestratorAgent(BaseAgent):
                 )
                 conn = result.scalars().first()
                 if conn:
-                    gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
+                    gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
                     gl_project_id = (conn.config or {}).get("project_id")
                     if gl_project_id:
                         commits = await gitlab.get_commits(gl_project_id, limit=20)
@@ -344,7 +344,7 @@ class DeploymentOrchestratorAgent(BaseAgent):
         try:
             from sqlalchemy import select
             from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
+            from app.adapters.gitlab_adapter import get_gitlab_adapter
 
             async with self.get_db_session() as db:
                 result = await db.execute(
@@ -359,7 +359,7 @@ class DeploymentOrchestratorAgent(BaseAgent):
                     logger.error("No GitLab connection for rollback")
                     return
 
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
+                gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
                 gl_project_id = (conn.config or {}).get("project_id")
                 if not gl_project_id:
                     logger.error("No GitLab project_id for rollback")
@@ -177,7 +177,7 @@ class DesignSyncAgent(BaseAgent):
         try:
             from sqlalchemy import select
             from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
+            from app.adapters.gitlab_adapter import get_gitlab_adapter
 
             async with self.get_db_session() as db:
                 result = await db.execute(
@@ -191,7 +191,7 @@ class DesignSyncAgent(BaseAgent):
                 if not conn:
                     return
 
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
+                gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
                 gl_project_id = (conn.config or {}).get("project_id")
                 if not gl_project_id:
                     return
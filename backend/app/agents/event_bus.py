@@ -7,6 +7,7 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Callable, Coroutine, Optional
 
 logger = logging.getLogger(__name__)
@@ -89,6 +90,19 @@ class Event:
     timestamp: datetime = field(default_factory=datetime.utcnow)
     correlation_id: Optional[str] = None
 
+    @cached_property
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready view of the event, built on first read and reused after."""
+        return {
+            "event_id": self.event_id,
+            "type": self.type.value,
+            "source_agent": self.source_agent,
+            "project_id": self.project_id,
+            "data": self.data,
+            "timestamp": self.timestamp.isoformat(),
+            "correlation_id": self.correlation_id,
+        }
+
 
 EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
 
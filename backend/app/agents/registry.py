@@ -49,6 +49,11 @@ class AgentRegistry:
         for agent in self._agents.values():
             agent.unregister()
         await self.bus.stop()
+        for agent in self._agents.values():
+            try:
+                await agent.stop()
+            except Exception:
+                logger.exception(f"Agent {agent.name} failed to stop cleanly")
         logger.info("All agents stopped")
 
     def status(self) -> list[dict]:
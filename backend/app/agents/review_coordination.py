@@ -1,25 +1,81 @@
 """Agent 6: Review Coordination - Assigns reviewers, tracks SLAs, auto-merges."""
 
 import logging
-from datetime import datetime
-from typing import Optional
+import re
+import time
+from typing import Callable, Optional
 
+from sqlalchemy import select
+
+from app.adapters.gitlab_adapter import GitLabAdapter, get_gitlab_adapter
 from app.agents.base import BaseAgent
 from app.agents.event_bus import Event, EventType
-from app.services import agent_ai_service
+from app.models.agent_state import AgentConfig
+from app.services import agent_ai_service, connection_cache, mr_diff_cache
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_SLA_HOURS = 24
 
+# Diffs this small that touch no sensitive keywords skip the LLM complexity pass
+_TRIVIAL_DIFF_MAX_CHARS = 200
+_TRIVIAL_DIFF_MAX_FILES = 2
+_HIGH_RISK_RE = re.compile(r"\b(sql|password|token|auth|crypto|subprocess|eval)\b", re.I)
+# Only this much of the diff makes it into the complexity prompt
+_DIFF_PROMPT_CHARS = 6000
+
 # In-memory MR readiness tracker: mr_key -> {security_passed, tests_passed, approved}
 _mr_state: dict[str, dict] = {}
 
+# GitLab context memoized per MR lifecycle:
+# correlation_id -> (expires_at, connection generation, adapter, gl_project_id)
+_CORR_CACHE_TTL_SECONDS = 30 * 60
+_corr_cache: dict[str, tuple[float, int, GitLabAdapter, int]] = {}
+
+
+# Message templates, formatted with str.format_map
+_SLACK_REVIEW_TMPL = (
+    "*Review Needed* - MR !{mr_iid}\n"
+    "Complexity: {complexity} | Est. time: {minutes}min\n"
+    "Risk areas: {risks}"
+)
+_SLACK_AUTOMERGE_TMPL = (
+    "*Auto-Merged* - MR !{mr_iid}\n"
+    "Security: passed | Tests: passed | Eligible: yes"
+)
+_COMMENT_HEADER_TMPL = (
+    "## Review Summary\n\n"
+    "**Complexity:** {complexity}\n"
+    "**Estimated Review Time:** {minutes} minutes\n"
+    "**Auto-merge Eligible:** {eligible}\n\n"
+)
+
+# Readiness events: event type -> (state flag, extractor of the flag value)
+_READY_FLAG_BY_EVENT: dict[EventType, tuple[str, Callable[[dict], bool]]] = {
+    EventType.SECURITY_SCAN_COMPLETE: ("security_passed", lambda data: data.get("passed", False)),
+    # Tests are considered passed when a report is created
+    EventType.TEST_REPORT_CREATED: ("tests_passed", lambda data: True),
+}
+
 
 def _mr_key(project_id: int | None, mr_iid: int | None) -> str:
     return f"{project_id}:{mr_iid}"
 
 
+def _is_trivial_diff(diff_content: str, file_count: int) -> bool:
+    return (
+        0 < len(diff_content) < _TRIVIAL_DIFF_MAX_CHARS
+        and file_count <= _TRIVIAL_DIFF_MAX_FILES
+        and not _HIGH_RISK_RE.search(diff_content)
+    )
+
+
+def _prune_corr_cache(now: float) -> None:
+    expired = [cid for cid, (expires_at, *_) in _corr_cache.items() if expires_at <= now]
+    for cid in expired:
+        _corr_cache.pop(cid, None)
+
+
 class ReviewCoordinationAgent(BaseAgent):
 
     @property
@@ -45,10 +101,8 @@ class ReviewCoordinationAgent(BaseAgent):
     async def handle_event(self, event: Event) -> None:
         if event.type in (EventType.PR_READY_FOR_REVIEW, EventType.PR_OPENED):
             await self._handle_pr_opened(event)
-        elif event.type == EventType.SECURITY_SCAN_COMPLETE:
-            await self._on_security_complete(event)
-        elif event.type == EventType.TEST_REPORT_CREATED:
-            await self._on_tests_complete(event)
+        elif event.type in _READY_FLAG_BY_EVENT:
+            await self._on_readiness(event, *_READY_FLAG_BY_EVENT[event.type])
 
     async def _handle_pr_opened(self, event: Event) -> None:
         data = event.data
@@ -63,7 +117,7 @@ class ReviewCoordinationAgent(BaseAgent):
             "security_passed": False,
             "tests_passed": False,
             "auto_merge_eligible": False,
-            "opened_at": datetime.utcnow().isoformat(),
+            "opened_at": time.time(),
         }
 
         # Get diff for complexity analysis
@@ -71,20 +125,30 @@ class ReviewCoordinationAgent(BaseAgent):
         file_count = len(data.get("files", []))
 
         if not diff_content and project_id and mr_iid:
-            diff_content, files = await self._get_diff(project_id, mr_iid)
+            diff_content, files = await self._get_diff(project_id, mr_iid, data.get("sha"))
             file_count = len(files)
 
-        # Analyze complexity
-        analysis = await agent_ai_service.analyze_review_complexity(
-            diff_content[:6000], file_count
-        )
+        # Analyze complexity (trivial diffs are classified locally)
+        if _is_trivial_diff(diff_content, file_count):
+            analysis = {
+                "complexity": "low",
+                "risk_areas": [],
+                "recommended_expertise": [],
+                "estimated_review_minutes": 5,
+                "summary": "Trivial change (auto-classified)",
+                "auto_merge_eligible": True,
+            }
+        else:
+            analysis = await agent_ai_service.analyze_review_complexity(
+                diff_content[:_DIFF_PROMPT_CHARS], file_count
+            )
 
         # Store auto-merge eligibility
         _mr_state[key]["auto_merge_eligible"] = analysis.get("auto_merge_eligible", False)
 
         # Assign reviewers based on expertise matching
         reviewer_ids = await self._assign_reviewers(
-            project_id, analysis.get("recommended_expertise", [])
+            project_id, analysis.get("recommended_expertise", []), event.correlation_id
         )
 
         await self.publish(Event(
@@ -105,25 +169,30 @@ class ReviewCoordinationAgent(BaseAgent):
 
         # Post review summary as MR comment
         if mr_iid:
-            await self._post_review_summary(project_id, mr_iid, analysis)
+            await self._post_review_summary(
+                project_id, mr_iid, analysis, event.correlation_id
+            )
 
         # Send Slack notification
         await self.publish(Event(
             type=EventType.SLACK_NOTIFICATION,
             data={
-                "message": (
-                    f"*Review Needed* - MR !{mr_iid}\n"
-                    f"Complexity: {analysis.get('complexity', 'medium')} | "
-                    f"Est. time: {analysis.get('estimated_review_minutes', 30)}min\n"
-                    f"Risk areas: {', '.join(analysis.get('risk_areas', ['none']))}"
-                ),
+                "message": _SLACK_REVIEW_TMPL.format_map({
+                    "mr_iid": mr_iid,
+                    "complexity": analysis.get("complexity", "medium"),
+                    "minutes": analysis.get("estimated_review_minutes", 30),
+                    "risks": ", ".join(analysis.get("risk_areas", ["none"])),
+                }),
             },
             source_agent=self.name,
             project_id=project_id,
             correlation_id=event.correlation_id,
         ))
 
-    async def _on_security_complete(self, event: Event) -> None:
+    async def _on_readiness(
+        self, event: Event, flag: str, value_fn: Callable[[dict], bool]
+    ) -> None:
+        """Record one auto-merge readiness flag and re-check merge conditions."""
         data = event.data
         mr_iid = data.get("mr_iid")
         project_id = event.project_id
@@ -132,43 +201,20 @@ class ReviewCoordinationAgent(BaseAgent):
             return
 
         key = _mr_key(project_id, mr_iid)
-        if key not in _mr_state:
-            _mr_state[key] = {
-                "security_passed": False,
-                "tests_passed": False,
-                "auto_merge_eligible": False,
-            }
-
-        passed = data.get("passed", False)
-        _mr_state[key]["security_passed"] = passed
-
-        if not passed:
-            logger.info(f"MR {mr_iid} failed security scan - auto-merge blocked")
-            return
-
-        logger.info(f"MR {mr_iid} passed security scan")
-        await self._try_auto_merge(project_id, mr_iid, event.correlation_id)
+        state = _mr_state.setdefault(key, {
+            "security_passed": False,
+            "tests_passed": False,
+            "auto_merge_eligible": False,
+        })
 
-    async def _on_tests_complete(self, event: Event) -> None:
-        data = event.data
-        mr_iid = data.get("mr_iid")
-        project_id = event.project_id
+        value = value_fn(data)
+        state[flag] = value
 
-        if not mr_iid or not project_id:
+        if not value:
+            logger.info(f"MR {mr_iid}: {flag} is false - auto-merge blocked")
             return
 
-        key = _mr_key(project_id, mr_iid)
-        if key not in _mr_state:
-            _mr_state[key] = {
-                "security_passed": False,
-                "tests_passed": False,
-                "auto_merge_eligible": False,
-            }
-
-        # Tests are considered passed when a report is created
-        _mr_state[key]["tests_passed"] = True
-
-        logger.info(f"MR {mr_iid} test report received")
+        logger.info(f"MR {mr_iid}: {flag} recorded")
         await self._try_auto_merge(project_id, mr_iid, event.correlation_id)
 
     async def _try_auto_merge(
@@ -205,68 +251,79 @@ class ReviewCoordinationAgent(BaseAgent):
         logger.info(f"MR {mr_iid}: all checks passed, executing auto-merge")
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
-
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    logger.error(f"MR {mr_iid}: no GitLab connection for auto-merge")
-                    return
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    logger.error(f"MR {mr_iid}: no GitLab project_id for auto-merge")
-                    return
-
-                merge_result = await gitlab.merge_mr(gl_project_id, mr_iid)
-                logger.info(f"MR {mr_iid} auto-merged successfully: {merge_result.get('state')}")
-
-                # Clean up state
-                _mr_state.pop(key, None)
-
-                await self.publish(Event(
-                    type=EventType.PR_AUTO_MERGED,
-                    data={
-                        "mr_iid": mr_iid,
-                        "merge_state": merge_result.get("state"),
-                        "merged_by": "auto-merge",
-                    },
-                    source_agent=self.name,
-                    project_id=project_id,
-                    correlation_id=correlation_id,
-                ))
-
-                await self.publish(Event(
-                    type=EventType.SLACK_NOTIFICATION,
-                    data={
-                        "message": (
-                            f"*Auto-Merged* - MR !{mr_iid}\n"
-                            f"Security: passed | Tests: passed | Eligible: yes"
-                        ),
-                    },
-                    source_agent=self.name,
-                    project_id=project_id,
-                    correlation_id=correlation_id,
-                ))
+            ctx = await self._get_gitlab_context(project_id, correlation_id)
+            if not ctx:
+                logger.error(f"MR {mr_iid}: no GitLab connection/project_id for auto-merge")
+                return
+            gitlab, gl_project_id = ctx
+
+            merge_result = await gitlab.merge_mr(gl_project_id, mr_iid)
+            logger.info(f"MR {mr_iid} auto-merged successfully: {merge_result.get('state')}")
+
+            # Clean up state
+            _mr_state.pop(key, None)
+            if correlation_id:
+                _corr_cache.pop(correlation_id, None)
+
+            await self.publish(Event(
+                type=EventType.PR_AUTO_MERGED,
+                data={
+                    "mr_iid": mr_iid,
+                    "merge_state": merge_result.get("state"),
+                    "merged_by": "auto-merge",
+                },
+                source_agent=self.name,
+                project_id=project_id,
+                correlation_id=correlation_id,
+            ))
+
+            await self.publish(Event(
+                type=EventType.SLACK_NOTIFICATION,
+                data={
+                    "message": _SLACK_AUTOMERGE_TMPL.format_map({"mr_iid": mr_iid}),
+                },
+                source_agent=self.name,
+                project_id=project_id,
+                correlation_id=correlation_id,
+            ))
         except Exception:
             logger.exception(f"Failed to auto-merge MR {mr_iid}")
 
+    async def _get_gitlab_context(
+        self, project_id: int | None, correlation_id: str | None = None
+    ) -> Optional[tuple[GitLabAdapter, int]]:
+        """Resolve the project's GitLab adapter + remote project id.
+
+        Memoized per correlation_id so every event of one MR lifecycle shares
+        a single ServiceConnection lookup; an entry is dropped as soon as the
+        project's connections change (token rotation, disconnect).
+        """
+        if not project_id:
+            return None
+
+        now = time.monotonic()
+        generation = connection_cache.generation(project_id)
+        if correlation_id:
+            cached = _corr_cache.get(correlation_id)
+            if cached and cached[0] > now and cached[1] == generation:
+                return cached[2], cached[3]
+
+        conn = await connection_cache.get(project_id, "gitlab")
+        if not conn or not conn.gl_project_id:
+            return None
+        gl_project_id = conn.gl_project_id
+
+        gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
+        if correlation_id:
+            _prune_corr_cache(now)
+            _corr_cache[correlation_id] = (
+                now + _CORR_CACHE_TTL_SECONDS, generation, gitlab, gl_project_id
+            )
+        return gitlab, gl_project_id
+
     async def _is_auto_merge_enabled(self, project_id: int) -> bool:
         """Check project agent config for auto-merge setting."""
         try:
-            from sqlalchemy import select
-            from app.models.agent_state import AgentConfig
-
             async with self.get_db_session() as db:
                 result = await db.execute(
                     select(AgentConfig).where(
@@ -282,70 +339,50 @@ class ReviewCoordinationAgent(BaseAgent):
         return False
 
     async def _assign_reviewers(
-        self, project_id: int | None, expertise: list[str]
+        self,
+        project_id: int | None,
+        expertise: list[str],
+        correlation_id: str | None = None,
     ) -> list[int]:
         """Assign reviewers from project members, scoring by expertise match."""
         if not project_id:
             return []
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
-
+            ctx = await self._get_gitlab_context(project_id, correlation_id)
+            if not ctx:
+                return []
+            gitlab, gl_project_id = ctx
+
+            members = await gitlab.list_project_members(gl_project_id)
+            if not members:
+                return []
+
+            # Score members by expertise match using username/name overlap
+            expertise_lower = {e.lower() for e in expertise}
+            scored = []
+            for m in members:
+                score = 0
+                name_parts = set(m.get("name", "").lower().split())
+                username = m.get("username", "").lower()
+                # Higher access level = more experienced
+                access = m.get("access_level", 0)
+                if access >= 40:  # Maintainer+
+                    score += 3
+                elif access >= 30:  # Developer
+                    score += 1
+                # Check if member's name/username hints at expertise
+                for exp in expertise_lower:
+                    if exp in username or exp in name_parts:
+                        score += 5
+                scored.append((score, m["id"]))
+
+            # Sort by score descending, take top 2
+            scored.sort(key=lambda x: x[0], reverse=True)
+
+            # Get configurable reviewer count
+            num_reviewers = 2
             async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    return []
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    return []
-
-                members = await gitlab.list_project_members(gl_project_id)
-                if not members:
-                    return []
-
-                # Score members by expertise match using username/name overlap
-                expertise_lower = {e.lower() for e in expertise}
-                scored = []
-                for m in members:
-                    score = 0
-                    name_parts = set(m.get("name", "").lower().split())
-                    username = m.get("username", "").lower()
-                    # Higher access level = more experienced
-                    access = m.get("access_level", 0)
-                    if access >= 40:  # Maintainer+
-                        score += 3
-                    elif access >= 30:  # Developer
-                        score += 1
-                    # Check if member's name/username hints at expertise
-                    for exp in expertise_lower:
-                        if exp in username or exp in name_parts:
-                            score += 5
-                    scored.append((score, m["id"]))
-
-                # Sort by score descending, take top 2
-                scored.sort(key=lambda x: x[0], reverse=True)
-
-                # Get configurable reviewer count
-                num_reviewers = 2
-                cfg_result = await db.execute(
-                    select(ServiceConnection).where(  # reuse to avoid extra import
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                    )
-                )
-
-                from app.models.agent_state import AgentConfig
                 cfg_result = await db.execute(
                     select(AgentConfig).where(
                         AgentConfig.project_id == project_id,
@@ -353,93 +390,60 @@ class ReviewCoordinationAgent(BaseAgent):
                     )
                 )
                 cfg = cfg_result.scalars().first()
-                if cfg and cfg.config:
-                    num_reviewers = cfg.config.get("min_reviewers", 2)
+            if cfg and cfg.config:
+                num_reviewers = cfg.config.get("min_reviewers", 2)
 
-                return [member_id for _, member_id in scored[:num_reviewers]]
+            return [member_id for _, member_id in scored[:num_reviewers]]
         except Exception:
             logger.exception("Failed to assign reviewers")
             return []
 
     async def _get_diff(
-        self, project_id: int | None, mr_iid: int
+        self, project_id: int | None, mr_iid: int, sha: str | None = None
     ) -> tuple[str, list[str]]:
         if not project_id:
             return "", []
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
-
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    return "", []
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    return "", []
-
-                diffs = await gitlab.get_mr_diff(gl_project_id, mr_iid)
-                file_paths = [d.get("new_path", "") for d in diffs]
-                diff_text = "\n".join(d.get("diff", "") for d in diffs)
-                return diff_text, file_paths
+            return await mr_diff_cache.get_diff(
+                project_id, mr_iid, sha, max_chars=_DIFF_PROMPT_CHARS
+            )
         except Exception:
             logger.exception("Failed to fetch diff")
             return "", []
 
     async def _post_review_summary(
-        self, project_id: int | None, mr_iid: int, analysis: dict
+        self,
+        project_id: int | None,
+        mr_iid: int,
+        analysis: dict,
+        correlation_id: str | None = None,
     ) -> None:
         if not project_id:
             return
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
+            ctx = await self._get_gitlab_context(project_id, correlation_id)
+            if not ctx:
+                return
+            gitlab, gl_project_id = ctx
 
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    return
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    return
-
-                comment = "## Review Summary\n\n"
-                comment += f"**Complexity:** {analysis.get('complexity', 'medium')}\n"
-                comment += f"**Estimated Review Time:** {analysis.get('estimated_review_minutes', 30)} minutes\n"
-                comment += f"**Auto-merge Eligible:** {'Yes' if analysis.get('auto_merge_eligible') else 'No'}\n\n"
-
-                risk_areas = analysis.get("risk_areas", [])
-                if risk_areas:
-                    comment += "### Risk Areas\n"
-                    for area in risk_areas:
-                        comment += f"- {area}\n"
-                    comment += "\n"
-
-                if analysis.get("summary"):
-                    comment += f"### Summary\n{analysis['summary']}\n"
-
-                await gitlab.add_mr_comment(gl_project_id, mr_iid, comment)
+            comment = _COMMENT_HEADER_TMPL.format_map({
+                "complexity": analysis.get("complexity", "medium"),
+                "minutes": analysis.get("estimated_review_minutes", 30),
+                "eligible": "Yes" if analysis.get("auto_merge_eligible") else "No",
+            })
+
+            risk_areas = analysis.get("risk_areas", [])
+            if risk_areas:
+                comment += "### Risk Areas\n"
+                for area in risk_areas:
+                    comment += f"- {area}\n"
+                comment += "\n"
+
+            if analysis.get("summary"):
+                comment += f"### Summary\n{analysis['summary']}\n"
+
+            await gitlab.add_mr_comment(gl_project_id, mr_iid, comment)
         except Exception:
             logger.exception("Failed to post review summary")
@@ -18,13 +18,18 @@ class Job:
 
 
 class Scheduler:
-    """Asyncio-based periodic task scheduler with 30s tick resolution."""
+    """Asyncio-based periodic task scheduler.
+
+    Sleeps until the next job is due (at most ``tick_interval``) and can be
+    woken early by ``add_job`` or ``stop``. With no jobs it parks entirely.
+    """
 
     def __init__(self, tick_interval: float = 30.0):
         self._jobs: list[Job] = []
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._tick_interval = tick_interval
+        self._wake = asyncio.Event()
 
     def add_job(
         self,
@@ -33,10 +38,26 @@ class Scheduler:
         interval_seconds: float,
     ) -> None:
         self._jobs.append(Job(name=name, func=func, interval_seconds=interval_seconds))
+        self._wake.set()
         logger.info(f"Scheduled job '{name}' every {interval_seconds}s")
 
+    def _next_delay(self, now: float) -> float:
+        delay = self._tick_interval
+        for job in self._jobs:
+            delay = min(delay, job.last_run + job.interval_seconds - now)
+        return max(delay, 0.0)
+
     async def _tick(self) -> None:
         while self._running:
+            if not self._jobs:
+                # Park until add_job() or stop() signals
+                try:
+                    await self._wake.wait()
+                except asyncio.CancelledError:
+                    break
+                self._wake.clear()
+                continue
+
             now = time.monotonic()
             for job in self._jobs:
                 if now - job.last_run >= job.interval_seconds:
@@ -46,7 +67,12 @@ class Scheduler:
                     except Exception:
                         logger.exception(f"Scheduler job '{job.name}' failed")
             try:
-                await asyncio.sleep(self._tick_interval)
+                await asyncio.wait_for(
+                    self._wake.wait(), timeout=self._next_delay(time.monotonic())
+                )
+                self._wake.clear()
+            except asyncio.TimeoutError:
+                pass
             except asyncio.CancelledError:
                 break
 
@@ -59,6 +85,7 @@ class Scheduler:
 
     async def stop(self) -> None:
         self._running = False
+        self._wake.set()
         if self._task:
             self._task.cancel()
             try:
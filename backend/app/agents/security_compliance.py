@@ -2,12 +2,25 @@
 
 import logging
 
-from app.agents.base import BaseAgent
+from app.adapters.gitlab_adapter import get_gitlab_adapter
+from app.agents.base import BaseAgent, CommentBuilder
 from app.agents.event_bus import Event, EventType
-from app.services import agent_ai_service
+from app.services import agent_ai_service, connection_cache, mr_diff_cache
+from app.services.agent_ai_service import Severity
 
 logger = logging.getLogger(__name__)
 
+_SEVERITY_EMOJI = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}
+_DEFAULT_EMOJI = "⚪"
+_VULN_LINE_TEMPLATE = (
+    "- {emoji} **{sev}** - {type}: {desc}\n"
+    "  - File: `{file}`\n"
+    "  - Fix: {fix}\n\n"
+)
+
+# Events carry a short preview plus counts; the full list goes in the MR comment
+_EVENT_VULN_PREVIEW = 5
+
 
 class SecurityComplianceAgent(BaseAgent):
 
@@ -34,9 +47,9 @@ class SecurityComplianceAgent(BaseAgent):
         logger.info(f"Security scan for MR {mr_iid} in project {project_id}")
 
         # Fetch diff from GitLab (or use inline diff from trigger data)
-        diff_content, file_paths = await self._get_diff(project_id, mr_iid, data)
+        file_diffs, file_paths = await self._get_diff(project_id, mr_iid, data)
 
-        if not diff_content:
+        if not file_diffs:
             logger.info("No diff content available, skipping scan")
             return
 
@@ -55,241 +68,226 @@ class SecurityComplianceAgent(BaseAgent):
         ))
 
         # Run AI security scan
-        scan_result = await agent_ai_service.security_scan(diff_content, file_paths)
+        scan_result = await agent_ai_service.security_scan(file_diffs)
 
+        # The scan returns a per-severity top-k list (most severe first, each
+        # with an integer severity_int) plus untruncated counts
         vulnerabilities = scan_result.get("vulnerabilities", [])
-        critical_vulns = [v for v in vulnerabilities if v.get("severity") == "critical"]
-        high_vulns = [v for v in vulnerabilities if v.get("severity") == "high"]
+        critical_vulns = []
+        for v in vulnerabilities:
+            if v["severity_int"] != Severity.CRITICAL:
+                break
+            critical_vulns.append(v)
+        counts = scan_result.get("counts_by_severity", {})
+        critical_count = counts.get("critical", 0)
+        total_count = sum(counts.values())
+
+        # Events share one short preview instead of each copying the full list
+        preview = vulnerabilities[:_EVENT_VULN_PREVIEW]
+
+        # GitLab posts and bus publishes are independent - run them concurrently
+        side_effects = []
 
         # Post findings as MR comments
         if mr_iid and vulnerabilities:
-            await self._post_findings(project_id, mr_iid, scan_result)
+            side_effects.append(self._post_findings(project_id, mr_iid, scan_result))
 
         # Block merge if critical vulnerabilities - post blocking comment and add label
         if critical_vulns and mr_iid:
-            await self._block_merge(project_id, mr_iid, critical_vulns)
-            await self.publish(Event(
-                type=EventType.MERGE_BLOCKED,
-                data={
-                    "mr_iid": mr_iid,
-                    "reason": f"{len(critical_vulns)} critical vulnerabilities found",
-                    "vulnerabilities": critical_vulns,
-                },
-                source_agent=self.name,
-                project_id=project_id,
-                correlation_id=event.correlation_id,
+            side_effects.append(self._block_merge_and_publish(
+                project_id, mr_iid, critical_vulns, critical_count, event.correlation_id,
             ))
 
         if vulnerabilities:
-            await self.publish(Event(
+            side_effects.append(self.publish(Event(
                 type=EventType.VULNERABILITY_FOUND,
                 data={
                     "mr_iid": mr_iid,
-                    "count": len(vulnerabilities),
-                    "critical": len(critical_vulns),
-                    "high": len(high_vulns),
-                    "vulnerabilities": vulnerabilities,
+                    "count": total_count,
+                    "critical": critical_count,
+                    "high": counts.get("high", 0),
+                    "vulnerabilities": preview,
                 },
                 source_agent=self.name,
                 project_id=project_id,
                 correlation_id=event.correlation_id,
-            ))
+            )))
 
         # Publish scan complete
-        await self.publish(Event(
+        side_effects.append(self.publish(Event(
             type=EventType.SECURITY_SCAN_COMPLETE,
             data={
                 "mr_iid": mr_iid,
                 "passed": scan_result.get("passed", True),
                 "overall_risk": scan_result.get("overall_risk", "low"),
-                "vulnerability_count": len(vulnerabilities),
+                "vulnerability_count": total_count,
                 "summary": scan_result.get("summary", ""),
+                "sha": data.get("sha"),
+                # Downstream agents (test intelligence) work off this event;
+                # forward an inline diff so they don't need to refetch it
+                **({"diff": data["diff"], "files": data.get("files", [])} if data.get("diff") else {}),
             },
             source_agent=self.name,
             project_id=project_id,
             correlation_id=event.correlation_id,
-        ))
+        )))
 
         # Generate compliance report
-        await self.publish(Event(
+        side_effects.append(self.publish(Event(
             type=EventType.COMPLIANCE_REPORT_GENERATED,
             data={
                 "mr_iid": mr_iid,
-                "scan_result": scan_result,
+                "scan_result": {
+                    "overall_risk": scan_result.get("overall_risk", "unknown"),
+                    "passed": scan_result.get("passed", False),
+                    "summary": scan_result.get("summary", ""),
+                    "counts_by_severity": counts,
+                    "vulnerabilities": preview,
+                },
             },
             source_agent=self.name,
             project_id=project_id,
             correlation_id=event.correlation_id,
+        )))
+
+        await self.gather_logged(*side_effects)
+
+    async def _block_merge_and_publish(
+        self,
+        project_id: int | None,
+        mr_iid: int,
+        critical_vulns: list[dict],
+        critical_count: int,
+        correlation_id: str | None,
+    ) -> None:
+        await self._block_merge(project_id, mr_iid, critical_vulns, critical_count)
+        await self.publish(Event(
+            type=EventType.MERGE_BLOCKED,
+            data={
+                "mr_iid": mr_iid,
+                "reason": f"{critical_count} critical vulnerabilities found",
+            },
+            source_agent=self.name,
+            project_id=project_id,
+            correlation_id=correlation_id,
         ))
 
     async def _block_merge(
-        self, project_id: int | None, mr_iid: int, critical_vulns: list[dict]
+        self,
+        project_id: int | None,
+        mr_iid: int,
+        critical_vulns: list[dict],
+        critical_count: int | None = None,
     ) -> None:
         """Block merge by posting an unresolved discussion thread on GitLab MR."""
         if not project_id:
             return
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
-
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    return
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    return
-
-                # Post a blocking comment (unresolved discussion blocks merge in GitLab
-                # when "All discussions must be resolved" is enabled)
-                block_msg = (
-                    "## MERGE BLOCKED - Critical Security Vulnerabilities\n\n"
-                    "This merge request has been blocked due to critical security issues "
-                    "that must be resolved before merging.\n\n"
-                )
-                for v in critical_vulns[:5]:
-                    block_msg += (
-                        f"- **{v.get('type', 'Unknown')}** in `{v.get('file', '?')}`: "
-                        f"{v.get('description', 'No description')}\n"
-                        f"  Recommendation: {v.get('recommendation', 'N/A')}\n\n"
-                    )
-                block_msg += (
-                    "\nResolve these issues and push a new commit to re-trigger the security scan. "
-                    "Resolve this discussion thread once all issues are fixed."
+            conn = await connection_cache.get(project_id, "gitlab")
+            if not conn or not conn.gl_project_id:
+                return
+
+            gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
+            gl_project_id = conn.gl_project_id
+
+            # Post a blocking comment (unresolved discussion blocks merge in GitLab
+            # when "All discussions must be resolved" is enabled)
+            parts = [
+                "## MERGE BLOCKED - Critical Security Vulnerabilities\n\n"
+                "This merge request has been blocked due to critical security issues "
+                "that must be resolved before merging.\n\n"
+            ]
+            for v in critical_vulns[:5]:
+                parts.append(
+                    f"- **{v.get('type', 'Unknown')}** in `{v.get('file', '?')}`: "
+                    f"{v.get('description', 'No description')}\n"
+                    f"  Recommendation: {v.get('recommendation', 'N/A')}\n\n"
                 )
+            parts.append(
+                "\nResolve these issues and push a new commit to re-trigger the security scan. "
+                "Resolve this discussion thread once all issues are fixed."
+            )
+            block_msg = "".join(parts)
+
+            # Use the discussions API to create an unresolved thread
+            await gitlab.create_mr_discussion(gl_project_id, mr_iid, block_msg)
+            logger.info(f"Created blocking discussion on MR {mr_iid}")
 
-                # Use the discussions API to create an unresolved thread
-                import httpx
-                async with httpx.AsyncClient() as client:
-                    resp = await client.post(
-                        f"{gitlab.api_url}/projects/{gl_project_id}/merge_requests/{mr_iid}/discussions",
-                        headers=gitlab._headers,
-                        json={"body": block_msg},
-                        timeout=15.0,
-                    )
-                    resp.raise_for_status()
-                    logger.info(f"Created blocking discussion on MR {mr_iid}")
-
-                # Also notify Slack about the block
-                await self.publish(Event(
-                    type=EventType.SLACK_NOTIFICATION,
-                    data={
-                        "message": (
-                            f"*MERGE BLOCKED* - MR !{mr_iid}\n"
-                            f"{len(critical_vulns)} critical vulnerabilities found. "
-                            f"Merge is blocked until resolved."
-                        ),
-                    },
-                    source_agent=self.name,
-                    project_id=project_id,
-                ))
+            # Also notify Slack about the block
+            await self.publish(Event(
+                type=EventType.SLACK_NOTIFICATION,
+                data={
+                    "message": (
+                        f"*MERGE BLOCKED* - MR !{mr_iid}\n"
+                        f"{critical_count or len(critical_vulns)} critical vulnerabilities found. "
+                        f"Merge is blocked until resolved."
+                    ),
+                },
+                source_agent=self.name,
+                project_id=project_id,
+            ))
         except Exception:
             logger.exception(f"Failed to block merge for MR {mr_iid}")
 
     async def _get_diff(
         self, project_id: int | None, mr_iid: int | None, data: dict
-    ) -> tuple[str, list[str]]:
-        # If diff is already in event data
+    ) -> tuple[list[tuple[str, str]], list[str]]:
+        """Return ([(path, diff)], file_paths) for the MR."""
+        # If diff is already in event data it arrives as one combined blob; split it
+        # per file so skipping lockfiles/assets can't drop the source changes with them
         if data.get("diff"):
-            return data["diff"], data.get("files", [])
+            files = data.get("files", [])
+            return agent_ai_service.split_combined_diff(data["diff"], files), files
 
         if not project_id or not mr_iid:
-            return "", []
+            return [], []
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
-
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    return "", []
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    return "", []
-
-                diffs = await gitlab.get_mr_diff(gl_project_id, mr_iid)
-                file_paths = [d.get("new_path", "") for d in diffs]
-                diff_text = "\n".join(d.get("diff", "") for d in diffs)
-                return diff_text, file_paths
+            file_diffs = await mr_diff_cache.get_file_diffs(project_id, mr_iid, data.get("sha"))
         except Exception:
             logger.exception("Failed to fetch diff from GitLab")
-            return "", []
+            return [], []
+        return [(path, diff) for path, diff in file_diffs if diff], [path for path, _ in file_diffs]
 
     async def _post_findings(
         self, project_id: int | None, mr_iid: int, scan_result: dict
     ) -> None:
-        if not project_id:
+        vulns = scan_result.get("vulnerabilities", [])
+        # A clean, passing scan needs no MR comment - skip the GitLab round-trip
+        if not project_id or (not vulns and scan_result.get("passed")):
             return
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
-
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    return
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    return
-
-                vulns = scan_result.get("vulnerabilities", [])
-                comment = "## Security Scan Results\n\n"
-                comment += f"**Overall Risk:** {scan_result.get('overall_risk', 'unknown')}\n"
-                comment += f"**Status:** {'PASSED' if scan_result.get('passed') else 'FAILED'}\n\n"
-
-                if vulns:
-                    comment += "### Vulnerabilities Found\n\n"
-                    for v in vulns[:10]:
-                        emoji = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}.get(
-                            v.get("severity", ""), "⚪"
-                        )
-                        comment += (
-                            f"- {emoji} **{v.get('severity', '').upper()}** - "
-                            f"{v.get('type', 'Unknown')}: {v.get('description', '')}\n"
-                            f"  - File: `{v.get('file', '?')}`\n"
-                            f"  - Fix: {v.get('recommendation', 'N/A')}\n\n"
-                        )
-                else:
-                    comment += "No vulnerabilities detected.\n"
-
-                # GitLab API limit is ~1MB, truncate to safe limit
-                MAX_COMMENT_LEN = 60000
-                if len(comment) > MAX_COMMENT_LEN:
-                    comment = comment[:MAX_COMMENT_LEN] + "\n\n*...truncated*"
-
-                await gitlab.add_mr_comment(gl_project_id, mr_iid, comment)
+            conn = await connection_cache.get(project_id, "gitlab")
+            if not conn or not conn.gl_project_id:
+                return
+
+            gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
+            gl_project_id = conn.gl_project_id
+
+            builder = CommentBuilder()
+            builder.append("## Security Scan Results\n\n")
+            builder.append(f"**Overall Risk:** {scan_result.get('overall_risk', 'unknown')}\n")
+            builder.append(f"**Status:** {'PASSED' if scan_result.get('passed') else 'FAILED'}\n\n")
+
+            if vulns:
+                builder.append("### Vulnerabilities Found\n\n")
+                for v in vulns[:10]:
+                    severity = v.get("severity", "")
+                    if not builder.append(_VULN_LINE_TEMPLATE.format_map({
+                        "emoji": _SEVERITY_EMOJI.get(severity, _DEFAULT_EMOJI),
+                        "sev": severity.upper(),
+                        "type": v.get("type", "Unknown"),
+                        "desc": v.get("description", ""),
+                        "file": v.get("file", "?"),
+                        "fix": v.get("recommendation", "N/A"),
+                    })):
+                        break
+            else:
+                builder.append("No vulnerabilities detected.\n")
+            comment = builder.build()
+
+            await gitlab.add_mr_comment(gl_project_id, mr_iid, comment)
         except Exception:
             logger.exception("Failed to post security findings")
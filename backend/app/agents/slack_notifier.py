@@ -1,15 +1,31 @@
 """Slack Notifier — listens for SLACK_NOTIFICATION events and posts to Slack."""
 
+import asyncio
 import logging
+from typing import Optional
 
+from app.adapters.slack_adapter import get_slack_adapter
 from app.agents.base import BaseAgent
-from app.agents.event_bus import Event, EventType
+from app.agents.event_bus import Event, EventBus, EventType
+from app.config import get_settings
+from app.services import connection_cache
 
 logger = logging.getLogger(__name__)
 
+# Messages for the same project/channel arriving within this window go out as one post
+_BATCH_WINDOW_SECONDS = 0.5
+
 
 class SlackNotifierAgent(BaseAgent):
 
+    def __init__(self, bus: Optional[EventBus] = None):
+        super().__init__(bus)
+        # (project_id, channel) -> (bot token, queued messages)
+        self._pending: dict[tuple[Optional[int], str], tuple[str, list[str]]] = {}
+        self._flushers: dict[tuple[Optional[int], str], asyncio.Task] = {}
+        # Every flush task, including ones already past their window and posting
+        self._flush_tasks: set[asyncio.Task] = set()
+
     @property
     def name(self) -> str:
         return "slack_notifier"
@@ -28,69 +44,74 @@ class SlackNotifierAgent(BaseAgent):
         channel = data.get("channel")
         project_id = event.project_id
 
-        logger.warning(f"[SlackNotifier] Received event project_id={project_id} message_len={len(message)}")
-
         if not message:
-            logger.warning("[SlackNotifier] Empty message, skipping")
+            logger.debug("[SlackNotifier] Empty message for project %s, skipping", project_id)
             return
 
+        logger.debug("[SlackNotifier] Received event project_id=%s message_len=%d", project_id, len(message))
+
         # Look up Slack connection for this project
         conn = await self._get_slack_connection(project_id)
         if not conn:
-            logger.warning(f"[SlackNotifier] No Slack connection for project {project_id}")
+            logger.info("[SlackNotifier] No Slack connection for project %s", project_id)
             return
 
-        try:
-            from app.adapters.slack_adapter import SlackAdapter
-            from app.config import get_settings
-
-            settings = get_settings()
-            token = conn.api_token
-            slack = SlackAdapter(token)
-
-            target_channel = channel or (conn.config or {}).get("default_channel") or settings.slack_default_channel or "general"
+        settings = get_settings()
+        target_channel = channel or (conn.config or {}).get("default_channel") or settings.slack_default_channel or "general"
+        self._enqueue(project_id, target_channel, conn.api_token, message)
+
+    def _enqueue(
+        self, project_id: int | None, channel: str, token: str, message: str
+    ) -> None:
+        key = (project_id, channel)
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = (token, [message])
+        else:
+            pending[1].append(message)
+        if key not in self._flushers:
+            task = asyncio.create_task(self._flush_after_window(key))
+            self._flushers[key] = task
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def stop(self) -> None:
+        """Post every queued batch now instead of losing it when the loop shuts down."""
+        # Flushers still in _flushers are sleeping out their window; the rest are posting
+        for task in self._flushers.values():
+            task.cancel()
+        self._flushers.clear()
+        await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await asyncio.gather(*(self._flush(key) for key in list(self._pending)))
+
+    async def _flush_after_window(self, key: tuple[Optional[int], str]) -> None:
+        await asyncio.sleep(_BATCH_WINDOW_SECONDS)
+        self._flushers.pop(key, None)
+        await self._flush(key)
+
+    async def _flush(self, key: tuple[Optional[int], str]) -> None:
+        token, messages = self._pending.pop(key, ("", []))
+        if not messages:
+            return
 
-            logger.warning(f"[SlackNotifier] Sending to #{target_channel}")
+        project_id, target_channel = key
+        try:
+            slack = get_slack_adapter(token)
+            logger.debug("[SlackNotifier] Sending %d message(s) to #%s", len(messages), target_channel)
             await slack.post_message(
                 channel=target_channel,
-                text=message,
+                text="\n\n".join(messages),
             )
-            logger.warning(f"[SlackNotifier] Message sent to #{target_channel} for project {project_id}")
+            logger.debug("[SlackNotifier] Message sent to #%s for project %s", target_channel, project_id)
         except Exception:
-            logger.exception(f"[SlackNotifier] Failed to send for project {project_id}")
+            logger.exception("[SlackNotifier] Failed to send for project %s", project_id)
 
     async def _get_slack_connection(self, project_id: int | None):
-        if not project_id:
-            # Try to find any enabled Slack connection
-            try:
-                from sqlalchemy import select
-                from app.models.service_connection import ServiceConnection
-
-                async with self.get_db_session() as db:
-                    result = await db.execute(
-                        select(ServiceConnection).where(
-                            ServiceConnection.service_type == "slack",
-                            ServiceConnection.enabled == True,
-                        )
-                    )
-                    return result.scalars().first()
-            except Exception:
-                logger.exception("Failed to look up Slack connection")
-            return None
-
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "slack",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                return result.scalars().first()
+            if not project_id:
+                # Fall back to any enabled Slack connection
+                return await connection_cache.get_any("slack")
+            return await connection_cache.get(project_id, "slack")
         except Exception:
             logger.exception("Failed to look up Slack connection")
         return None
@@ -1,13 +1,31 @@
 """Agent 5: Test Intelligence - Generates test suggestions, coverage reports."""
 
 import logging
+import time
 
-from app.agents.base import BaseAgent
+from app.adapters.gitlab_adapter import get_gitlab_adapter
+from app.agents.base import BaseAgent, CommentBuilder
 from app.agents.event_bus import Event, EventType
-from app.services import agent_ai_service
+from app.services import agent_ai_service, connection_cache, mr_diff_cache
 
 logger = logging.getLogger(__name__)
 
+# (project_id, mr_iid, head sha) -> expires_at; repeat runs for one commit are no-ops
+_DEDUPE_TTL_SECONDS = 5 * 60
+# Only this much of the diff makes it into the AI prompt
+_DIFF_PROMPT_CHARS = 8000
+_recent_runs: dict[tuple, float] = {}
+
+
+def _seen_recently(key: tuple) -> bool:
+    now = time.monotonic()
+    for k in [k for k, expires_at in _recent_runs.items() if expires_at <= now]:
+        _recent_runs.pop(k, None)
+    if key in _recent_runs:
+        return True
+    _recent_runs[key] = now + _DEDUPE_TTL_SECONDS
+    return False
+
 
 class TestIntelligenceAgent(BaseAgent):
 
@@ -24,17 +42,26 @@ class TestIntelligenceAgent(BaseAgent):
 
     @property
     def subscribed_events(self) -> list[EventType]:
-        return [
-            EventType.PR_OPENED,
-            EventType.CODE_PUSHED,
-            EventType.SECURITY_SCAN_COMPLETE,
-        ]
+        # The security agent scans every PR_OPENED/CODE_PUSHED and publishes
+        # SECURITY_SCAN_COMPLETE with the same correlation_id, so that's the
+        # only trigger needed - one AI pass per commit instead of up to three
+        return [EventType.SECURITY_SCAN_COMPLETE]
 
     async def handle_event(self, event: Event) -> None:
         data = event.data
         mr_iid = data.get("mr_iid")
         project_id = event.project_id
 
+        if data.get("passed") is False:
+            # The merge is blocked anyway; the fix push gets a fresh scan
+            logger.info(f"Security scan failed for MR {mr_iid}, skipping test analysis")
+            return
+
+        sha = data.get("sha")
+        if sha and _seen_recently((project_id, mr_iid, sha)):
+            logger.info(f"Test analysis for MR {mr_iid} at {sha[:8]} already done, skipping")
+            return
+
         logger.info(f"Test analysis for MR {mr_iid} in project {project_id}")
 
         # Get diff content
@@ -51,12 +78,15 @@ class TestIntelligenceAgent(BaseAgent):
         integration_tests = suggestions.get("integration_tests", [])
         edge_cases = suggestions.get("edge_cases", [])
 
+        # GitLab post and bus publishes are independent - run them concurrently
+        side_effects = []
+
         # Post suggestions as MR comment
         if mr_iid:
-            await self._post_suggestions(project_id, mr_iid, suggestions)
+            side_effects.append(self._post_suggestions(project_id, mr_iid, suggestions))
 
         # Publish test suggestions
-        await self.publish(Event(
+        side_effects.append(self.publish(Event(
             type=EventType.TEST_SUGGESTIONS_GENERATED,
             data={
                 "mr_iid": mr_iid,
@@ -68,10 +98,10 @@ class TestIntelligenceAgent(BaseAgent):
             source_agent=self.name,
             project_id=project_id,
             correlation_id=event.correlation_id,
-        ))
+        )))
 
         # Create test report
-        await self.publish(Event(
+        side_effects.append(self.publish(Event(
             type=EventType.TEST_REPORT_CREATED,
             data={
                 "mr_iid": mr_iid,
@@ -82,7 +112,9 @@ class TestIntelligenceAgent(BaseAgent):
             source_agent=self.name,
             project_id=project_id,
             correlation_id=event.correlation_id,
-        ))
+        )))
+
+        await self.gather_logged(*side_effects)
 
     async def _get_diff(
         self, project_id: int | None, mr_iid: int | None, data: dict
@@ -94,31 +126,9 @@ class TestIntelligenceAgent(BaseAgent):
             return "", []
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
-
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    return "", []
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    return "", []
-
-                diffs = await gitlab.get_mr_diff(gl_project_id, mr_iid)
-                file_paths = [d.get("new_path", "") for d in diffs]
-                diff_text = "\n".join(d.get("diff", "") for d in diffs)
-                return diff_text, file_paths
+            return await mr_diff_cache.get_diff(
+                project_id, mr_iid, data.get("sha"), max_chars=_DIFF_PROMPT_CHARS
+            )
         except Exception:
             logger.exception("Failed to fetch diff from GitLab")
             return "", []
@@ -126,67 +136,51 @@ class TestIntelligenceAgent(BaseAgent):
     async def _post_suggestions(
         self, project_id: int | None, mr_iid: int, suggestions: dict
     ) -> None:
-        if not project_id:
+        unit_tests = suggestions.get("unit_tests", [])
+        integration_tests = suggestions.get("integration_tests", [])
+        edge_cases = suggestions.get("edge_cases", [])
+        gaps = suggestions.get("coverage_gaps", [])
+        # Nothing to suggest - don't post an empty heading to the MR
+        if not project_id or not (unit_tests or integration_tests or edge_cases or gaps):
             return
 
         try:
-            from sqlalchemy import select
-            from app.models.service_connection import ServiceConnection
-            from app.adapters.gitlab_adapter import GitLabAdapter
-
-            async with self.get_db_session() as db:
-                result = await db.execute(
-                    select(ServiceConnection).where(
-                        ServiceConnection.project_id == project_id,
-                        ServiceConnection.service_type == "gitlab",
-                        ServiceConnection.enabled == True,
-                    )
-                )
-                conn = result.scalars().first()
-                if not conn:
-                    return
-
-                gitlab = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-                gl_project_id = (conn.config or {}).get("project_id")
-                if not gl_project_id:
-                    return
-
-                comment = "## Test Suggestions\n\n"
-
-                unit_tests = suggestions.get("unit_tests", [])
-                if unit_tests:
-                    comment += "### Unit Tests\n"
-                    for t in unit_tests[:5]:
-                        comment += f"- **{t.get('name', 'Test')}**: {t.get('description', '')}\n"
-                        if t.get("code_hint"):
-                            comment += f"  ```\n  {t['code_hint']}\n  ```\n"
-                    comment += "\n"
-
-                integration_tests = suggestions.get("integration_tests", [])
-                if integration_tests:
-                    comment += "### Integration Tests\n"
-                    for t in integration_tests[:3]:
-                        comment += f"- **{t.get('name', 'Test')}**: {t.get('description', '')}\n"
-                    comment += "\n"
-
-                edge_cases = suggestions.get("edge_cases", [])
-                if edge_cases:
-                    comment += "### Edge Cases to Consider\n"
-                    for ec in edge_cases[:5]:
-                        comment += f"- {ec}\n"
-                    comment += "\n"
-
-                gaps = suggestions.get("coverage_gaps", [])
-                if gaps:
-                    comment += "### Coverage Gaps\n"
-                    for g in gaps[:5]:
-                        comment += f"- {g}\n"
-
-                # GitLab API limit is ~1MB, truncate to safe limit
-                MAX_COMMENT_LEN = 60000
-                if len(comment) > MAX_COMMENT_LEN:
-                    comment = comment[:MAX_COMMENT_LEN] + "\n\n*...truncated*"
-
-                await gitlab.add_mr_comment(gl_project_id, mr_iid, comment)
+            conn = await connection_cache.get(project_id, "gitlab")
+            if not conn or not conn.gl_project_id:
+                return
+
+            gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
+            gl_project_id = conn.gl_project_id
+
+            builder = CommentBuilder()
+            builder.append("## Test Suggestions\n\n")
+
+            if unit_tests:
+                builder.append("### Unit Tests\n")
+                for t in unit_tests[:5]:
+                    builder.append(f"- **{t.get('name', 'Test')}**: {t.get('description', '')}\n")
+                    if t.get("code_hint"):
+                        builder.append(f"  ```\n  {t['code_hint']}\n  ```\n")
+                builder.append("\n")
+
+            if integration_tests:
+                builder.append("### Integration Tests\n")
+                for t in integration_tests[:3]:
+                    builder.append(f"- **{t.get('name', 'Test')}**: {t.get('description', '')}\n")
+                builder.append("\n")
+
+            if edge_cases:
+                builder.append("### Edge Cases to Consider\n")
+                for ec in edge_cases[:5]:
+                    builder.append(f"- {ec}\n")
+                builder.append("\n")
+
+            if gaps:
+                builder.append("### Coverage Gaps\n")
+                for g in gaps[:5]:
+                    builder.append(f"- {g}\n")
+            comment = builder.build()
+
+            await gitlab.add_mr_comment(gl_project_id, mr_iid, comment)
         except Exception:
             logger.exception("Failed to post test suggestions")
@@ -1,17 +1,35 @@
 """Agent management API endpoints."""
 
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy import select, delete
+import asyncio
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic_core import to_json
+from sqlalchemy import bindparam, select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters import (
+    DatadogAdapter,
+    FigmaAdapter,
+    SentryAdapter,
+    discard_gitlab_adapter,
+    discard_slack_adapter,
+    get_gitlab_adapter,
+    get_slack_adapter,
+)
+from app.agents.event_bus import Event
 from app.api.auth import get_current_user
+from app.api.responses import json_response
 from app.db.database import get_db
 from app.models.user import User
 from app.models.agent_state import AgentConfig
 from app.models.agent_event import AgentEvent
 from app.models.service_connection import ServiceConnection
+from app.services import connection_cache, status_cache
 
 router = APIRouter()
 
@@ -30,63 +48,165 @@ def set_event_bus(bus):
     _event_bus = bus
 
 
+# service_type -> adapter for a stored connection, used by test_connection
+_ADAPTER_FACTORIES: dict[str, Callable[[ServiceConnection], Any]] = {
+    "gitlab": lambda c: get_gitlab_adapter(c.base_url or "https://gitlab.com", c.api_token),
+    "figma": lambda c: FigmaAdapter(c.api_token),
+    "slack": lambda c: get_slack_adapter(c.api_token),
+    "datadog": lambda c: DatadogAdapter(c.api_token, (c.config or {}).get("app_key", "")),
+    "sentry": lambda c: SentryAdapter(c.api_token),
+}
+
+# Agents whose trigger event is another agent's output (test_intelligence reacts to
+# SECURITY_SCAN_COMPLETE): publishing it would hand every other subscriber a scan
+# result that never happened, so manual triggers run these agents directly
+_DIRECT_TRIGGER_AGENTS = frozenset({"test_intelligence"})
+_direct_triggers: set[asyncio.Task] = set()
+
+# Connection tests call third-party APIs: cap how long and how many at once
+_TEST_CONN_TIMEOUT_SECONDS = 5.0
+_TEST_CONN_SEMAPHORES = {svc: asyncio.Semaphore(8) for svc in _ADAPTER_FACTORIES}
+
+
+def _dialect_insert(db: AsyncSession):
+    """INSERT construct with ON CONFLICT support for the session's database."""
+    return pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+
 # --- Request/Response schemas ---
 
+# Request bodies are read-only once validated; string fields are stripped by pydantic-core
+_REQUEST_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
+
 class AgentConfigUpdate(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     enabled: Optional[bool] = None
     config: Optional[dict] = None
 
 
 class AgentTrigger(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     event_data: dict = {}
 
 
 class ServiceConnectionCreate(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     service_type: str
     base_url: Optional[str] = None
     api_token: str
     config: Optional[dict] = None
 
+    @field_validator("config")
+    @classmethod
+    def _strip_config_values(cls, config: Optional[dict]) -> Optional[dict]:
+        # str_strip_whitespace doesn't reach into the dict; reuse it when already clean
+        if not config or not any(isinstance(v, str) and v != v.strip() for v in config.values()):
+            return config
+        return {k: v.strip() if isinstance(v, str) else v for k, v in config.items()}
+
+
+# Config values under these keys are secrets and get masked like tokens
+_MASKED_CONFIG_KEYS = frozenset({"app_key", "api_key", "secret"})
+
+
+def _mask_token(token: str | None) -> str | None:
+    if not token:
+        return None
+    if len(token) <= 8:
+        return "****" + token[-2:]
+    return token[:4] + "****" + token[-4:]
+
+
+def _mask_config(config: dict | None) -> dict | None:
+    if not config:
+        return config
+    return {
+        k: _mask_token(v) if isinstance(v, str) and k in _MASKED_CONFIG_KEYS else v
+        for k, v in config.items()
+    }
+
 
 # --- Global fleet status ---
 
+_STATUS_TTL_SECONDS = 2.0
+_EVENTS_TTL_SECONDS = 5.0
+
+
+def _events_cache_prefix(project_id: int) -> str:
+    return f"agents:events:{project_id}:"
+
+
+# Fleet status before the agent system is up; encoded once
+_EMPTY_STATUS_BODY = to_json({"agents": [], "bus_running": False})
+
+
 @router.get("/agents/status")
 async def fleet_status(user: User = Depends(get_current_user)):
     if not _registry:
-        return {"agents": [], "bus_running": False}
-    return {
+        return Response(content=_EMPTY_STATUS_BODY, media_type="application/json")
+    # Polled by every open dashboard; serve a briefly cached, pre-encoded body
+    cached = status_cache.get("agents:status")
+    if cached is not None:
+        return cached
+    return status_cache.put("agents:status", {
         "agents": _registry.status(),
         "bus_running": _event_bus.is_running if _event_bus else False,
-    }
+    }, _STATUS_TTL_SECONDS)
 
 
 # --- Per-project agent configs ---
 
+# project_config for agents with no AgentConfig row; only ever encoded, never mutated
+_DEFAULT_PROJECT_CONFIG = {
+    "enabled": True,
+    "config": {},
+    "last_run_at": None,
+    "total_events_processed": 0,
+}
+
+
 @router.get("/projects/{project_id}/agents")
 async def list_project_agents(
     project_id: int,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    if not _registry:
+        return {"agents": []}
+
+    # Read-only: project just the columns we return, no ORM instances
     result = await db.execute(
-        select(AgentConfig).where(AgentConfig.project_id == project_id)
+        select(
+            AgentConfig.agent_name,
+            AgentConfig.enabled,
+            AgentConfig.config,
+            AgentConfig.last_run_at,
+            AgentConfig.total_events_processed,
+        ).where(AgentConfig.project_id == project_id)
     )
-    configs = {c.agent_name: c for c in result.scalars().all()}
+    # project_config dicts are built straight from the row tuples
+    configs = {
+        agent_name: {
+            "enabled": enabled,
+            "config": config,
+            "last_run_at": last_run_at,
+            "total_events_processed": total_events_processed,
+        }
+        for agent_name, enabled, config, last_run_at, total_events_processed in result
+    }
 
     agents = []
-    if _registry:
-        for agent in _registry.all_agents():
-            cfg = configs.get(agent.name)
-            agent_data = agent.to_dict()
-            agent_data["project_config"] = {
-                "enabled": cfg.enabled if cfg else True,
-                "config": cfg.config if cfg else {},
-                "last_run_at": cfg.last_run_at.isoformat() if cfg and cfg.last_run_at else None,
-                "total_events_processed": cfg.total_events_processed if cfg else 0,
-            }
-            agents.append(agent_data)
+    for agent in _registry.all_agents():
+        # Attach to the dict to_dict() already built; unconfigured agents share the defaults
+        agent_data = agent.to_dict()
+        agent_data["project_config"] = configs.get(agent.name, _DEFAULT_PROJECT_CONFIG)
+        agents.append(agent_data)
 
-    return {"agents": agents}
+    return json_response({"agents": agents})
 
 
 @router.put("/projects/{project_id}/agents/{agent_name}")
@@ -97,28 +217,29 @@ async def update_agent_config(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(AgentConfig).where(
-            AgentConfig.project_id == project_id,
-            AgentConfig.agent_name == agent_name,
-        )
+    # Single-statement upsert; on conflict only the fields that were sent change
+    insert = _dialect_insert(db)
+    stmt = insert(AgentConfig).values(
+        project_id=project_id,
+        agent_name=agent_name,
+        enabled=data.enabled if data.enabled is not None else True,
+        config=data.config or {},
     )
-    config = result.scalars().first()
-
-    if not config:
-        config = AgentConfig(
-            project_id=project_id,
-            agent_name=agent_name,
-            enabled=data.enabled if data.enabled is not None else True,
-            config=data.config or {},
+    updates = {}
+    if data.enabled is not None:
+        updates["enabled"] = stmt.excluded.enabled
+    if data.config is not None:
+        updates["config"] = stmt.excluded.config
+    if updates:
+        # set_ bypasses the column's ORM onupdate, so stamp it here
+        updates["updated_at"] = datetime.utcnow()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["project_id", "agent_name"], set_=updates
         )
-        db.add(config)
     else:
-        if data.enabled is not None:
-            config.enabled = data.enabled
-        if data.config is not None:
-            config.config = data.config
+        stmt = stmt.on_conflict_do_nothing(index_elements=["project_id", "agent_name"])
 
+    await db.execute(stmt)
     await db.commit()
     return {"status": "updated", "agent_name": agent_name}
 
@@ -137,18 +258,27 @@ async def trigger_agent(
     if not agent:
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
 
-    from app.agents.event_bus import Event, EventType
-
     if agent.subscribed_events:
-        # Merge user-provided data with rich demo defaults for manual triggers
-        event_data = {**_get_demo_data(agent_name), **data.event_data}
+        # Merge user-provided data with rich demo defaults for manual triggers;
+        # Event.data must be a plain dict (it's encoded and handed to agents), so
+        # the read-only demo mapping is copied once rather than shared
+        demo = _get_demo_data(agent_name)
+        event_data = {**demo, **data.event_data} if data.event_data else dict(demo)
         event = Event(
             type=agent.subscribed_events[0],
             data=event_data,
             source_agent="manual_trigger",
             project_id=project_id,
         )
-        await _event_bus.publish(event)
+        if agent_name in _DIRECT_TRIGGER_AGENTS:
+            task = asyncio.create_task(agent._on_event(event))
+            _direct_triggers.add(task)
+            task.add_done_callback(_direct_triggers.discard)
+        else:
+            await _event_bus.publish(event)
+        # Make the trigger visible on the next poll rather than after the TTL
+        status_cache.invalidate_prefix(_events_cache_prefix(project_id))
+        status_cache.invalidate_prefix("agents:status")
 
     return {"status": "triggered", "agent_name": agent_name}
 
@@ -197,91 +327,101 @@ diff --git a/src/api/tasks.py b/src/api/tasks.py
 """
 
 
-def _get_demo_data(agent_name: str) -> dict:
-    """Return realistic demo data for manual agent triggers."""
-    demos = {
-        "product_intelligence": {
-            "key": "SHIP-142",
-            "title": "Implement real-time WebSocket notifications for task updates",
-            "description": (
-                "As a project manager, I need real-time notifications when tasks "
-                "are updated so the team stays synchronized. Requirements:\n"
-                "- WebSocket connection per authenticated user\n"
-                "- Notify on task status changes, assignments, comments\n"
-                "- Support @mentions with push notifications\n"
-                "- Graceful reconnection with exponential backoff\n"
-                "- Message queue for offline users"
-            ),
-            "status": "To Do",
-            "priority": "High",
-            "reporter": "Roger Koranteng",
-            "project_key": "SHIP",
-        },
-        "design_sync": {
+# Realistic demo data for manual agent triggers, built once at import
+_DEMO_DATA: dict[str, dict[str, Any]] = {
+    "product_intelligence": {
+        "key": "SHIP-142",
+        "title": "Implement real-time WebSocket notifications for task updates",
+        "description": (
+            "As a project manager, I need real-time notifications when tasks "
+            "are updated so the team stays synchronized. Requirements:\n"
+            "- WebSocket connection per authenticated user\n"
+            "- Notify on task status changes, assignments, comments\n"
+            "- Support @mentions with push notifications\n"
+            "- Graceful reconnection with exponential backoff\n"
+            "- Message queue for offline users"
+        ),
+        "status": "To Do",
+        "priority": "High",
+        "reporter": "Roger Koranteng",
+        "project_key": "SHIP",
+    },
+    "design_sync": {
+        "file_key": "figma-abc123xyz",
+        "file_name": "ShipIt Design System v3",
+        "demo_design_data": {
             "file_key": "figma-abc123xyz",
-            "file_name": "ShipIt Design System v3",
-            "demo_design_data": {
-                "file_key": "figma-abc123xyz",
-                "name": "ShipIt Design System v3",
-                "last_modified": "2025-02-15T14:30:00Z",
-                "components": {
-                    "TaskCard": {"description": "Kanban task card with priority badge, assignee avatar, and due date", "width": 320, "height": 180},
-                    "AgentStatusBadge": {"description": "Pill-shaped status indicator with animated pulse for running agents", "width": 120, "height": 32},
-                    "NotificationPanel": {"description": "Slide-out panel with grouped notification items and mark-all-read", "width": 380, "height": 600},
-                    "SprintBoard": {"description": "Horizontal scrolling board with column headers showing task counts", "width": 1200, "height": 800},
-                },
+            "name": "ShipIt Design System v3",
+            "last_modified": "2025-02-15T14:30:00Z",
+            "components": {
+                "TaskCard": {"description": "Kanban task card with priority badge, assignee avatar, and due date", "width": 320, "height": 180},
+                "AgentStatusBadge": {"description": "Pill-shaped status indicator with animated pulse for running agents", "width": 120, "height": 32},
+                "NotificationPanel": {"description": "Slide-out panel with grouped notification items and mark-all-read", "width": 380, "height": 600},
+                "SprintBoard": {"description": "Horizontal scrolling board with column headers showing task counts", "width": 1200, "height": 800},
             },
         },
-        "code_orchestration": {
-            "issue_id": "42",
-            "title": "Implement WebSocket notification system",
-            "description": "Real-time push notifications via WebSocket for task updates and agent events.",
-            "analysis": {
-                "summary": "websocket-notification-system",
-                "stories": [
-                    {"title": "WebSocket connection manager", "description": "Handle auth, reconnection, heartbeat"},
-                    {"title": "Event broadcaster", "description": "Fan-out task events to subscribed clients"},
-                ],
-            },
-        },
-        "security_compliance": {
-            "mr_iid": 87,
-            "title": "feat: Add user authentication and task deletion endpoint",
-            "source_branch": "feature/SHIP-142-auth-system",
-            "target_branch": "main",
-            "diff": _SAMPLE_DIFF,
-            "files": ["src/auth/login.py", "src/api/tasks.py"],
-        },
-        "test_intelligence": {
-            "mr_iid": 87,
-            "title": "feat: Add user authentication and task deletion endpoint",
-            "source_branch": "feature/SHIP-142-auth-system",
-            "target_branch": "main",
-            "diff": _SAMPLE_DIFF,
-            "files": ["src/auth/login.py", "src/api/tasks.py"],
-        },
-        "review_coordination": {
-            "mr_iid": 87,
-            "title": "feat: Add user authentication and task deletion endpoint",
-            "source_branch": "feature/SHIP-142-auth-system",
-            "target_branch": "main",
-            "diff": _SAMPLE_DIFF,
-            "files": ["src/auth/login.py", "src/api/tasks.py"],
-        },
-        "deployment_orchestrator": {
-            "ref": "main",
-            "mr_iid": 87,
-            "title": "feat: Add user authentication and task deletion endpoint",
-            "commit_messages": [
-                "feat: implement session-based auth with token management",
-                "feat: add task deletion endpoint with soft-delete",
-                "fix: handle expired sessions gracefully",
-                "chore: add migration for sessions table",
+    },
+    "code_orchestration": {
+        "issue_id": "42",
+        "title": "Implement WebSocket notification system",
+        "description": "Real-time push notifications via WebSocket for task updates and agent events.",
+        "analysis": {
+            "summary": "websocket-notification-system",
+            "stories": [
+                {"title": "WebSocket connection manager", "description": "Handle auth, reconnection, heartbeat"},
+                {"title": "Event broadcaster", "description": "Fan-out task events to subscribed clients"},
             ],
         },
-        "analytics_insights": {},
-    }
-    return demos.get(agent_name, {})
+    },
+    "security_compliance": {
+        "mr_iid": 87,
+        "title": "feat: Add user authentication and task deletion endpoint",
+        "source_branch": "feature/SHIP-142-auth-system",
+        "target_branch": "main",
+        "diff": _SAMPLE_DIFF,
+        "files": ["src/auth/login.py", "src/api/tasks.py"],
+    },
+    "test_intelligence": {
+        "mr_iid": 87,
+        "title": "feat: Add user authentication and task deletion endpoint",
+        "source_branch": "feature/SHIP-142-auth-system",
+        "target_branch": "main",
+        "diff": _SAMPLE_DIFF,
+        "files": ["src/auth/login.py", "src/api/tasks.py"],
+    },
+    "review_coordination": {
+        "mr_iid": 87,
+        "title": "feat: Add user authentication and task deletion endpoint",
+        "source_branch": "feature/SHIP-142-auth-system",
+        "target_branch": "main",
+        "diff": _SAMPLE_DIFF,
+        "files": ["src/auth/login.py", "src/api/tasks.py"],
+    },
+    "deployment_orchestrator": {
+        "ref": "main",
+        "mr_iid": 87,
+        "title": "feat: Add user authentication and task deletion endpoint",
+        "commit_messages": [
+            "feat: implement session-based auth with token management",
+            "feat: add task deletion endpoint with soft-delete",
+            "fix: handle expired sessions gracefully",
+            "chore: add migration for sessions table",
+        ],
+    },
+    "analytics_insights": {},
+}
+
+
+# Wrapped once at import; triggers share these read-only views
+_DEMO_DATA_VIEWS: dict[str, Mapping[str, Any]] = {
+    name: MappingProxyType(data) for name, data in _DEMO_DATA.items()
+}
+_NO_DEMO_DATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _get_demo_data(agent_name: str) -> Mapping[str, Any]:
+    """Return the (shared, read-only) demo data for an agent's manual trigger."""
+    return _DEMO_DATA_VIEWS.get(agent_name, _NO_DEMO_DATA)
 
 
 # --- Event log ---
@@ -295,25 +435,47 @@ async def list_agent_events(
     if not _event_bus:
         return {"events": []}
 
+    cache_key = f"{_events_cache_prefix(project_id)}{limit}"
+    cached = status_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     events = _event_bus.get_history(limit=limit, project_id=project_id)
-    return {
-        "events": [
-            {
-                "event_id": e.event_id,
-                "type": e.type.value,
-                "source_agent": e.source_agent,
-                "project_id": e.project_id,
-                "data": e.data,
-                "timestamp": e.timestamp.isoformat(),
-                "correlation_id": e.correlation_id,
-            }
-            for e in events
-        ]
-    }
+    return status_cache.put(cache_key, {
+        "events": [e.as_dict for e in events]
+    }, _EVENTS_TTL_SECONDS)
 
 
 # --- Service connections ---
 
+# Service types whose adapters are pooled per credentials
+_POOLED_SERVICE_TYPES = frozenset({"gitlab", "slack"})
+
+
+async def _previous_credentials(
+    db: AsyncSession, project_id: int, service_type: str
+) -> Optional[tuple[Optional[str], Optional[str]]]:
+    """Read a pooled connection's current (base_url, api_token) before it changes."""
+    if service_type not in _POOLED_SERVICE_TYPES:
+        return None
+    conn = await db.scalar(
+        _CONNECTION_BY_TYPE, {"project_id": project_id, "service_type": service_type}
+    )
+    return (conn.base_url, conn.api_token) if conn else None
+
+
+async def _discard_pooled_adapter(
+    service_type: str, credentials: Optional[tuple[Optional[str], Optional[str]]]
+) -> None:
+    """Close the pooled adapter built from a connection's old credentials."""
+    if credentials is None:
+        return
+    base_url, api_token = credentials
+    if service_type == "gitlab":
+        await discard_gitlab_adapter(base_url or "https://gitlab.com", api_token)
+    elif service_type == "slack":
+        await discard_slack_adapter(api_token)
+
 @router.post("/projects/{project_id}/connections")
 async def create_connection(
     project_id: int,
@@ -321,36 +483,30 @@ async def create_connection(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(ServiceConnection).where(
-            ServiceConnection.project_id == project_id,
-            ServiceConnection.service_type == data.service_type,
-        )
+    previous = await _previous_credentials(db, project_id, data.service_type)
+    insert = _dialect_insert(db)
+    stmt = insert(ServiceConnection).values(
+        project_id=project_id,
+        service_type=data.service_type,
+        base_url=data.base_url,
+        api_token=data.api_token,
+        config=data.config or {},
+        enabled=True,
     )
-    existing = result.scalars().first()
-
-    # Strip whitespace from tokens and config values
-    clean_token = data.api_token.strip()
-    clean_config = {}
-    for k, v in (data.config or {}).items():
-        clean_config[k] = v.strip() if isinstance(v, str) else v
-
-    if existing:
-        existing.base_url = data.base_url
-        existing.api_token = clean_token
-        existing.config = clean_config
-        existing.enabled = True
-    else:
-        conn = ServiceConnection(
-            project_id=project_id,
-            service_type=data.service_type,
-            base_url=data.base_url,
-            api_token=clean_token,
-            config=clean_config,
-        )
-        db.add(conn)
-
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id", "service_type"],
+        set_={
+            "base_url": stmt.excluded.base_url,
+            "api_token": stmt.excluded.api_token,
+            "config": stmt.excluded.config,
+            "enabled": True,
+        },
+    )
+    await db.execute(stmt)
     await db.commit()
+    connection_cache.invalidate(project_id, data.service_type)
+    if previous is not None and previous != (data.base_url, data.api_token):
+        await _discard_pooled_adapter(data.service_type, previous)
     return {"status": "connected", "service_type": data.service_type}
 
 
@@ -364,25 +520,7 @@ async def list_connections(
         select(ServiceConnection).where(ServiceConnection.project_id == project_id)
     )
     connections = result.scalars().all()
-    def mask_token(token: str | None) -> str | None:
-        if not token:
-            return None
-        if len(token) <= 8:
-            return "****" + token[-2:]
-        return token[:4] + "****" + token[-4:]
-
-    def mask_config(config: dict | None) -> dict | None:
-        if not config:
-            return config
-        masked = {}
-        for k, v in config.items():
-            if isinstance(v, str) and k in ("app_key", "api_key", "secret"):
-                masked[k] = mask_token(v)
-            else:
-                masked[k] = v
-        return masked
-
-    return {
+    return json_response({
         "connections": [
             {
                 "id": c.id,
@@ -390,14 +528,21 @@ async def list_connections(
                 "base_url": c.base_url,
                 "enabled": c.enabled,
                 "config": c.config,
-                "masked_config": mask_config(c.config),
-                "last_sync_at": c.last_sync_at.isoformat() if c.last_sync_at else None,
+                "masked_config": _mask_config(c.config),
+                "last_sync_at": c.last_sync_at,
                 "has_token": bool(c.api_token),
-                "masked_token": mask_token(c.api_token),
+                "masked_token": _mask_token(c.api_token),
             }
             for c in connections
         ]
-    }
+    })
+
+
+# Built once; the compiled SQL is reused from the engine's cache with new params
+_CONNECTION_BY_TYPE = select(ServiceConnection).where(
+    ServiceConnection.project_id == bindparam("project_id"),
+    ServiceConnection.service_type == bindparam("service_type"),
+).limit(1)
 
 
 @router.get("/projects/{project_id}/connections/{service_type}/reveal")
@@ -407,13 +552,9 @@ async def reveal_connection(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(ServiceConnection).where(
-            ServiceConnection.project_id == project_id,
-            ServiceConnection.service_type == service_type,
-        )
+    conn = await db.scalar(
+        _CONNECTION_BY_TYPE, {"project_id": project_id, "service_type": service_type}
     )
-    conn = result.scalars().first()
     if not conn:
         raise HTTPException(status_code=404, detail="Connection not found")
 
@@ -432,6 +573,7 @@ async def delete_connection(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    previous = await _previous_credentials(db, project_id, service_type)
     await db.execute(
         delete(ServiceConnection).where(
             ServiceConnection.project_id == project_id,
@@ -439,6 +581,8 @@ async def delete_connection(
         )
     )
     await db.commit()
+    connection_cache.invalidate(project_id, service_type)
+    await _discard_pooled_adapter(service_type, previous)
     return {"status": "disconnected", "service_type": service_type}
 
 
@@ -449,45 +593,23 @@ async def test_connection(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(ServiceConnection).where(
-            ServiceConnection.project_id == project_id,
-            ServiceConnection.service_type == service_type,
-        )
+    conn = await db.scalar(
+        _CONNECTION_BY_TYPE, {"project_id": project_id, "service_type": service_type}
     )
-    conn = result.scalars().first()
     if not conn:
         raise HTTPException(status_code=404, detail="Connection not found")
 
+    factory = _ADAPTER_FACTORIES.get(service_type)
+    if not factory:
+        raise HTTPException(status_code=400, detail=f"Unknown service type: {service_type}")
+
     try:
-        if service_type == "gitlab":
-            from app.adapters.gitlab_adapter import GitLabAdapter
-            adapter = GitLabAdapter(conn.base_url or "https://gitlab.com", conn.api_token)
-            await adapter.test_connection()
-        elif service_type == "figma":
-            from app.adapters.figma_adapter import FigmaAdapter
-            adapter = FigmaAdapter(conn.api_token)
-            await adapter.test_connection()
-        elif service_type == "slack":
-            from app.adapters.slack_adapter import SlackAdapter
-            adapter = SlackAdapter(conn.api_token)
-            await adapter.test_connection()
-        elif service_type == "datadog":
-            from app.adapters.monitoring_adapter import DatadogAdapter
-            adapter = DatadogAdapter(
-                conn.api_token,
-                (conn.config or {}).get("app_key", ""),
+        async with _TEST_CONN_SEMAPHORES[service_type]:
+            await asyncio.wait_for(
+                factory(conn).test_connection(), timeout=_TEST_CONN_TIMEOUT_SECONDS
             )
-            await adapter.test_connection()
-        elif service_type == "sentry":
-            from app.adapters.monitoring_adapter import SentryAdapter
-            adapter = SentryAdapter(conn.api_token)
-            await adapter.test_connection()
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown service type: {service_type}")
-
         return {"status": "ok", "service_type": service_type}
-    except HTTPException:
-        raise
+    except asyncio.TimeoutError:
+        return {"status": "error", "service_type": service_type, "error": "timeout"}
     except Exception as e:
         return {"status": "error", "service_type": service_type, "error": str(e)}
@@ -1,17 +1,20 @@
 """AI endpoints — breakdown, meeting notes, blockers, digest."""
 
+import asyncio
+import json
+import time
+from collections import OrderedDict
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import select, func
+from sqlalchemy import Row, case, insert, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from app.db.database import get_db
+from app.db.database import async_session, get_db
 from app.models import User, Task, ProjectMember, Sprint
-from app.api.auth import get_current_user
-from app.api.projects import verify_membership
-from app.services import ai_service, activity_service
+from app.api.auth import get_project_member
+from app.services import ai_service, ai_result_cache, activity_service, member_cache
 
 router = APIRouter()
 
@@ -54,44 +57,122 @@ class MeetingNotesApply(BaseModel):
 # --- Helpers ---
 
 async def _get_member_names(db: AsyncSession, project_id: int) -> list[str]:
+    return [name for _, name in await member_cache.get(db, project_id)]
+
+
+# Just the fields the prompts use, read as rows (no ORM objects, no description)
+_TASK_SNAPSHOT_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.status,
+    Task.priority,
+    User.name.label("assignee"),
+    Task.due_date,
+    Task.estimated_hours,
+)
+
+
+_SNAPSHOT_TTL_SECONDS = 300.0
+_SNAPSHOT_MAX_ENTRIES = 256
+
+# (project_id, include_done) -> (expires_at, board version, tasks); shared between
+# requests, so callers must treat the returned list as read-only
+_snapshots: OrderedDict[tuple[int, bool], tuple[float, tuple, list[dict]]] = OrderedDict()
+
+
+async def _get_all_tasks(
+    db: AsyncSession, project_id: int, include_done: bool = False
+) -> list[dict]:
+    """Task snapshot for AI prompts; done tasks only when the prompt needs history.
+
+    Reused while the board version is unchanged. Every task write bumps
+    updated_at and deletes change the count, so (count, max(updated_at))
+    moves whenever the snapshot would.
+    """
+    version = tuple((await db.execute(
+        select(func.count(), func.max(Task.updated_at)).where(Task.project_id == project_id)
+    )).one())
+    key = (project_id, include_done)
+    entry = _snapshots.get(key)
+    if entry and entry[0] > time.monotonic() and entry[1] == version:
+        _snapshots.move_to_end(key)
+        return entry[2]
+
+    tasks = await _load_tasks(db, project_id, include_done)
+    _snapshots[key] = (time.monotonic() + _SNAPSHOT_TTL_SECONDS, version, tasks)
+    _snapshots.move_to_end(key)
+    while len(_snapshots) > _SNAPSHOT_MAX_ENTRIES:
+        _snapshots.popitem(last=False)
+    return tasks
+
+
+async def _load_tasks(db: AsyncSession, project_id: int, include_done: bool) -> list[dict]:
     stmt = (
-        select(ProjectMember)
-        .options(joinedload(ProjectMember.user))
-        .where(ProjectMember.project_id == project_id)
+        select(*_TASK_SNAPSHOT_COLUMNS)
+        .outerjoin(User, User.id == Task.assignee_id)
+        .where(Task.project_id == project_id)
+        .order_by(Task.created_at)
     )
+    if not include_done:
+        stmt = stmt.where(Task.status != "done")
     result = await db.execute(stmt)
-    members = result.scalars().unique().all()
-    return [m.user.name for m in members]
+    # Plain dicts: these are json.dumps'd into prompts
+    return [dict(row) for row in result.mappings()]
 
 
-async def _get_all_tasks(db: AsyncSession, project_id: int) -> list[dict]:
-    stmt = (
-        select(Task)
-        .options(joinedload(Task.assignee))
-        .where(Task.project_id == project_id)
-        .order_by(Task.created_at)
+async def _user_ids_by_name(db: AsyncSession, names: set[Optional[str]]) -> dict[str, int]:
+    """Resolve display names to user ids in one query; unknown names are omitted."""
+    names = {name for name in names if name}
+    if not names:
+        return {}
+    result = await db.execute(
+        select(User.name, User.id).where(User.name.in_(names)).order_by(User.id)
     )
-    result = await db.execute(stmt)
-    tasks = result.scalars().unique().all()
-    return [
-        {
-            "id": t.id,
-            "title": t.title,
-            "status": t.status,
-            "priority": t.priority,
-            "assignee": t.assignee.name if t.assignee else None,
-            "due_date": t.due_date,
-            "estimated_hours": t.estimated_hours,
-        }
-        for t in tasks
-    ]
+    user_ids: dict[str, int] = {}
+    for name, user_id in result:
+        user_ids.setdefault(name, user_id)
+    return user_ids
+
+
+async def _get_tasks_by_id(db: AsyncSession, project_id: int, task_ids: list) -> dict[int, Task]:
+    """Load the given tasks of a project in one query, keyed by id; others are omitted."""
+    task_ids = [task_id for task_id in task_ids if task_id]
+    if not task_ids:
+        return {}
+    result = await db.execute(
+        select(Task).where(Task.id.in_(task_ids), Task.project_id == project_id)
+    )
+    return {t.id: t for t in result.scalars()}
+
+
+async def _bulk_set(db: AsyncSession, project_id: int, column, values: dict[int, object]) -> set[int]:
+    """Set ``column`` per task id with one UPDATE ... CASE; returns the ids updated."""
+    if not values:
+        return set()
+    result = await db.execute(
+        update(Task)
+        .where(Task.id.in_(values), Task.project_id == project_id)
+        .values({column: case(values, value=Task.id)})
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    )
+    return set(result.scalars())
+
 
+async def _read_all(stmt) -> list[Row]:
+    """Run a read-only statement on its own short-lived session.
 
-async def _find_user_by_name(db: AsyncSession, name: str) -> User | None:
-    if not name:
-        return None
-    result = await db.execute(select(User).where(User.name == name))
-    return result.scalar_one_or_none()
+    An AsyncSession runs one statement at a time, so independent reads that
+    should overlap (via asyncio.gather) each need their own connection.
+    """
+    async with async_session() as session:
+        return list((await session.execute(stmt)).all())
+
+
+async def _on_own_session(func, *args, **kwargs):
+    """Call ``func(session, *args, **kwargs)`` with a short-lived session of its own."""
+    async with async_session() as session:
+        return await func(session, *args, **kwargs)
 
 
 # --- Endpoints ---
@@ -100,14 +181,15 @@ async def _find_user_by_name(db: AsyncSession, name: str) -> User | None:
 async def ai_breakdown(
     project_id: int,
     data: BreakdownRequest,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
     members = await _get_member_names(db, project_id)
 
     try:
-        result = await ai_service.break_down_task(data.description, members)
+        result = await ai_result_cache.get_or_compute(
+            "breakdown", project_id, ai_service.break_down_task, data.description, members
+        )
     except Exception:
         raise HTTPException(status_code=502, detail="AI service unavailable")
 
@@ -118,11 +200,9 @@ async def ai_breakdown(
 async def ai_breakdown_apply(
     project_id: int,
     data: BreakdownApply,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
-
     # Create parent task
     parent = Task(
         project_id=project_id,
@@ -134,25 +214,30 @@ async def ai_breakdown_apply(
     await db.flush()
 
     # Create subtasks
-    for i, st in enumerate(data.subtasks):
-        assignee = await _find_user_by_name(db, st.get("suggested_assignee", ""))
-        subtask = Task(
-            project_id=project_id,
-            parent_task_id=parent.id,
-            title=st.get("title", "Untitled"),
-            description=st.get("description", ""),
-            priority=st.get("priority", "medium"),
-            estimated_hours=st.get("estimated_hours"),
-            assignee_id=assignee.id if assignee else None,
-            ai_generated=True,
-            position=i,
-        )
-        db.add(subtask)
-
-    await activity_service.log(
-        db, project_id, user.id, "ai_breakdown", task_id=parent.id,
-        details={"title": data.title, "subtask_count": len(data.subtasks)},
+    user_ids = await _user_ids_by_name(
+        db, {st.get("suggested_assignee", "") for st in data.subtasks}
     )
+    # One batched INSERT; subtask ids aren't needed, so no RETURNING or ORM objects
+    if data.subtasks:
+        await db.execute(insert(Task), [
+            {
+                "project_id": project_id,
+                "parent_task_id": parent.id,
+                "title": st.get("title", "Untitled"),
+                "description": st.get("description", ""),
+                "priority": st.get("priority", "medium"),
+                "estimated_hours": st.get("estimated_hours"),
+                "assignee_id": user_ids.get(st.get("suggested_assignee", "")),
+                "ai_generated": True,
+                "position": i,
+            }
+            for i, st in enumerate(data.subtasks)
+        ])
+
+    await activity_service.log_many(db, project_id, user.id, [(
+        "ai_breakdown", parent.id,
+        {"title": data.title, "subtask_count": len(data.subtasks)},
+    )])
     await db.commit()
 
     return {"ok": True, "task_id": parent.id, "subtask_count": len(data.subtasks)}
@@ -162,15 +247,17 @@ async def ai_breakdown_apply(
 async def ai_extract_tasks(
     project_id: int,
     data: ExtractTasksRequest,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
     members = await _get_member_names(db, project_id)
-    existing_tasks = await _get_all_tasks(db, project_id)
+    existing_tasks = await _get_all_tasks(db, project_id, include_done=True)
 
     try:
-        result = await ai_service.extract_tasks_from_text(data.text, members, existing_tasks)
+        result = await ai_result_cache.get_or_compute(
+            "extract-tasks", project_id, ai_service.extract_tasks_from_text,
+            data.text, members, existing_tasks,
+        )
     except Exception:
         raise HTTPException(status_code=502, detail="AI service unavailable")
 
@@ -181,15 +268,17 @@ async def ai_extract_tasks(
 async def ai_meeting_notes(
     project_id: int,
     data: MeetingNotesRequest,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
     members = await _get_member_names(db, project_id)
-    existing_tasks = await _get_all_tasks(db, project_id)
+    existing_tasks = await _get_all_tasks(db, project_id, include_done=True)
 
     try:
-        result = await ai_service.extract_meeting_notes(data.notes, members, existing_tasks)
+        result = await ai_result_cache.get_or_compute(
+            "meeting-notes", project_id, ai_service.extract_meeting_notes,
+            data.notes, members, existing_tasks,
+        )
     except Exception:
         raise HTTPException(status_code=502, detail="AI service unavailable")
 
@@ -200,64 +289,72 @@ async def ai_meeting_notes(
 async def ai_meeting_notes_apply(
     project_id: int,
     data: MeetingNotesApply,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
-
-    # Create new tasks
-    created = []
-    for i, t in enumerate(data.tasks):
-        assignee = await _find_user_by_name(db, t.get("suggested_assignee", ""))
-        task = Task(
-            project_id=project_id,
-            title=t.get("title", "Untitled"),
-            description=t.get("description", ""),
-            priority=t.get("priority", "medium"),
-            estimated_hours=t.get("estimated_hours"),
-            assignee_id=assignee.id if assignee else None,
-            ai_generated=True,
-            position=i,
-        )
-        db.add(task)
-        await db.flush()
-        created.append(task.id)
+    user_ids = await _user_ids_by_name(
+        db,
+        {t.get("suggested_assignee", "") for t in data.tasks}
+        | {upd.get("new_assignee") for upd in data.updates},
+    )
 
-        await activity_service.log(
-            db, project_id, user.id, "created", task_id=task.id,
-            details={"title": task.title, "source": "meeting_notes"},
-        )
+    # Create new tasks in one batched INSERT ... RETURNING
+    rows = [
+        {
+            "project_id": project_id,
+            "title": t.get("title", "Untitled"),
+            "description": t.get("description", ""),
+            "priority": t.get("priority", "medium"),
+            "estimated_hours": t.get("estimated_hours"),
+            "assignee_id": user_ids.get(t.get("suggested_assignee", "")),
+            "ai_generated": True,
+            "position": i,
+        }
+        for i, t in enumerate(data.tasks)
+    ]
+    created: list[int] = []
+    if rows:
+        created = list(await db.scalars(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True), rows
+        ))
+    activities = [
+        ("created", task_id, {"title": row["title"], "source": "meeting_notes"})
+        for task_id, row in zip(created, rows)
+    ]
 
-    # Apply updates to existing tasks
+    # Apply updates to existing tasks: one UPDATE ... CASE per column touched
+    tasks = await _get_tasks_by_id(db, project_id, [upd.get("task_id") for upd in data.updates])
+    new_status: dict[int, str] = {}
+    new_priority: dict[int, str] = {}
+    new_assignee: dict[int, int] = {}
     updated = 0
     for upd in data.updates:
-        task_id = upd.get("task_id")
-        if not task_id:
-            continue
-        task = await db.get(Task, task_id)
-        if not task or task.project_id != project_id:
+        task = tasks.get(upd.get("task_id"))
+        if not task:
             continue
 
-        old_status = task.status
-        new_status = upd.get("new_status")
-        new_priority = upd.get("new_priority")
+        old_status = new_status.get(task.id, task.status)
+        status = upd.get("new_status")
+        priority = upd.get("new_priority")
         new_assignee_name = upd.get("new_assignee")
 
-        if new_status and new_status in ("todo", "in_progress", "done", "blocked"):
-            task.status = new_status
-        if new_priority and new_priority in ("low", "medium", "high", "urgent"):
-            task.priority = new_priority
-        if new_assignee_name:
-            assignee = await _find_user_by_name(db, new_assignee_name)
-            if assignee:
-                task.assignee_id = assignee.id
+        if status and status in ("todo", "in_progress", "done", "blocked"):
+            new_status[task.id] = status
+        if priority and priority in ("low", "medium", "high", "urgent"):
+            new_priority[task.id] = priority
+        if new_assignee_name and new_assignee_name in user_ids:
+            new_assignee[task.id] = user_ids[new_assignee_name]
 
         updated += 1
-        await activity_service.log(
-            db, project_id, user.id, "status_changed", task_id=task.id,
-            details={"from": old_status, "to": task.status, "source": "meeting_notes", "reason": upd.get("reason", "")},
-        )
-
+        activities.append((
+            "status_changed", task.id,
+            {"from": old_status, "to": new_status.get(task.id, old_status), "source": "meeting_notes", "reason": upd.get("reason", "")},
+        ))
+
+    await _bulk_set(db, project_id, Task.status, new_status)
+    await _bulk_set(db, project_id, Task.priority, new_priority)
+    await _bulk_set(db, project_id, Task.assignee_id, new_assignee)
+    await activity_service.log_many(db, project_id, user.id, activities)
     await db.commit()
     return {"ok": True, "created_count": len(created), "task_ids": created, "updated_count": updated}
 
@@ -265,82 +362,112 @@ async def ai_meeting_notes_apply(
 @router.post("/{project_id}/ai/blockers")
 async def ai_blockers(
     project_id: int,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
     tasks = await _get_all_tasks(db, project_id)
 
     if not tasks:
         return {"blockers": []}
 
     try:
-        result = await ai_service.detect_blockers(tasks)
+        result = await ai_result_cache.get_or_compute(
+            "blockers", project_id, ai_service.detect_blockers, tasks
+        )
     except Exception:
         raise HTTPException(status_code=502, detail="AI service unavailable")
 
     return result
 
 
-@router.post("/{project_id}/ai/digest")
-async def ai_digest(
-    project_id: int,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-):
-    await verify_membership(project_id, user.id, db)
-
-    tasks = await _get_all_tasks(db, project_id)
-    recent = await activity_service.get_recent(db, project_id, limit=50)
+async def _digest_inputs(db: AsyncSession, project_id: int) -> tuple[list[dict], list[dict]]:
+    tasks, recent = await asyncio.gather(
+        _get_all_tasks(db, project_id, include_done=True),
+        _on_own_session(activity_service.get_recent, project_id, limit=50),
+    )
     activities_data = [
         {
-            "action": a.action,
-            "user": a.user.name if a.user else "Unknown",
-            "details": a.details,
-            "created_at": a.created_at.isoformat(),
+            "action": a["action"],
+            "user": a["user_name"],
+            "details": a["details"],
+            "created_at": a["created_at"].isoformat(),
         }
         for a in recent
     ]
+    return activities_data, tasks
+
+
+@router.post("/{project_id}/ai/digest")
+async def ai_digest(
+    project_id: int,
+    user: User = Depends(get_project_member),
+    db: AsyncSession = Depends(get_db),
+):
+    activities_data, tasks = await _digest_inputs(db, project_id)
 
     try:
-        result = await ai_service.generate_digest(activities_data, tasks)
+        result = await ai_result_cache.get_or_compute(
+            "digest", project_id, ai_service.generate_digest, activities_data, tasks
+        )
     except Exception:
         raise HTTPException(status_code=502, detail="AI service unavailable")
 
     return result
 
 
+@router.post("/{project_id}/ai/digest/stream")
+async def ai_digest_stream(
+    project_id: int,
+    user: User = Depends(get_project_member),
+    db: AsyncSession = Depends(get_db),
+):
+    """Server-sent events of the digest JSON text as the model produces it."""
+    # Everything the prompt needs is read up front; the stream never touches the session
+    activities_data, tasks = await _digest_inputs(db, project_id)
+
+    async def events():
+        try:
+            async for chunk in ai_service.generate_digest_stream(activities_data, tasks):
+                yield f"data: {json.dumps(chunk)}\n\n"
+        except Exception:
+            yield 'event: error\ndata: "AI service unavailable"\n\n'
+            return
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post("/{project_id}/ai/sprint-plan")
 async def ai_sprint_plan(
     project_id: int,
     data: SprintPlanRequest,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
-    tasks = await _get_all_tasks(db, project_id)
-    members = await _get_member_names(db, project_id)
-
-    # Build member data with workload
-    member_data = []
-    for name in members:
-        member_user = (await db.execute(select(User).where(User.name == name))).scalar_one_or_none()
-        workload = 0
-        if member_user:
-            workload = (await db.execute(
-                select(func.count()).where(
-                    Task.project_id == project_id,
-                    Task.assignee_id == member_user.id,
-                    Task.status != "done",
-                )
-            )).scalar() or 0
-        member_data.append({"name": name, "current_tasks": workload})
-
     # Only plan for non-done tasks
-    open_tasks = [t for t in tasks if t["status"] != "done"]
+    open_tasks = await _get_all_tasks(db, project_id)
+    members = await member_cache.get(db, project_id)
+
+    # Open task count per member, in one grouped query
+    open_counts = dict((await db.execute(
+        select(Task.assignee_id, func.count())
+        .where(
+            Task.project_id == project_id,
+            Task.assignee_id.in_([user_id for user_id, _ in members]),
+            Task.status != "done",
+        )
+        .group_by(Task.assignee_id)
+    )).all())
+    member_data = [
+        {"name": name, "current_tasks": open_counts.get(user_id, 0)}
+        for user_id, name in members
+    ]
 
     try:
-        result = await ai_service.plan_sprint(open_tasks, member_data, data.capacity_hours)
+        result = await ai_result_cache.get_or_compute(
+            "sprint-plan", project_id, ai_service.plan_sprint,
+            open_tasks, member_data, data.capacity_hours,
+        )
     except Exception:
         raise HTTPException(status_code=502, detail="AI service unavailable")
 
@@ -351,12 +478,10 @@ async def ai_sprint_plan(
 async def ai_sprint_plan_apply(
     project_id: int,
     data: SprintPlanApply,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
     """Apply sprint plan — creates a real Sprint record, assigns tasks to it."""
-    await verify_membership(project_id, user.id, db)
-
     # Create Sprint record
     sprint = Sprint(
         project_id=project_id,
@@ -369,24 +494,32 @@ async def ai_sprint_plan_apply(
     db.add(sprint)
     await db.flush()
 
-    # Assign tasks to sprint and set assignees
-    applied = 0
-    for item in data.assignments:
-        task = await db.get(Task, item.get("task_id"))
-        if not task or task.project_id != project_id:
-            continue
-        task.sprint_id = sprint.id
-        assignee_name = item.get("assignee")
-        if assignee_name:
-            assignee = await _find_user_by_name(db, assignee_name)
-            if assignee:
-                task.assignee_id = assignee.id
-        applied += 1
-
-    await activity_service.log(
-        db, project_id, user.id, "sprint_created",
-        details={"sprint_name": sprint.name, "tasks_assigned": applied, "source": "ai_planner"},
+    # Assign tasks to sprint and set assignees, one UPDATE each
+    task_ids = [item.get("task_id") for item in data.assignments if item.get("task_id")]
+    in_sprint: set[int] = set()
+    if task_ids:
+        result = await db.execute(
+            update(Task)
+            .where(Task.id.in_(task_ids), Task.project_id == project_id)
+            .values(sprint_id=sprint.id)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        in_sprint = set(result.scalars())
+    user_ids = await _user_ids_by_name(
+        db, {item.get("assignee") for item in data.assignments}
     )
+    await _bulk_set(db, project_id, Task.assignee_id, {
+        item["task_id"]: user_ids[item["assignee"]]
+        for item in data.assignments
+        if item.get("task_id") in in_sprint and item.get("assignee") in user_ids
+    })
+    applied = sum(1 for item in data.assignments if item.get("task_id") in in_sprint)
+
+    await activity_service.log_many(db, project_id, user.id, [(
+        "sprint_created", None,
+        {"sprint_name": sprint.name, "tasks_assigned": applied, "source": "ai_planner"},
+    )])
     await db.commit()
     return {"ok": True, "sprint_id": sprint.id, "applied": applied}
 
@@ -394,17 +527,18 @@ async def ai_sprint_plan_apply(
 @router.post("/{project_id}/ai/priority-score")
 async def ai_priority_score(
     project_id: int,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
     tasks = await _get_all_tasks(db, project_id)
 
     if not tasks:
         return {"recommendations": []}
 
     try:
-        result = await ai_service.score_priorities(tasks)
+        result = await ai_result_cache.get_or_compute(
+            "priority-score", project_id, ai_service.score_priorities, tasks
+        )
     except Exception:
         raise HTTPException(status_code=502, detail="AI service unavailable")
 
@@ -415,21 +549,18 @@ async def ai_priority_score(
 async def ai_priority_score_apply(
     project_id: int,
     data: PriorityApply,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
     """Apply AI-suggested priority changes."""
-    await verify_membership(project_id, user.id, db)
-
-    applied = 0
-    for item in data.updates:
-        task = await db.get(Task, item.get("task_id"))
-        if not task or task.project_id != project_id:
-            continue
-        new_priority = item.get("priority")
-        if new_priority in ("low", "medium", "high", "urgent"):
-            task.priority = new_priority
-            applied += 1
+    valid = [
+        item for item in data.updates
+        if item.get("task_id") and item.get("priority") in ("low", "medium", "high", "urgent")
+    ]
+    updated_ids = await _bulk_set(
+        db, project_id, Task.priority, {item["task_id"]: item["priority"] for item in valid}
+    )
+    applied = sum(1 for item in valid if item["task_id"] in updated_ids)
 
     await db.commit()
     return {"ok": True, "applied": applied}
@@ -438,26 +569,28 @@ async def ai_priority_score_apply(
 @router.post("/{project_id}/ai/standup")
 async def ai_standup(
     project_id: int,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
-
-    tasks = await _get_all_tasks(db, project_id)
-    members = await _get_member_names(db, project_id)
-    recent = await activity_service.get_recent(db, project_id, limit=50)
+    tasks, recent, members = await asyncio.gather(
+        _on_own_session(_get_all_tasks, project_id, include_done=True),
+        _on_own_session(activity_service.get_recent, project_id, limit=50),
+        _get_member_names(db, project_id),
+    )
     activities_data = [
         {
-            "action": a.action,
-            "user": a.user.name if a.user else "Unknown",
-            "details": a.details,
-            "created_at": a.created_at.isoformat(),
+            "action": a["action"],
+            "user": a["user_name"],
+            "details": a["details"],
+            "created_at": a["created_at"].isoformat(),
         }
         for a in recent
     ]
 
     try:
-        result = await ai_service.generate_standup(activities_data, tasks, members)
+        result = await ai_result_cache.get_or_compute(
+            "standup", project_id, ai_service.generate_standup, activities_data, tasks, members
+        )
     except Exception:
         raise HTTPException(status_code=502, detail="AI service unavailable")
 
@@ -467,70 +600,63 @@ async def ai_standup(
 @router.get("/{project_id}/ai/analytics")
 async def ai_analytics(
     project_id: int,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
     """Team analytics — task distribution, workload, velocity."""
-    await verify_membership(project_id, user.id, db)
-
-    # Task counts by status
-    status_counts = {}
-    for status in ("todo", "in_progress", "done", "blocked"):
-        count = (await db.execute(
-            select(func.count()).where(
-                Task.project_id == project_id,
-                Task.parent_task_id.is_(None),
-                Task.status == status,
-            )
-        )).scalar() or 0
-        status_counts[status] = count
-
-    # Priority distribution
-    priority_counts = {}
-    for priority in ("low", "medium", "high", "urgent"):
-        count = (await db.execute(
-            select(func.count()).where(
-                Task.project_id == project_id,
-                Task.parent_task_id.is_(None),
-                Task.priority == priority,
+    # Both grouped queries are independent reads; run them on their own connections
+    counts_rows, workload_rows = await asyncio.gather(
+        _read_all(
+            select(Task.status, Task.priority, func.count())
+            .where(Task.project_id == project_id, Task.parent_task_id.is_(None))
+            .group_by(Task.status, Task.priority)
+        ),
+        _read_all(
+            select(
+                Task.assignee_id,
+                Task.status,
+                func.count(),
+                func.coalesce(func.sum(Task.estimated_hours), 0),
             )
-        )).scalar() or 0
-        priority_counts[priority] = count
-
-    # Workload per member
-    members = await _get_member_names(db, project_id)
-    workload = []
-    for name in members:
-        member_user = (await db.execute(select(User).where(User.name == name))).scalar_one_or_none()
-        if not member_user:
-            continue
-        assigned = (await db.execute(
-            select(func.count()).where(
+            .where(
                 Task.project_id == project_id,
-                Task.assignee_id == member_user.id,
-                Task.status != "done",
+                Task.assignee_id.in_(
+                    select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)
+                ),
             )
-        )).scalar() or 0
-        completed = (await db.execute(
-            select(func.count()).where(
-                Task.project_id == project_id,
-                Task.assignee_id == member_user.id,
-                Task.status == "done",
-            )
-        )).scalar() or 0
-        total_hours = (await db.execute(
-            select(func.coalesce(func.sum(Task.estimated_hours), 0)).where(
-                Task.project_id == project_id,
-                Task.assignee_id == member_user.id,
-                Task.status != "done",
-            )
-        )).scalar() or 0
-        workload.append({
+            .group_by(Task.assignee_id, Task.status)
+        ),
+    )
+    members = await member_cache.get(db, project_id)
+
+    # Task counts by status and priority
+    status_counts = dict.fromkeys(("todo", "in_progress", "done", "blocked"), 0)
+    priority_counts = dict.fromkeys(("low", "medium", "high", "urgent"), 0)
+    for status, priority, count in counts_rows:
+        if status in status_counts:
+            status_counts[status] += count
+        if priority in priority_counts:
+            priority_counts[priority] += count
+
+    # Workload per member: open/done counts and open hours
+    assigned: dict[int, int] = {}
+    completed: dict[int, int] = {}
+    open_hours: dict[int, float] = {}
+    for assignee_id, status, count, hours in workload_rows:
+        if status == "done":
+            completed[assignee_id] = completed.get(assignee_id, 0) + count
+        else:
+            assigned[assignee_id] = assigned.get(assignee_id, 0) + count
+            open_hours[assignee_id] = open_hours.get(assignee_id, 0) + float(hours)
+    workload = [
+        {
             "name": name,
-            "assigned": assigned,
-            "completed": completed,
-            "estimated_hours": round(float(total_hours), 1),
-        })
+            "assigned": assigned.get(user_id, 0),
+            "completed": completed.get(user_id, 0),
+            "estimated_hours": round(float(open_hours.get(user_id, 0)), 1),
+        }
+        for user_id, name in members
+    ]
 
     total = sum(status_counts.values())
     completion_rate = round(status_counts["done"] / total * 100, 1) if total > 0 else 0
@@ -1,12 +1,18 @@
 """Authentication API — username-based auth with distinct usernames."""
 
+import time
+from collections import OrderedDict
+
 from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import BaseModel
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
-from app.models import User
+from app.models import ProjectMember, User
 
 router = APIRouter()
 
@@ -22,18 +28,71 @@ class AuthResponse(BaseModel):
     name: str
 
 
+def _dialect_insert(db: AsyncSession):
+    """INSERT construct with ON CONFLICT support for the session's database."""
+    return pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+
 # --- Dependencies ---
 
+_KNOWN_USER_TTL_SECONDS = 300.0
+_KNOWN_USER_MAX_ENTRIES = 4096
+
+# user id -> (expires_at, name) for users already resolved by get_current_user;
+# users are never renamed or deleted, the TTL just bounds staleness
+_known_users: OrderedDict[int, tuple[float, str]] = OrderedDict()
+
+
 async def get_current_user(
     x_user_id: int = Header(...),
     db: AsyncSession = Depends(get_db),
 ) -> User:
+    entry = _known_users.get(x_user_id)
+    if entry and entry[0] > time.monotonic():
+        _known_users.move_to_end(x_user_id)
+        # Handlers only read id/name, so a transient stand-in saves the lookup
+        return User(id=x_user_id, name=entry[1])
+
     user = await db.get(User, x_user_id)
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
+    _remember(user.id, user.name)
     return user
 
 
+async def get_project_member(
+    project_id: int,
+    x_user_id: int = Header(...),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """get_current_user and the project membership check in a single query."""
+    stmt = (
+        select(User.name, ProjectMember.id)
+        .outerjoin(
+            ProjectMember,
+            (ProjectMember.user_id == User.id) & (ProjectMember.project_id == project_id),
+        )
+        .where(User.id == x_user_id)
+        .limit(1)
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    name, member_id = row
+    if member_id is None:
+        # Same answer verify_membership gives, so non-members can't probe project ids
+        raise HTTPException(status_code=404, detail="Project not found")
+    _remember(x_user_id, name)
+    return User(id=x_user_id, name=name)
+
+
+def _remember(user_id: int, name: str) -> None:
+    _known_users[user_id] = (time.monotonic() + _KNOWN_USER_TTL_SECONDS, name)
+    _known_users.move_to_end(user_id)
+    while len(_known_users) > _KNOWN_USER_MAX_ENTRIES:
+        _known_users.popitem(last=False)
+
+
 # --- Endpoints ---
 
 @router.post("/register", response_model=AuthResponse)
@@ -45,15 +104,16 @@ async def register(req: AuthRequest, db: AsyncSession = Depends(get_db)):
     if len(name) < 2:
         raise HTTPException(status_code=400, detail="Username must be at least 2 characters")
 
-    result = await db.execute(select(User).where(User.name == name))
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=409, detail="Username already taken")
-
+    # Insert optimistically; the unique constraint on name rejects duplicates
     user = User(name=name, email=f"{name.lower().replace(' ', '')}@shipit", password_hash="")
     db.add(user)
-    await db.commit()
-    await db.refresh(user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Username already taken")
 
+    _remember(user.id, user.name)
     return AuthResponse(id=user.id, name=user.name)
 
 
@@ -70,6 +130,7 @@ async def login(req: AuthRequest, db: AsyncSession = Depends(get_db)):
     if not user:
         raise HTTPException(status_code=404, detail="Username not found. Need to sign up first?")
 
+    _remember(user.id, user.name)
     return AuthResponse(id=user.id, name=user.name)
 
 
@@ -80,13 +141,22 @@ async def enter(req: AuthRequest, db: AsyncSession = Depends(get_db)):
     if not name:
         raise HTTPException(status_code=400, detail="Name is required")
 
-    result = await db.execute(select(User).where(User.name == name))
-    user = result.scalar_one_or_none()
-
-    if not user:
-        user = User(name=name, email=f"{name.lower().replace(' ', '')}@shipit", password_hash="")
-        db.add(user)
+    # One round-trip for new and returning users alike; the no-op update makes
+    # RETURNING yield the existing row on conflict
+    insert = _dialect_insert(db)
+    stmt = (
+        insert(User)
+        .values(name=name, email=f"{name.lower().replace(' ', '')}@shipit", password_hash="")
+        .on_conflict_do_update(index_elements=["name"], set_={"name": name})
+        .returning(User.id, User.name)
+    )
+    try:
+        user = (await db.execute(stmt)).one()
         await db.commit()
-        await db.refresh(user)
+    except IntegrityError:
+        # Another name already maps to the same derived email
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Name already taken")
 
+    _remember(user.id, user.name)
     return AuthResponse(id=user.id, name=user.name)
@@ -3,12 +3,10 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from app.db.database import get_db
 from app.models import User, ProjectMember
-from app.api.auth import get_current_user
-from app.api.projects import verify_membership
+from app.api.auth import get_project_member
 from app.services import gamification_service
 
 router = APIRouter()
@@ -17,11 +15,10 @@ router = APIRouter()
 @router.get("/{project_id}/stats")
 async def get_my_stats(
     project_id: int,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
     """Get current user's gamification stats."""
-    await verify_membership(project_id, user.id, db)
     stats = await gamification_service.get_or_create_stats(db, user.id, project_id)
     await db.commit()
     return gamification_service.stats_to_dict(stats, user.name)
@@ -30,11 +27,10 @@ async def get_my_stats(
 @router.get("/{project_id}/stats/badges")
 async def get_my_badges(
     project_id: int,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
     """Get all badges with unlock status for current user."""
-    await verify_membership(project_id, user.id, db)
     stats = await gamification_service.get_or_create_stats(db, user.id, project_id)
     await db.commit()
     unlocked = gamification_service._get_unlocked_ids(stats)
@@ -44,28 +40,28 @@ async def get_my_badges(
 @router.get("/{project_id}/leaderboard")
 async def get_leaderboard(
     project_id: int,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_project_member),
     db: AsyncSession = Depends(get_db),
 ):
     """Team leaderboard — all members ranked by XP."""
-    await verify_membership(project_id, user.id, db)
-
     # Get all members
     stmt = (
-        select(ProjectMember)
-        .options(joinedload(ProjectMember.user))
+        select(ProjectMember.user_id, User.name)
+        .join(User, User.id == ProjectMember.user_id)
         .where(ProjectMember.project_id == project_id)
     )
-    result = await db.execute(stmt)
-    members = result.scalars().unique().all()
-
-    entries = []
-    for m in members:
-        stats = await gamification_service.get_or_create_stats(db, m.user_id, project_id)
-        entries.append(gamification_service.stats_to_dict(stats, m.user.name))
+    members = (await db.execute(stmt)).all()
 
+    stats_by_user = await gamification_service.get_or_create_stats_bulk(
+        db, [user_id for user_id, _ in members], project_id
+    )
     await db.commit()
 
+    entries = [
+        gamification_service.stats_to_dict(stats_by_user[user_id], name)
+        for user_id, name in members
+    ]
+
     # Sort by XP descending
     entries.sort(key=lambda e: e["xp"], reverse=True)
 
@@ -1,19 +1,20 @@
 """Jira integration API — connect, export, import, sync."""
 
+import asyncio
 from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.db.database import get_db
 from app.models import User, Task, JiraConnection, Sprint
 from app.api.auth import get_current_user
-from app.api.projects import verify_membership
+from app.api.projects import require_member
 from app.services.jira_service import JiraService
-from app.services import activity_service
+from app.services import activity_service, jira_connection_cache
 
 router = APIRouter()
 
@@ -29,12 +30,15 @@ class JiraConnectRequest(BaseModel):
 
 # --- Helpers ---
 
-async def _get_connection(db: AsyncSession, project_id: int) -> JiraConnection:
-    result = await db.execute(
-        select(JiraConnection).where(JiraConnection.project_id == project_id)
-    )
-    conn = result.scalar_one_or_none()
-    if not conn:
+async def _require_connection(
+    project_id: int,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> JiraConnection:
+    """Membership check and the project's Jira connection, both served from short-lived caches."""
+    await require_member(project_id, user.id, db)
+    conn = await jira_connection_cache.get(db, project_id)
+    if conn is None:
         raise HTTPException(status_code=404, detail="Jira not connected")
     return conn
 
@@ -43,33 +47,128 @@ def _jira_service(conn: JiraConnection) -> JiraService:
     return JiraService(conn.jira_site, conn.jira_email, conn.jira_api_token)
 
 
-async def _find_or_create_sprint(
-    db: AsyncSession, project_id: int, jira_sprint: dict
-) -> Sprint:
-    """Find a local Sprint by jira_sprint_id, or create one."""
-    jira_id = jira_sprint.get("id")
-    if jira_id:
-        stmt = select(Sprint).where(
-            Sprint.project_id == project_id,
-            Sprint.jira_sprint_id == jira_id,
+# Max Jira requests in flight per sync/export, so a big board doesn't trip Atlassian's rate limits
+_JIRA_FANOUT = 16
+
+
+async def _fan_out(func, items: list) -> list:
+    """``await func(item)`` for every item concurrently; results (or exceptions) in order."""
+    sem = asyncio.Semaphore(_JIRA_FANOUT)
+
+    async def run(item):
+        async with sem:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+async def _export_issue(
+    svc: JiraService, project_key: str, task: Task, jira_sprint_id: Optional[int] = None
+) -> str:
+    """Create the Jira issue for a task, then best-effort status/sprint; returns the key."""
+    issue = await svc.create_issue(project_key, task.title, task.description, task.priority)
+    key = issue["key"]
+    try:
+        # Transition to correct status if not todo
+        if task.status != "todo":
+            await svc.transition_issue(key, task.status)
+        if jira_sprint_id:
+            await svc.move_issues_to_sprint(jira_sprint_id, [key])
+    except Exception:
+        pass  # the issue exists either way, so the task still gets linked
+    return key
+
+
+async def _linked_keys(db: AsyncSession, project_id: int, issue_keys: list[str]) -> set[str]:
+    """Those of ``issue_keys`` already linked to a task in the project."""
+    if not issue_keys:
+        return set()
+    result = await db.execute(
+        select(Task.jira_issue_key).where(
+            Task.project_id == project_id,
+            Task.jira_issue_key.in_(issue_keys),
         )
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-        if existing:
-            return existing
+    )
+    return set(result.scalars())
+
 
-    sprint = Sprint(
+def _new_sprint(project_id: int, jira_sprint: dict) -> Sprint:
+    return Sprint(
         project_id=project_id,
         name=jira_sprint.get("name", "Jira Sprint"),
         goal=jira_sprint.get("goal", "") or "",
         status=JiraService.parse_jira_sprint_state(jira_sprint.get("state", "future")),
         start_date=jira_sprint.get("startDate", "")[:10] if jira_sprint.get("startDate") else None,
         end_date=jira_sprint.get("endDate", "")[:10] if jira_sprint.get("endDate") else None,
-        jira_sprint_id=jira_id,
+        jira_sprint_id=jira_sprint.get("id"),
+    )
+
+
+async def _resolve_sprints(
+    db: AsyncSession, project_id: int, jira_sprints: list[dict]
+) -> tuple[dict[int, Sprint], int]:
+    """Local Sprint per Jira sprint id, creating missing ones; also returns how many were created."""
+    by_jira_id: dict[int, dict] = {}
+    for js in jira_sprints:
+        if js.get("id"):
+            by_jira_id.setdefault(js["id"], js)
+    if not by_jira_id:
+        return {}, 0
+
+    result = await db.execute(
+        select(Sprint).where(
+            Sprint.project_id == project_id,
+            Sprint.jira_sprint_id.in_(by_jira_id),
+        )
     )
-    db.add(sprint)
-    await db.flush()
-    return sprint
+    sprints = {sprint.jira_sprint_id: sprint for sprint in result.scalars()}
+    missing = [_new_sprint(project_id, js) for jira_id, js in by_jira_id.items() if jira_id not in sprints]
+    if missing:
+        db.add_all(missing)
+        await db.flush()
+        sprints.update((sprint.jira_sprint_id, sprint) for sprint in missing)
+    return sprints, len(missing)
+
+
+async def _insert_issues(
+    db: AsyncSession, project_id: int, issues: list[dict], position_start: Optional[int] = None
+) -> int:
+    """Create a task per Jira issue with one batched INSERT; returns how many.
+
+    With ``position_start`` the new tasks are numbered from there, in issue order.
+    """
+    # Local sprints for every Jira sprint referenced, looked up (or created) in one go
+    jira_sprints = [issue["fields"].get("sprint") for issue in issues]
+    sprints, _ = await _resolve_sprints(
+        db, project_id, [js for js in jira_sprints if isinstance(js, dict)]
+    )
+
+    rows = []
+    for issue, jira_sprint in zip(issues, jira_sprints):
+        fields = issue["fields"]
+        status_name = (fields.get("status") or {}).get("name", "To Do")
+        priority_name = (fields.get("priority") or {}).get("name", "")
+
+        sprint_id_local = None
+        if jira_sprint and isinstance(jira_sprint, dict) and jira_sprint.get("id"):
+            sprint_id_local = sprints[jira_sprint["id"]].id
+
+        row = {
+            "project_id": project_id,
+            "title": fields.get("summary", "Untitled"),
+            "description": JiraService.extract_plain_text(fields.get("description")),
+            "status": JiraService.parse_jira_status(status_name),
+            "priority": JiraService.parse_jira_priority(priority_name),
+            "jira_issue_key": issue["key"],
+            "sprint_id": sprint_id_local,
+        }
+        if position_start is not None:
+            row["position"] = position_start + len(rows)
+        rows.append(row)
+
+    if rows:
+        await db.execute(insert(Task), rows)
+    return len(rows)
 
 
 # --- Endpoints ---
@@ -81,28 +180,27 @@ async def jira_connect(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
-    # Test the connection first
+    # Test the connection, discover the board and load any existing row together
     svc = JiraService(data.jira_site, data.jira_email, data.jira_api_token)
-    try:
-        myself = await svc.test_connection()
-    except Exception:
+    myself, boards, result = await asyncio.gather(
+        svc.test_connection(),
+        svc.get_boards(data.jira_project_key),
+        db.execute(select(JiraConnection).where(JiraConnection.project_id == project_id)),
+        return_exceptions=True,
+    )
+    if isinstance(result, BaseException):
+        raise result
+    if isinstance(myself, BaseException):
         raise HTTPException(status_code=400, detail="Could not connect to Jira. Check credentials.")
 
-    # Auto-discover board ID for agile API
+    # Auto-discover board ID for agile API; board discovery is optional
     board_id = None
-    try:
-        boards = await svc.get_boards(data.jira_project_key)
-        if boards:
-            board_id = boards[0].get("id")
-    except Exception:
-        pass  # Board discovery is optional
+    if boards and not isinstance(boards, BaseException):
+        board_id = boards[0].get("id")
 
     # Upsert connection
-    result = await db.execute(
-        select(JiraConnection).where(JiraConnection.project_id == project_id)
-    )
     conn = result.scalar_one_or_none()
     if conn:
         conn.jira_site = data.jira_site
@@ -123,6 +221,7 @@ async def jira_connect(
         db.add(conn)
 
     await db.commit()
+    jira_connection_cache.invalidate(project_id)
     return {
         "ok": True,
         "jira_user": myself.get("displayName", myself.get("emailAddress", "")),
@@ -137,12 +236,9 @@ async def jira_connection_status(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
-    result = await db.execute(
-        select(JiraConnection).where(JiraConnection.project_id == project_id)
-    )
-    conn = result.scalar_one_or_none()
+    conn = await jira_connection_cache.get(db, project_id)
     if not conn:
         return {"connected": False}
 
@@ -170,9 +266,8 @@ async def jira_reveal_credentials(
     project_id: int,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    conn: JiraConnection = Depends(_require_connection),
 ):
-    await verify_membership(project_id, user.id, db)
-    conn = await _get_connection(db, project_id)
     return {
         "jira_site": conn.jira_site,
         "jira_email": conn.jira_email,
@@ -187,11 +282,11 @@ async def jira_disconnect(
     project_id: int,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    conn: JiraConnection = Depends(_require_connection),
 ):
-    await verify_membership(project_id, user.id, db)
-    conn = await _get_connection(db, project_id)
     await db.delete(conn)
     await db.commit()
+    jira_connection_cache.invalidate(project_id)
     return {"ok": True}
 
 
@@ -200,9 +295,8 @@ async def jira_list_projects(
     project_id: int,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    conn: JiraConnection = Depends(_require_connection),
 ):
-    await verify_membership(project_id, user.id, db)
-    conn = await _get_connection(db, project_id)
     svc = _jira_service(conn)
 
     try:
@@ -216,12 +310,12 @@ async def jira_list_projects(
 @router.post("/{project_id}/jira/export")
 async def jira_export(
     project_id: int,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    conn: JiraConnection = Depends(_require_connection),
 ):
     """Push ShipIt tasks to Jira. Creates issues for tasks without jira_issue_key."""
-    await verify_membership(project_id, user.id, db)
-    conn = await _get_connection(db, project_id)
     svc = _jira_service(conn)
 
     # Get tasks that haven't been exported yet
@@ -236,134 +330,115 @@ async def jira_export(
     result = await db.execute(stmt)
     tasks = result.scalars().all()
 
-    exported = 0
-    for task in tasks:
-        try:
-            issue = await svc.create_issue(
-                conn.jira_project_key,
-                task.title,
-                task.description,
-                task.priority,
+    # Jira sprint ids for the tasks' sprints in one query, so the fan-out never touches the session
+    sprint_ids = {task.sprint_id for task in tasks if task.sprint_id}
+    jira_sprint_ids = {}
+    if sprint_ids:
+        result = await db.execute(
+            select(Sprint.id, Sprint.jira_sprint_id).where(
+                Sprint.id.in_(sprint_ids), Sprint.jira_sprint_id.isnot(None)
             )
-            task.jira_issue_key = issue["key"]
-            exported += 1
-
-            # Transition to correct status if not todo
-            if task.status != "todo":
-                await svc.transition_issue(issue["key"], task.status)
-
-            # Move to Jira sprint if task has one with jira_sprint_id
-            if task.sprint_id:
-                sprint = await db.get(Sprint, task.sprint_id)
-                if sprint and sprint.jira_sprint_id:
-                    try:
-                        await svc.move_issues_to_sprint(sprint.jira_sprint_id, [issue["key"]])
-                    except Exception:
-                        pass
-        except Exception:
+        )
+        jira_sprint_ids = dict(result.all())
+
+    keys = await _fan_out(
+        lambda task: _export_issue(svc, conn.jira_project_key, task, jira_sprint_ids.get(task.sprint_id)),
+        tasks,
+    )
+    exported = 0
+    for task, key in zip(tasks, keys):
+        if isinstance(key, BaseException):
             continue
+        task.jira_issue_key = key
+        exported += 1
 
     conn.last_sync_at = datetime.utcnow()
-    await activity_service.log(
-        db, project_id, user.id, "jira_export",
+    await db.commit()
+    jira_connection_cache.invalidate(project_id)
+    background.add_task(
+        activity_service.log_detached, project_id, user.id, "jira_export",
         details={"exported": exported},
     )
-    await db.commit()
     return {"ok": True, "exported": exported}
 
 
 @router.post("/{project_id}/jira/import")
 async def jira_import(
     project_id: int,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    conn: JiraConnection = Depends(_require_connection),
 ):
     """Pull Jira issues into ShipIt as tasks."""
-    await verify_membership(project_id, user.id, db)
-    conn = await _get_connection(db, project_id)
     svc = _jira_service(conn)
 
-    try:
-        issues = await svc.search_issues(conn.jira_project_key)
-    except Exception as exc:
-        raise HTTPException(status_code=502, detail=f"Failed to fetch Jira issues: {exc}")
-
-    # Get existing jira keys to skip duplicates
-    stmt = select(Task.jira_issue_key).where(
-        Task.project_id == project_id,
-        Task.jira_issue_key.isnot(None),
-    )
-    result = await db.execute(stmt)
-    existing_keys = {row[0] for row in result.all()}
-
+    # Insert page by page, so only one page of issues is held at a time
+    pages = svc.iter_issue_pages(conn.jira_project_key)
     imported = 0
-    for issue in issues:
-        key = issue["key"]
-        if key in existing_keys:
-            continue
-
-        fields = issue["fields"]
-        status_name = (fields.get("status") or {}).get("name", "To Do")
-        priority_name = (fields.get("priority") or {}).get("name", "")
-
-        # Check for sprint data
-        sprint_id_local = None
-        jira_sprint = fields.get("sprint")
-        if jira_sprint and isinstance(jira_sprint, dict) and jira_sprint.get("id"):
-            local_sprint = await _find_or_create_sprint(db, project_id, jira_sprint)
-            sprint_id_local = local_sprint.id
-
-        task = Task(
-            project_id=project_id,
-            title=fields.get("summary", "Untitled"),
-            description=JiraService.extract_plain_text(fields.get("description")),
-            status=JiraService.parse_jira_status(status_name),
-            priority=JiraService.parse_jira_priority(priority_name),
-            jira_issue_key=key,
-            sprint_id=sprint_id_local,
-            position=imported,
+    while True:
+        try:
+            issues = await anext(pages, None)
+        except Exception as exc:
+            raise HTTPException(status_code=502, detail=f"Failed to fetch Jira issues: {exc}")
+        if issues is None:
+            break
+
+        # Skip issues already linked to a task
+        existing_keys = await _linked_keys(db, project_id, [issue["key"] for issue in issues])
+        imported += await _insert_issues(
+            db, project_id, [issue for issue in issues if issue["key"] not in existing_keys],
+            position_start=imported,
         )
-        db.add(task)
-        imported += 1
 
     conn.last_sync_at = datetime.utcnow()
-    await activity_service.log(
-        db, project_id, user.id, "jira_import",
+    await db.commit()
+    jira_connection_cache.invalidate(project_id)
+    background.add_task(
+        activity_service.log_detached, project_id, user.id, "jira_import",
         details={"imported": imported},
     )
-    await db.commit()
     return {"ok": True, "imported": imported}
 
 
 @router.post("/{project_id}/jira/sync")
 async def jira_sync(
     project_id: int,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    conn: JiraConnection = Depends(_require_connection),
 ):
     """Full bidirectional sync: push local changes to Jira, pull Jira changes back."""
-    await verify_membership(project_id, user.id, db)
-    conn = await _get_connection(db, project_id)
     svc = _jira_service(conn)
 
     updated_local = 0
     updated_remote = 0
 
-    # 1. Sync existing linked tasks
-    stmt = (
-        select(Task)
-        .where(
-            Task.project_id == project_id,
-            Task.jira_issue_key.isnot(None),
-        )
+    # Linked tasks (phase 1) and un-exported top-level tasks (phase 2) in one read
+    stmt = select(Task).where(
+        Task.project_id == project_id,
+        or_(Task.jira_issue_key.isnot(None), Task.parent_task_id.is_(None)),
     )
     result = await db.execute(stmt)
-    linked_tasks = result.scalars().all()
+    linked_tasks, new_tasks = [], []
+    for task in result.scalars():
+        (linked_tasks if task.jira_issue_key is not None else new_tasks).append(task)
+
+    # 1. Sync existing linked tasks
 
+    # Current status of every linked issue, 100 per JQL search
+    try:
+        remote = await svc.search_by_keys(
+            [task.jira_issue_key for task in linked_tasks], expand="transitions"
+        )
+    except Exception:
+        remote = []
+    issues_by_key = {issue["key"]: issue for issue in remote}
+    to_push = []
     for task in linked_tasks:
-        try:
-            issue = await svc.get_issue(task.jira_issue_key)
-        except Exception:
+        issue = issues_by_key.get(task.jira_issue_key)
+        if issue is None:
             continue
 
         fields = issue["fields"]
@@ -378,101 +453,63 @@ async def jira_sync(
                 or task.updated_at > conn.last_sync_at
             )
             if local_is_newer:
-                try:
-                    await svc.transition_issue(task.jira_issue_key, task.status)
-                    updated_remote += 1
-                except Exception:
-                    pass
+                to_push.append(task)
             else:
                 # Jira changed since last sync, pull to local
                 task.status = jira_status
                 task.updated_at = datetime.utcnow()
                 updated_local += 1
 
-    # 2. Export un-exported tasks
-    stmt = (
-        select(Task)
-        .where(
-            Task.project_id == project_id,
-            Task.parent_task_id.is_(None),
-            Task.jira_issue_key.is_(None),
-        )
+    # Only issues whose Jira status differs get here; each already carries its available
+    # transitions from the search, so a push is a single POST
+    pushed = await _fan_out(
+        lambda task: svc.transition_issue(
+            task.jira_issue_key, task.status, issues_by_key[task.jira_issue_key].get("transitions")
+        ),
+        to_push,
     )
-    result = await db.execute(stmt)
-    new_tasks = result.scalars().all()
+    updated_remote += sum(1 for r in pushed if not isinstance(r, BaseException))
 
-    for task in new_tasks:
-        try:
-            issue = await svc.create_issue(
-                conn.jira_project_key,
-                task.title,
-                task.description,
-                task.priority,
-            )
-            task.jira_issue_key = issue["key"]
-            updated_remote += 1
-            if task.status != "todo":
-                await svc.transition_issue(issue["key"], task.status)
-        except Exception:
+    # 2. Export un-exported tasks
+    keys = await _fan_out(lambda task: _export_issue(svc, conn.jira_project_key, task), new_tasks)
+    for task, key in zip(new_tasks, keys):
+        if isinstance(key, BaseException):
             continue
+        task.jira_issue_key = key
+        updated_remote += 1
 
     # 3. Import new Jira issues
-    try:
-        issues = await svc.search_issues(conn.jira_project_key)
-    except Exception:
-        issues = []
-
-    existing_keys_stmt = select(Task.jira_issue_key).where(
-        Task.project_id == project_id,
-        Task.jira_issue_key.isnot(None),
-    )
-    result = await db.execute(existing_keys_stmt)
-    existing_keys = {row[0] for row in result.all()}
+    # Every linked key in the project is already in hand from phases 1 and 2
+    existing_keys = {task.jira_issue_key for task in linked_tasks}
+    existing_keys.update(task.jira_issue_key for task in new_tasks if task.jira_issue_key)
 
+    pages = svc.iter_issue_pages(conn.jira_project_key)
     imported = 0
-    for issue in issues:
-        key = issue["key"]
-        if key in existing_keys:
-            continue
-
-        fields = issue["fields"]
-        status_name = (fields.get("status") or {}).get("name", "To Do")
-        priority_name = (fields.get("priority") or {}).get("name", "")
-
-        # Check for sprint data
-        sprint_id_local = None
-        jira_sprint = fields.get("sprint")
-        if jira_sprint and isinstance(jira_sprint, dict) and jira_sprint.get("id"):
-            local_sprint = await _find_or_create_sprint(db, project_id, jira_sprint)
-            sprint_id_local = local_sprint.id
-
-        task = Task(
-            project_id=project_id,
-            title=fields.get("summary", "Untitled"),
-            description=JiraService.extract_plain_text(fields.get("description")),
-            status=JiraService.parse_jira_status(status_name),
-            priority=JiraService.parse_jira_priority(priority_name),
-            jira_issue_key=key,
-            sprint_id=sprint_id_local,
+    while True:
+        try:
+            issues = await anext(pages, None)
+        except Exception:
+            issues = None  # keep the pages imported so far
+        if issues is None:
+            break
+        imported += await _insert_issues(
+            db, project_id, [issue for issue in issues if issue["key"] not in existing_keys]
         )
-        db.add(task)
-        imported += 1
 
     # 4. Sync sprint statuses from Jira (if board is available)
     sprints_synced = 0
     if conn.jira_board_id:
         try:
-            jira_sprints = await svc.get_sprints(conn.jira_board_id)
-            for js in jira_sprints:
-                jira_id = js.get("id")
-                if not jira_id:
-                    continue
-                stmt = select(Sprint).where(
+            jira_sprints = [js for js in await svc.get_sprints(conn.jira_board_id) if js.get("id")]
+            result = await db.execute(
+                select(Sprint).where(
                     Sprint.project_id == project_id,
-                    Sprint.jira_sprint_id == jira_id,
+                    Sprint.jira_sprint_id.in_([js["id"] for js in jira_sprints]),
                 )
-                result = await db.execute(stmt)
-                local = result.scalar_one_or_none()
+            )
+            local_sprints = {sprint.jira_sprint_id: sprint for sprint in result.scalars()}
+            for js in jira_sprints:
+                local = local_sprints.get(js["id"])
                 if local:
                     new_status = JiraService.parse_jira_sprint_state(js.get("state", "future"))
                     if local.status != new_status:
@@ -483,8 +520,10 @@ async def jira_sync(
             pass
 
     conn.last_sync_at = datetime.utcnow()
-    await activity_service.log(
-        db, project_id, user.id, "jira_sync",
+    await db.commit()
+    jira_connection_cache.invalidate(project_id)
+    background.add_task(
+        activity_service.log_detached, project_id, user.id, "jira_sync",
         details={
             "updated_local": updated_local,
             "updated_remote": updated_remote,
@@ -492,7 +531,6 @@ async def jira_sync(
             "sprints_synced": sprints_synced,
         },
     )
-    await db.commit()
 
     return {
         "ok": True,
@@ -506,12 +544,12 @@ async def jira_sync(
 @router.post("/{project_id}/jira/import-sprints")
 async def jira_import_sprints(
     project_id: int,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    conn: JiraConnection = Depends(_require_connection),
 ):
     """Pull all Jira sprints into local Sprint records, assign issues to them."""
-    await verify_membership(project_id, user.id, db)
-    conn = await _get_connection(db, project_id)
 
     if not conn.jira_board_id:
         raise HTTPException(status_code=400, detail="No Jira board found. Sprints not available.")
@@ -523,35 +561,40 @@ async def jira_import_sprints(
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"Failed to fetch Jira sprints: {exc}")
 
-    created = 0
-    tasks_assigned = 0
-    for js in jira_sprints:
-        local_sprint = await _find_or_create_sprint(db, project_id, js)
-        if local_sprint.created_at == local_sprint.updated_at:
-            created += 1
+    jira_sprints = [js for js in jira_sprints if js.get("id")]
+    sprints, created = await _resolve_sprints(db, project_id, jira_sprints)
+    local_sprints = [sprints[js["id"]] for js in jira_sprints]
+
+    # Get issues in each sprint concurrently, then assign them
+    sprint_issues = await _fan_out(lambda js: svc.get_sprint_issues(js["id"]), jira_sprints)
+    fetched = [
+        (local_sprint, issues)
+        for local_sprint, issues in zip(local_sprints, sprint_issues)
+        if not isinstance(issues, BaseException)
+    ]
+
+    # Linked tasks for every issue in those sprints, in one query
+    keys = {issue["key"] for _, issues in fetched for issue in issues}
+    tasks_by_key = {}
+    if keys:
+        result = await db.execute(
+            select(Task).where(Task.project_id == project_id, Task.jira_issue_key.in_(keys))
+        )
+        tasks_by_key = {task.jira_issue_key: task for task in result.scalars()}
 
-        # Get issues in this sprint and assign them
-        try:
-            sprint_issues = await svc.get_sprint_issues(js["id"])
-            for issue in sprint_issues:
-                key = issue["key"]
-                stmt = select(Task).where(
-                    Task.project_id == project_id,
-                    Task.jira_issue_key == key,
-                )
-                result = await db.execute(stmt)
-                task = result.scalar_one_or_none()
-                if task and task.sprint_id != local_sprint.id:
-                    task.sprint_id = local_sprint.id
-                    tasks_assigned += 1
-        except Exception:
-            continue
+    tasks_assigned = 0
+    for local_sprint, issues in fetched:
+        for issue in issues:
+            task = tasks_by_key.get(issue["key"])
+            if task and task.sprint_id != local_sprint.id:
+                task.sprint_id = local_sprint.id
+                tasks_assigned += 1
 
-    await activity_service.log(
-        db, project_id, user.id, "jira_import_sprints",
+    await db.commit()
+    background.add_task(
+        activity_service.log_detached, project_id, user.id, "jira_import_sprints",
         details={"created": created, "tasks_assigned": tasks_assigned},
     )
-    await db.commit()
     return {"ok": True, "sprints_created": created, "tasks_assigned": tasks_assigned}
 
 
@@ -559,12 +602,12 @@ async def jira_import_sprints(
 async def jira_export_sprint(
     project_id: int,
     sprint_id: int,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    conn: JiraConnection = Depends(_require_connection),
 ):
     """Create a sprint in Jira and move linked issues into it."""
-    await verify_membership(project_id, user.id, db)
-    conn = await _get_connection(db, project_id)
 
     if not conn.jira_board_id:
         raise HTTPException(status_code=400, detail="No Jira board found. Sprints not available.")
@@ -575,28 +618,33 @@ async def jira_export_sprint(
 
     svc = _jira_service(conn)
 
-    # Create sprint in Jira if it doesn't have a jira_sprint_id yet
+    # Linked issues to move into the sprint
+    linked_stmt = select(Task.jira_issue_key).where(
+        Task.sprint_id == sprint_id,
+        Task.jira_issue_key.isnot(None),
+    )
+
+    # Create sprint in Jira if it doesn't have a jira_sprint_id yet, reading the keys meanwhile
     if not sprint.jira_sprint_id:
-        try:
-            jira_sprint = await svc.create_sprint(
+        jira_sprint, result = await asyncio.gather(
+            svc.create_sprint(
                 conn.jira_board_id,
                 sprint.name,
                 sprint.start_date,
                 sprint.end_date,
                 sprint.goal,
-            )
-            sprint.jira_sprint_id = jira_sprint["id"]
-        except Exception as exc:
-            raise HTTPException(status_code=502, detail=f"Failed to create Jira sprint: {exc}")
-
-    # Move linked issues into the sprint
-    stmt = select(Task).where(
-        Task.sprint_id == sprint_id,
-        Task.jira_issue_key.isnot(None),
-    )
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
-    issue_keys = [t.jira_issue_key for t in tasks]
+            ),
+            db.execute(linked_stmt),
+            return_exceptions=True,
+        )
+        if isinstance(result, BaseException):
+            raise result
+        if isinstance(jira_sprint, BaseException):
+            raise HTTPException(status_code=502, detail=f"Failed to create Jira sprint: {jira_sprint}")
+        sprint.jira_sprint_id = jira_sprint["id"]
+    else:
+        result = await db.execute(linked_stmt)
+    issue_keys = list(result.scalars())
 
     moved = 0
     if issue_keys:
@@ -606,9 +654,9 @@ async def jira_export_sprint(
         except Exception:
             pass
 
-    await activity_service.log(
-        db, project_id, user.id, "jira_export_sprint",
+    await db.commit()
+    background.add_task(
+        activity_service.log_detached, project_id, user.id, "jira_export_sprint",
         details={"sprint_name": sprint.name, "issues_moved": moved},
     )
-    await db.commit()
     return {"ok": True, "jira_sprint_id": sprint.jira_sprint_id, "issues_moved": moved}
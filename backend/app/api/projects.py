@@ -1,37 +1,48 @@
 """Projects API — CRUD, members, workload."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select, func
+from sqlalchemy import case, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from app.db.database import get_db
 from app.models import User, Project, ProjectMember, Task
 from app.api.auth import get_current_user
-from app.services import activity_service
+from app.services import activity_service, member_cache
 
 router = APIRouter()
 
 
 # --- Helpers ---
 
+# Statuses reported in a project's task_counts
+_BOARD_STATUSES = ("todo", "in_progress", "done", "blocked")
+
+
 async def verify_membership(project_id: int, user_id: int, db: AsyncSession) -> Project:
+    # Point lookup on the (project, user) membership; the members collection isn't loaded
     stmt = (
         select(Project)
-        .options(joinedload(Project.members))
+        .join(
+            ProjectMember,
+            (ProjectMember.project_id == Project.id) & (ProjectMember.user_id == user_id),
+        )
         .where(Project.id == project_id)
+        .limit(1)
     )
-    result = await db.execute(stmt)
-    project = result.scalars().unique().first()
+    project = await db.scalar(stmt)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    member_ids = [m.user_id for m in project.members]
-    if user_id not in member_ids:
-        raise HTTPException(status_code=404, detail="Project not found")
     return project
 
 
+async def require_member(project_id: int, user_id: int, db: AsyncSession) -> None:
+    """Membership check from the cached roster, for callers that don't need the Project row."""
+    if not await member_cache.is_member(db, project_id, user_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+
+
 # --- Schemas ---
 
 class ProjectCreate(BaseModel):
@@ -50,6 +61,7 @@ class JoinByCode(BaseModel):
 @router.post("/")
 async def create_project(
     data: ProjectCreate,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -60,8 +72,12 @@ async def create_project(
     member = ProjectMember(project_id=project.id, user_id=user.id, role="owner")
     db.add(member)
 
-    await activity_service.log(db, project.id, user.id, "created", details={"name": data.name})
     await db.commit()
+    # A reused project id may still have a roster cached from a deleted project
+    member_cache.invalidate(project.id)
+    background.add_task(
+        activity_service.log_detached, project.id, user.id, "created", details={"name": data.name}
+    )
     await db.refresh(project)
 
     return {"id": project.id, "name": project.name, "description": project.description, "join_code": project.join_code}
@@ -76,39 +92,35 @@ async def list_projects(
         select(Project)
         .join(ProjectMember, ProjectMember.project_id == Project.id)
         .where(ProjectMember.user_id == user.id)
-        .options(joinedload(Project.members))
+        .order_by(ProjectMember.id)
+        .options(selectinload(Project.members))
     )
     result = await db.execute(stmt)
-    projects = result.scalars().unique().all()
+    projects = result.scalars().all()
 
-    out = []
-    for p in projects:
-        # Get task counts
+    # Top-level task counts for every project, in one grouped query
+    counts = {p.id: dict.fromkeys(_BOARD_STATUSES, 0) for p in projects}
+    if counts:
         count_stmt = (
-            select(
-                func.count().filter(Task.status == "todo").label("todo"),
-                func.count().filter(Task.status == "in_progress").label("in_progress"),
-                func.count().filter(Task.status == "done").label("done"),
-                func.count().filter(Task.status == "blocked").label("blocked"),
-            )
-            .where(Task.project_id == p.id, Task.parent_task_id.is_(None))
+            select(Task.project_id, Task.status, func.count())
+            .where(Task.project_id.in_(counts), Task.parent_task_id.is_(None))
+            .group_by(Task.project_id, Task.status)
         )
-        counts = (await db.execute(count_stmt)).first()
+        for project_id, status, n in (await db.execute(count_stmt)).all():
+            if status in counts[project_id]:
+                counts[project_id][status] = n
 
-        out.append({
+    return [
+        {
             "id": p.id,
             "name": p.name,
             "description": p.description,
             "member_count": len(p.members),
-            "task_counts": {
-                "todo": counts.todo if counts else 0,
-                "in_progress": counts.in_progress if counts else 0,
-                "done": counts.done if counts else 0,
-                "blocked": counts.blocked if counts else 0,
-            },
+            "task_counts": counts[p.id],
             "created_at": p.created_at.isoformat(),
-        })
-    return out
+        }
+        for p in projects
+    ]
 
 
 @router.get("/{project_id}")
@@ -119,12 +131,13 @@ async def get_project(
 ):
     project = await verify_membership(project_id, user.id, db)
 
+    # One pass over the top-level tasks; SUM(CASE) is portable across SQLite/Postgres
     count_stmt = (
         select(
-            func.count().filter(Task.status == "todo").label("todo"),
-            func.count().filter(Task.status == "in_progress").label("in_progress"),
-            func.count().filter(Task.status == "done").label("done"),
-            func.count().filter(Task.status == "blocked").label("blocked"),
+            *(
+                func.coalesce(func.sum(case((Task.status == status, 1), else_=0)), 0).label(status)
+                for status in _BOARD_STATUSES
+            )
         )
         .where(Task.project_id == project.id, Task.parent_task_id.is_(None))
     )
@@ -157,6 +170,7 @@ async def delete_project(
         raise HTTPException(status_code=403, detail="Only the owner can delete a project")
     await db.delete(project)
     await db.commit()
+    member_cache.invalidate(project_id)
     return {"ok": True}
 
 
@@ -164,10 +178,11 @@ async def delete_project(
 async def add_member(
     project_id: int,
     data: MemberAdd,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     # Find or create user by name
     name = data.name.strip()
@@ -178,22 +193,22 @@ async def add_member(
         db.add(target)
         await db.flush()
 
-    # Check if already a member
-    existing = await db.execute(
-        select(ProjectMember).where(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == target.id,
-        )
+    # Check if already a member (existence only)
+    existing = await db.scalar(
+        select(ProjectMember.id)
+        .where(ProjectMember.project_id == project_id, ProjectMember.user_id == target.id)
+        .limit(1)
     )
-    if existing.scalar_one_or_none():
+    if existing is not None:
         raise HTTPException(status_code=400, detail="Already a member")
 
     member = ProjectMember(project_id=project_id, user_id=target.id, role="member")
     db.add(member)
-    await activity_service.log(
-        db, project_id, user.id, "member_added", details={"member_name": name}
-    )
     await db.commit()
+    background.add_task(
+        activity_service.log_detached, project_id, user.id, "member_added", details={"member_name": name}
+    )
+    member_cache.invalidate(project_id)
 
     return {"id": target.id, "name": target.name, "role": "member"}
 
@@ -204,31 +219,34 @@ async def list_members(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    project = await verify_membership(project_id, user.id, db)
-
-    members = []
-    for m in project.members:
-        # Count assigned non-done tasks
-        count_stmt = (
-            select(func.count())
-            .where(
-                Task.project_id == project_id,
-                Task.assignee_id == m.user_id,
-                Task.status != "done",
-            )
+    await require_member(project_id, user.id, db)
+
+    roster = (await db.execute(
+        select(ProjectMember.user_id, func.coalesce(User.name, "Unknown"), ProjectMember.role)
+        .outerjoin(User, User.id == ProjectMember.user_id)
+        .where(ProjectMember.project_id == project_id)
+        .order_by(ProjectMember.id)
+    )).all()
+    # Open (non-done) task counts for every member in one grouped query
+    workloads = dict((await db.execute(
+        select(Task.assignee_id, func.count())
+        .where(
+            Task.project_id == project_id,
+            Task.assignee_id.in_([user_id for user_id, _, _ in roster]),
+            Task.status != "done",
         )
-        count = (await db.execute(count_stmt)).scalar() or 0
-
-        # Get the user name
-        member_user = await db.get(User, m.user_id)
-        members.append({
-            "id": m.user_id,
-            "name": member_user.name if member_user else "Unknown",
-            "role": m.role,
-            "workload": count,
-        })
+        .group_by(Task.assignee_id)
+    )).all())
 
-    return members
+    return [
+        {
+            "id": user_id,
+            "name": name,
+            "role": role,
+            "workload": workloads.get(user_id, 0),
+        }
+        for user_id, name, role in roster
+    ]
 
 
 @router.delete("/{project_id}/members/{user_id}")
@@ -253,12 +271,14 @@ async def remove_member(
 
     await db.delete(member)
     await db.commit()
+    member_cache.invalidate(project_id)
     return {"ok": True}
 
 
 @router.post("/join")
 async def join_by_code(
     data: JoinByCode,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -270,20 +290,20 @@ async def join_by_code(
     if not project:
         raise HTTPException(status_code=404, detail="Invalid join code")
 
-    # Check if already a member
-    existing = await db.execute(
-        select(ProjectMember).where(
-            ProjectMember.project_id == project.id,
-            ProjectMember.user_id == user.id,
-        )
+    # Check if already a member (existence only)
+    existing = await db.scalar(
+        select(ProjectMember.id)
+        .where(ProjectMember.project_id == project.id, ProjectMember.user_id == user.id)
+        .limit(1)
     )
-    if existing.scalar_one_or_none():
+    if existing is not None:
         return {"ok": True, "project_id": project.id, "message": "Already a member"}
 
     member = ProjectMember(project_id=project.id, user_id=user.id, role="member")
     db.add(member)
-    await activity_service.log(
-        db, project.id, user.id, "member_joined", details={"via": "join_code"}
-    )
     await db.commit()
+    background.add_task(
+        activity_service.log_detached, project.id, user.id, "member_joined", details={"via": "join_code"}
+    )
+    member_cache.invalidate(project.id)
     return {"ok": True, "project_id": project.id, "project_name": project.name}
@@ -9,10 +9,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.db.database import get_db
-from app.models import User, Pulse, ProjectMember
+from app.models import User, Pulse
 from app.api.auth import get_current_user
-from app.api.projects import verify_membership
-from app.services import ai_service
+from app.api.projects import require_member
+from app.services import ai_service, member_cache
 
 router = APIRouter()
 
@@ -50,7 +50,7 @@ async def log_pulse(
     db: AsyncSession = Depends(get_db),
 ):
     """Log today's pulse (upsert — one per user per project per day)."""
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     if not (1 <= data.energy <= 5) or not (1 <= data.mood <= 5):
         raise HTTPException(status_code=400, detail="Energy and mood must be 1-5")
@@ -93,7 +93,7 @@ async def get_today_pulse(
     db: AsyncSession = Depends(get_db),
 ):
     """Get current user's pulse for today."""
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     today = datetime.utcnow().strftime("%Y-%m-%d")
     stmt = select(Pulse).where(
@@ -116,7 +116,7 @@ async def get_pulse_history(
     db: AsyncSession = Depends(get_db),
 ):
     """Get current user's pulse history."""
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     stmt = (
         select(Pulse)
@@ -139,28 +139,22 @@ async def get_team_pulse(
     db: AsyncSession = Depends(get_db),
 ):
     """Get today's pulse for all team members (anonymous aggregate + individual if logged)."""
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     today = datetime.utcnow().strftime("%Y-%m-%d")
 
-    # Get all today's pulses
-    stmt = select(Pulse).where(
-        Pulse.project_id == project_id,
-        Pulse.date == today,
+    # All today's pulses with their authors' names, in one query
+    stmt = (
+        select(Pulse, func.coalesce(User.name, "Unknown"))
+        .outerjoin(User, User.id == Pulse.user_id)
+        .where(Pulse.project_id == project_id, Pulse.date == today)
     )
-    result = await db.execute(stmt)
-    pulses = result.scalars().all()
-
-    # Get member count
-    member_count = (await db.execute(
-        select(func.count()).where(ProjectMember.project_id == project_id)
-    )).scalar() or 0
+    rows = (await db.execute(stmt)).all()
+    pulses = [p for p, _ in rows]
+    entries = [_pulse_to_dict(p, name) for p, name in rows]
 
-    # Get user names for pulses
-    entries = []
-    for p in pulses:
-        u = await db.get(User, p.user_id)
-        entries.append(_pulse_to_dict(p, u.name if u else "Unknown"))
+    # Member count from the roster the membership check just read
+    member_count = len(await member_cache.get(db, project_id))
 
     # Aggregate
     if pulses:
@@ -187,7 +181,7 @@ async def get_pulse_insights(
     db: AsyncSession = Depends(get_db),
 ):
     """AI-generated insights from pulse + activity data."""
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     # Get pulse history
     stmt = (
@@ -0,0 +1,14 @@
+"""JSON responses encoded in one pass by pydantic-core.
+
+Returning a ``Response`` skips FastAPI's ``jsonable_encoder`` walk and the
+stdlib ``json.dumps``; datetimes are written natively as ISO 8601.
+"""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+
+
+def json_response(payload: Any, status_code: int = 200) -> Response:
+    return Response(content=to_json(payload), status_code=status_code, media_type="application/json")
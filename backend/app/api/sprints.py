@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
 from app.models import User, Task, Sprint
 from app.api.auth import get_current_user
-from app.api.projects import verify_membership
+from app.api.projects import require_member
 from app.services import activity_service
 
 router = APIRouter()
@@ -79,7 +79,7 @@ async def list_sprints(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     stmt = (
         select(Sprint)
@@ -102,7 +102,7 @@ async def get_active_sprint(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     stmt = select(Sprint).where(
         Sprint.project_id == project_id,
@@ -124,7 +124,7 @@ async def create_sprint(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     sprint = Sprint(
         project_id=project_id,
@@ -155,7 +155,7 @@ async def update_sprint(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     sprint = await db.get(Sprint, sprint_id)
     if not sprint or sprint.project_id != project_id:
@@ -180,7 +180,7 @@ async def delete_sprint(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     sprint = await db.get(Sprint, sprint_id)
     if not sprint or sprint.project_id != project_id:
@@ -204,7 +204,7 @@ async def start_sprint(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     sprint = await db.get(Sprint, sprint_id)
     if not sprint or sprint.project_id != project_id:
@@ -243,7 +243,7 @@ async def complete_sprint(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     sprint = await db.get(Sprint, sprint_id)
     if not sprint or sprint.project_id != project_id:
@@ -282,7 +282,7 @@ async def move_tasks(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     sprint = await db.get(Sprint, sprint_id)
     if not sprint or sprint.project_id != project_id:
@@ -309,7 +309,7 @@ async def get_backlog(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     stmt = (
         select(Task)
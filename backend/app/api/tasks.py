@@ -4,14 +4,14 @@ from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select, func
+from sqlalchemy import case, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.db.database import get_db
 from app.models import User, Task, Sprint
 from app.api.auth import get_current_user
-from app.api.projects import verify_membership
+from app.api.projects import require_member
 from app.services import activity_service, gamification_service
 
 router = APIRouter()
@@ -78,7 +78,7 @@ async def get_board(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     # Build base query for top-level tasks
     stmt = (
@@ -107,16 +107,24 @@ async def get_board(
     result = await db.execute(stmt)
     tasks = result.scalars().unique().all()
 
+    # Subtask (total, done) counts for every task on the board, in one grouped query
+    subtask_counts = {}
+    if tasks:
+        count_stmt = (
+            select(
+                Task.parent_task_id,
+                func.count(),
+                func.sum(case((Task.status == "done", 1), else_=0)),
+            )
+            .where(Task.parent_task_id.in_([task.id for task in tasks]))
+            .group_by(Task.parent_task_id)
+        )
+        for parent_id, total, done in (await db.execute(count_stmt)).all():
+            subtask_counts[parent_id] = (total, done or 0)
+
     board = {"todo": [], "in_progress": [], "done": [], "blocked": []}
     for task in tasks:
-        # Count subtasks
-        sub_total = (await db.execute(
-            select(func.count()).where(Task.parent_task_id == task.id)
-        )).scalar() or 0
-        sub_done = (await db.execute(
-            select(func.count()).where(Task.parent_task_id == task.id, Task.status == "done")
-        )).scalar() or 0
-
+        sub_total, sub_done = subtask_counts.get(task.id, (0, 0))
         task_dict = _task_to_dict(task, sub_total, sub_done)
         if task.status in board:
             board[task.status].append(task_dict)
@@ -131,7 +139,7 @@ async def create_task(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     task = Task(
         project_id=project_id,
@@ -166,7 +174,7 @@ async def get_task(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     stmt = (
         select(Task)
@@ -193,7 +201,7 @@ async def update_task(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     task = await db.get(Task, task_id)
     if not task or task.project_id != project_id:
@@ -242,7 +250,7 @@ async def delete_task(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    await verify_membership(project_id, user.id, db)
+    await require_member(project_id, user.id, db)
 
     stmt = (
         select(Task)
@@ -3,6 +3,7 @@
 import hashlib
 import hmac
 import logging
+import uuid
 from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Request, HTTPException
@@ -146,6 +147,8 @@ async def gitlab_webhook(request: Request):
         mr = body.get("object_attributes", {})
         action = mr.get("action", "")
 
+        # One correlation id per MR webhook so downstream agents can share state
+        correlation_id = str(uuid.uuid4())
         mr_data = {
             "mr_iid": mr.get("iid"),
             "title": mr.get("title", ""),
@@ -154,6 +157,7 @@ async def gitlab_webhook(request: Request):
             "author": mr.get("author_id"),
             "gitlab_project_id": mr.get("target_project_id"),
             "url": mr.get("url", ""),
+            "sha": (mr.get("last_commit") or {}).get("id"),
         }
 
         if action == "open":
@@ -162,6 +166,7 @@ async def gitlab_webhook(request: Request):
                 data=mr_data,
                 source_agent="gitlab_webhook",
                 project_id=shipit_project_id,
+                correlation_id=correlation_id,
             ))
         elif action == "merge":
             target = mr.get("target_branch", "")
@@ -171,6 +176,7 @@ async def gitlab_webhook(request: Request):
                 data={**mr_data, "ref": target},
                 source_agent="gitlab_webhook",
                 project_id=shipit_project_id,
+                correlation_id=correlation_id,
             ))
         elif action == "update" and mr.get("work_in_progress") is False:
             await event_bus.publish(Event(
@@ -178,6 +184,7 @@ async def gitlab_webhook(request: Request):
                 data=mr_data,
                 source_agent="gitlab_webhook",
                 project_id=shipit_project_id,
+                correlation_id=correlation_id,
             ))
         elif action == "approved":
             await event_bus.publish(Event(
@@ -185,6 +192,7 @@ async def gitlab_webhook(request: Request):
                 data=mr_data,
                 source_agent="gitlab_webhook",
                 project_id=shipit_project_id,
+                correlation_id=correlation_id,
             ))
 
     elif event_type == "Pipeline Hook":
@@ -8,11 +8,18 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./shipit.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
+    db_pool_timeout: float = 30.0
+    db_pool_recycle_seconds: int = 1800
 
     # Gradient AI
     gradient_api_key: str = ""
     gradient_workspace_id: str = ""
     gradient_agent_endpoint: str = ""
+    # Mark the system message as a prompt-cache breakpoint (Anthropic-style
+    # cache_control); only enable for models/endpoints that accept content blocks
+    gradient_prompt_cache: bool = False
 
     # CORS
     cors_origins: list[str] = ["http://localhost:5173", "http://localhost:3000"]
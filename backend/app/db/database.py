@@ -1,4 +1,4 @@
-from sqlalchemy import text
+from sqlalchemy import event, make_url, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -6,7 +6,44 @@ from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+# Room for every distinct statement shape the API issues, so compiled SQL is
+# reused instead of evicted (SQLAlchemy's default holds 500)
+QUERY_CACHE_SIZE = 1200
+
+
+def _pool_options(url: str) -> dict:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}  # single static connection; there is no pool to size
+    options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+    if parsed.get_backend_name() != "sqlite":
+        # Server connections can be dropped underneath us (restarts, idle timeouts)
+        options["pool_pre_ping"] = True
+        options["pool_recycle"] = settings.db_pool_recycle_seconds
+    return options
+
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=settings.debug,
+    query_cache_size=QUERY_CACHE_SIZE,
+    **_pool_options(settings.database_url),
+)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, _record):
+        # WAL lets readers run alongside the writer; NORMAL sync is durable under WAL
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -30,6 +67,15 @@ async def init_db():
             "ALTER TABLE jira_connections ADD COLUMN jira_board_id INTEGER",
             "ALTER TABLE projects ADD COLUMN join_code VARCHAR(20)",
             "CREATE UNIQUE INDEX IF NOT EXISTS ix_projects_join_code ON projects(join_code)",
+            "DROP INDEX IF EXISTS ix_service_conn_lookup",
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_user_name ON users(name)",
+            "CREATE INDEX IF NOT EXISTS ix_task_project_assignee_status ON tasks(project_id, assignee_id, status)",
+            "CREATE INDEX IF NOT EXISTS ix_task_project_parent_status_priority ON tasks(project_id, parent_task_id, status, priority)",
+            "CREATE INDEX IF NOT EXISTS ix_task_project_updated ON tasks(project_id, updated_at)",
+            "CREATE INDEX IF NOT EXISTS ix_task_top_level ON tasks(project_id, status) WHERE parent_task_id IS NULL",
+            "CREATE INDEX IF NOT EXISTS ix_task_project_jira_key ON tasks(project_id, jira_issue_key)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_sprint_project_jira ON sprints(project_id, jira_sprint_id)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_member_project_user ON project_members(project_id, user_id)",
         ]
         for sql in migrations:
             try:
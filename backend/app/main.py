@@ -3,6 +3,9 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.adapters.gitlab_adapter import close_gitlab_adapters
+from app.adapters.http_client import close_http_client
+from app.adapters.slack_adapter import close_slack_adapters
 from app.config import get_settings
 from app.db.database import init_db
 from app.api import auth, projects, tasks, ai, activity, jira, webhooks, sprints, pulse, gamification
@@ -53,6 +56,9 @@ async def lifespan(app: FastAPI):
     if _registry:
         await _registry.stop_all()
         logger.info("Agent fleet stopped")
+    await close_gitlab_adapters()
+    await close_slack_adapters()
+    await close_http_client()
 
 
 app = FastAPI(
@@ -10,6 +10,7 @@ from app.db.database import Base
 class ServiceConnection(Base):
     __tablename__ = "service_connections"
     __table_args__ = (
+        # Its index also serves the agents' (project_id, service_type) lookup
         UniqueConstraint("project_id", "service_type", name="uq_service_conn_project_type"),
     )
 
@@ -1,12 +1,16 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Text, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import String, Text, Integer, Float, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.database import Base
 
 
 class Sprint(Base):
     __tablename__ = "sprints"
+    __table_args__ = (
+        # One local sprint per Jira sprint; also serves the Jira import/sync lookups
+        UniqueConstraint("project_id", "jira_sprint_id", name="uq_sprint_project_jira"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id"))
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, Float, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Text, Integer, Float, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional
 from app.db.database import Base
@@ -7,6 +7,30 @@ from app.db.database import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Per-assignee workload counts/hours (sprint planning, analytics)
+        Index(
+            "ix_task_project_assignee_status",
+            "project_id",
+            "assignee_id",
+            "status",
+            postgresql_include=["estimated_hours"],
+        ),
+        # Top-level status/priority distribution (analytics)
+        Index("ix_task_project_parent_status_priority", "project_id", "parent_task_id", "status", "priority"),
+        # Top-level task counts per status (project list/detail)
+        Index(
+            "ix_task_top_level",
+            "project_id",
+            "status",
+            postgresql_where=text("parent_task_id IS NULL"),
+            sqlite_where=text("parent_task_id IS NULL"),
+        ),
+        # Board version (count, max updated_at) for the AI task snapshot cache
+        Index("ix_task_project_updated", "project_id", "updated_at"),
+        # Jira link lookups (import/sync skip lists, sprint assignment)
+        Index("ix_task_project_jira_key", "project_id", "jira_issue_key"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id"))
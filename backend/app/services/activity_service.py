@@ -1,10 +1,26 @@
+import logging
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import select, desc
+from sqlalchemy import RowMapping, insert, select, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
+from app.db.database import async_session
 from app.models.activity import Activity
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Activity feed columns plus the author's name, read as plain rows (no ORM objects)
+_FEED_COLUMNS = (
+    Activity.id,
+    Activity.project_id,
+    Activity.task_id,
+    Activity.user_id,
+    func.coalesce(User.name, "Unknown").label("user_name"),
+    Activity.action,
+    Activity.details,
+    Activity.created_at,
+)
 
 
 async def log(
@@ -27,30 +43,78 @@ async def log(
     return activity
 
 
+async def log_detached(
+    project_id: int,
+    user_id: int,
+    action: str,
+    task_id: Optional[int] = None,
+    details: Optional[dict] = None,
+) -> None:
+    """Write an activity entry in its own session, e.g. as a BackgroundTask after the response."""
+    try:
+        async with async_session() as db:
+            await db.execute(
+                insert(Activity).values(
+                    project_id=project_id,
+                    user_id=user_id,
+                    action=action,
+                    task_id=task_id,
+                    details=details,
+                )
+            )
+            await db.commit()
+    except Exception:
+        logger.exception("Failed to log %s activity for project %s", action, project_id)
+
+
+async def log_many(
+    db: AsyncSession,
+    project_id: int,
+    user_id: int,
+    entries: list[tuple[str, Optional[int], Optional[dict]]],
+) -> None:
+    """Insert several (action, task_id, details) entries in one batched INSERT."""
+    if not entries:
+        return
+    await db.execute(
+        insert(Activity),
+        [
+            {
+                "project_id": project_id,
+                "user_id": user_id,
+                "action": action,
+                "task_id": task_id,
+                "details": details,
+            }
+            for action, task_id, details in entries
+        ],
+    )
+
+
 async def get_recent(
     db: AsyncSession,
     project_id: int,
     limit: int = 50,
     since: Optional[datetime] = None,
-) -> list[Activity]:
+) -> list[RowMapping]:
     stmt = (
-        select(Activity)
-        .options(joinedload(Activity.user))
+        select(*_FEED_COLUMNS)
+        .outerjoin(User, User.id == Activity.user_id)
         .where(Activity.project_id == project_id)
     )
     if since:
         stmt = stmt.where(Activity.created_at >= since)
     stmt = stmt.order_by(desc(Activity.created_at)).limit(limit)
     result = await db.execute(stmt)
-    return list(result.scalars().unique().all())
+    return list(result.mappings().all())
 
 
-async def get_for_task(db: AsyncSession, task_id: int) -> list[Activity]:
+async def get_for_task(db: AsyncSession, task_id: int) -> list[RowMapping]:
     stmt = (
-        select(Activity)
-        .options(joinedload(Activity.user))
+        select(*_FEED_COLUMNS)
+        .outerjoin(User, User.id == Activity.user_id)
         .where(Activity.task_id == task_id)
         .order_by(desc(Activity.created_at))
     )
     result = await db.execute(stmt)
-    return list(result.scalars().unique().all())
+    return list(result.mappings().all())
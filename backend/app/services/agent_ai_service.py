@@ -1,14 +1,23 @@
 """Agent-specific AI prompt functions using Gradient service."""
 
+import asyncio
+import copy
+import hashlib
 import json
 import logging
 import re
+from collections import OrderedDict
+from enum import IntEnum
 from typing import Any
 
 from app.services.gradient_service import gradient
 
 logger = logging.getLogger(__name__)
 
+# Identical prompts (same files + diff) reuse the previous test suggestions
+_SUGGESTION_CACHE_MAX = 128
+_suggestion_cache: OrderedDict[str, dict] = OrderedDict()
+
 
 def _parse_json(content: str, fallback: Any = None) -> Any:
     """Parse JSON from AI response, stripping markdown fences."""
@@ -149,8 +158,105 @@ async def generate_boilerplate(requirements: dict, branch_name: str) -> dict:
         return fallback
 
 
-async def security_scan(diff_content: str, file_paths: list[str]) -> dict:
-    """AI-based security analysis of code changes."""
+class Severity(IntEnum):
+    """Vulnerability severity; scan results carry it as ``severity_int``."""
+
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+_SEVERITY_ORDER = ("critical", "high", "medium", "low")
+_SEVERITY_BY_NAME = {sev.name.lower(): int(sev) for sev in Severity}
+
+
+def _rank_vulnerabilities(
+    vulns: list[dict], top_k_per_severity: int | None
+) -> tuple[list[dict], dict[str, int]]:
+    """Group findings by severity (most severe first), keeping top_k of each."""
+    by_severity: list[list[dict]] = [[] for _ in range(Severity.CRITICAL + 1)]
+    for v in vulns:
+        by_severity[v["severity_int"]].append(v)
+    counts = {sev: len(by_severity[_SEVERITY_BY_NAME[sev]]) for sev in _SEVERITY_ORDER}
+    ranked: list[dict] = []
+    for level in range(Severity.CRITICAL, Severity.LOW - 1, -1):
+        items = by_severity[level]
+        ranked.extend(items if top_k_per_severity is None else items[:top_k_per_severity])
+    return ranked, counts
+
+
+# Security scans run per chunk of file diffs rather than on one giant string
+_SCAN_CHUNK_CHARS = 8000
+_SCAN_MAX_CHUNKS = 8
+_SCAN_CONCURRENCY = 4
+_RISK_ORDER = ("low", "medium", "high", "critical")
+# Lockfiles, generated/minified assets, binaries and vendored code rarely need SAST
+_SAST_SKIP_NAMES = frozenset({
+    "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "poetry.lock", "Pipfile.lock",
+    "Cargo.lock", "Gemfile.lock", "composer.lock", "go.sum",
+})
+_SAST_SKIP_SUFFIXES = (
+    ".lock", ".min.js", ".min.css", ".map", ".svg", ".png", ".jpg", ".jpeg", ".gif",
+    ".ico", ".pdf", ".woff", ".woff2", ".ttf", ".eot", ".zip", ".gz",
+)
+_SAST_SKIP_DIRS = ("vendor/", "node_modules/", "third_party/", "dist/")
+
+
+_DIFF_FILE_HEADER_RE = re.compile(r"^diff --git a/\S+ b/(\S+)")
+
+
+def _needs_sast(path: str) -> bool:
+    # An empty path is a diff section that couldn't be attributed to a file: scan it
+    name = path.rsplit("/", 1)[-1]
+    if name in _SAST_SKIP_NAMES or name.lower().endswith(_SAST_SKIP_SUFFIXES):
+        return False
+    padded = f"/{path}"
+    return not any(f"/{d}" in padded for d in _SAST_SKIP_DIRS)
+
+
+def split_combined_diff(diff_text: str, files: list[str]) -> list[tuple[str, str]]:
+    """Split an inline multi-file diff into (path, diff) pairs for ``security_scan``.
+
+    Sections are cut at ``diff --git`` headers; any text that can't be tied to
+    a file gets path "" so it is always scanned. A diff without headers is
+    only attributed to ``files`` when that can't hide source changes.
+    """
+    pairs = []
+    for section in re.split(r"(?m)^(?=diff --git )", diff_text):
+        if not section.strip():
+            continue
+        match = _DIFF_FILE_HEADER_RE.match(section)
+        pairs.append((match.group(1) if match else "", section))
+    if len(pairs) > 1 or (pairs and pairs[0][0]):
+        return pairs
+    if len(files) == 1 or (files and not any(_needs_sast(f) for f in files)):
+        return [(files[0], diff_text)]
+    return [("", diff_text)]
+
+
+def _chunk_file_diffs(file_diffs: list[tuple[str, str]]) -> list[tuple[list[str], str]]:
+    """Pack (path, diff) pairs into prompt-sized (paths, diff_text) chunks."""
+    chunks: list[tuple[list[str], str]] = []
+    paths: list[str] = []
+    parts: list[str] = []
+    size = 0
+    for path, diff in file_diffs:
+        if not diff or not _needs_sast(path):
+            continue
+        diff = diff[:_SCAN_CHUNK_CHARS]
+        if parts and size + len(diff) > _SCAN_CHUNK_CHARS:
+            chunks.append((paths, "\n".join(parts)))
+            paths, parts, size = [], [], 0
+        paths.append(path)
+        parts.append(diff)
+        size += len(diff) + 1
+    if parts:
+        chunks.append((paths, "\n".join(parts)))
+    return chunks
+
+
+async def _scan_chunk(paths: list[str], diff_text: str) -> dict:
     fallback = {
         "vulnerabilities": [],
         "overall_risk": "low",
@@ -168,27 +274,53 @@ async def security_scan(diff_content: str, file_paths: list[str]) -> dict:
         "passed (boolean - false if any critical or high severity found), "
         "summary (string). Return ONLY JSON, no other text."
     )
-    user = f"Files changed: {', '.join(file_paths)}\n\nDiff:\n{diff_content[:8000]}"
-    try:
-        result = await _ai_call(system, user, max_tokens=3000)
-        parsed = _parse_json(result, fallback)
-        parsed = _validate_keys(parsed, list(fallback.keys()), fallback)
-        # Validate vulnerability structure and enforce passed logic
-        validated_vulns = []
-        for v in parsed.get("vulnerabilities", []):
-            if isinstance(v, dict) and v.get("severity") in ("critical", "high", "medium", "low"):
-                validated_vulns.append(v)
-        parsed["vulnerabilities"] = validated_vulns
-        # Enforce: if any critical/high vulns, passed must be False
-        has_critical_or_high = any(
-            v.get("severity") in ("critical", "high") for v in validated_vulns
-        )
-        if has_critical_or_high:
-            parsed["passed"] = False
-            if parsed.get("overall_risk") == "low":
-                parsed["overall_risk"] = "high"
-        return parsed
-    except Exception:
+    user = f"Files changed: {', '.join(p for p in paths if p) or 'unknown'}\n\nDiff:\n{diff_text}"
+    result = await _ai_call(system, user, max_tokens=3000)
+    parsed = _parse_json(result, fallback)
+    return _validate_keys(parsed, list(fallback.keys()), fallback)
+
+
+async def security_scan(
+    file_diffs: list[tuple[str, str]],
+    top_k_per_severity: int | None = 10,
+) -> dict:
+    """AI-based security analysis of code changes.
+
+    ``file_diffs`` is a list of (path, diff) pairs. Non-source files are
+    skipped and the rest are scanned in prompt-sized chunks, at most
+    ``_SCAN_CONCURRENCY`` AI calls at a time, and the results merged.
+
+    Vulnerabilities come back ordered critical -> low with at most
+    ``top_k_per_severity`` per level (``None`` keeps the full list);
+    ``counts_by_severity`` always reflects the untruncated totals.
+    """
+    chunks = _chunk_file_diffs(file_diffs)
+    if not chunks:
+        return {
+            "vulnerabilities": [],
+            "overall_risk": "low",
+            "passed": True,
+            "summary": "No source changes to scan",
+            "counts_by_severity": dict.fromkeys(_SEVERITY_ORDER, 0),
+        }
+    total_chunks = len(chunks)
+    if total_chunks > _SCAN_MAX_CHUNKS:
+        logger.info(f"Security scan limited to {_SCAN_MAX_CHUNKS} of {total_chunks} diff chunks")
+        chunks = chunks[:_SCAN_MAX_CHUNKS]
+    # Chunks past the cap count like failed ones: unscanned code can't pass
+    unscanned = total_chunks - len(chunks)
+
+    sem = asyncio.Semaphore(_SCAN_CONCURRENCY)
+
+    async def scan(paths: list[str], diff_text: str) -> dict:
+        async with sem:
+            return await _scan_chunk(paths, diff_text)
+
+    results = await asyncio.gather(
+        *(scan(paths, diff_text) for paths, diff_text in chunks), return_exceptions=True
+    )
+    scanned = [r for r in results if not isinstance(r, BaseException)]
+    if not scanned:
         logger.warning("AI security scan failed, using conservative fallback")
         # On AI failure, return conservative result (not passed) to be safe
         return {
@@ -196,8 +328,53 @@ async def security_scan(diff_content: str, file_paths: list[str]) -> dict:
             "overall_risk": "unknown",
             "passed": False,
             "summary": "Security scan AI analysis failed - manual review required",
+            "counts_by_severity": dict.fromkeys(_SEVERITY_ORDER, 0),
         }
 
+    # Validate vulnerability structure and merge the per-chunk results
+    validated_vulns = []
+    risk = "low"
+    passed = len(scanned) == len(results) and not unscanned
+    summaries = []
+    for r in scanned:
+        for v in r.get("vulnerabilities") or []:
+            level = _SEVERITY_BY_NAME.get(v.get("severity")) if isinstance(v, dict) else None
+            if level is not None:
+                # Normalize once here so consumers compare ints, not strings
+                v["severity_int"] = level
+                validated_vulns.append(v)
+        if r.get("overall_risk") in _RISK_ORDER and (
+            _RISK_ORDER.index(r["overall_risk"]) > _RISK_ORDER.index(risk)
+        ):
+            risk = r["overall_risk"]
+        passed = passed and r.get("passed") is not False
+        if r.get("summary"):
+            summaries.append(r["summary"])
+    if len(scanned) < len(results):
+        summaries.append(
+            f"{len(results) - len(scanned)} of {len(results)} diff chunks could not be "
+            "analyzed - manual review required"
+        )
+    if unscanned:
+        summaries.append(
+            f"{unscanned} of {total_chunks} diff chunks not scanned (size limit) - "
+            "manual review required"
+        )
+
+    vulns, counts = _rank_vulnerabilities(validated_vulns, top_k_per_severity)
+    # Enforce: if any critical/high vulns, passed must be False
+    if counts["critical"] or counts["high"]:
+        passed = False
+        if risk == "low":
+            risk = "high"
+    return {
+        "vulnerabilities": vulns,
+        "overall_risk": risk,
+        "passed": passed,
+        "summary": " ".join(summaries),
+        "counts_by_severity": counts,
+    }
+
 
 async def generate_test_suggestions(diff_content: str, file_paths: list[str]) -> dict:
     """Generate test suggestions for code changes."""
@@ -217,13 +394,24 @@ async def generate_test_suggestions(diff_content: str, file_paths: list[str]) ->
         "priority_order (list of test name strings). Return ONLY JSON, no other text."
     )
     user = f"Files changed: {', '.join(file_paths)}\n\nDiff:\n{diff_content[:8000]}"
+    cache_key = hashlib.sha256(user.encode()).hexdigest()
+    cached = _suggestion_cache.get(cache_key)
+    if cached is not None:
+        _suggestion_cache.move_to_end(cache_key)
+        # Hand out copies so a caller mutating its result cannot alter the cache
+        return copy.deepcopy(cached)
     try:
         result = await _ai_call(system, user, max_tokens=3000)
         parsed = _parse_json(result, fallback)
-        return _validate_keys(parsed, list(fallback.keys()), fallback)
+        suggestions = _validate_keys(parsed, list(fallback.keys()), fallback)
     except Exception:
         logger.warning("AI test suggestions failed, using fallback")
         return fallback
+    if suggestions is not fallback:
+        _suggestion_cache[cache_key] = copy.deepcopy(suggestions)
+        while len(_suggestion_cache) > _SUGGESTION_CACHE_MAX:
+            _suggestion_cache.popitem(last=False)
+    return suggestions
 
 
 async def analyze_review_complexity(diff_content: str, file_count: int) -> dict:
@@ -0,0 +1,61 @@
+"""Short-lived, request-coalescing cache of AI endpoint results.
+
+Re-opening the same AI panel over an unchanged board sends the model exactly
+the same inputs again; the first caller runs the completion and concurrent or
+later callers with identical inputs reuse that result.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+TTL_SECONDS = 120.0
+MAX_ENTRIES = 512
+
+_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def _key(endpoint: str, project_id: int, args: tuple) -> str:
+    # Canonical JSON so dict ordering doesn't split otherwise identical inputs
+    payload = json.dumps([endpoint, project_id, args], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _on_done(key: str, task: asyncio.Task) -> None:
+    _inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    result = task.result()
+    if not result:
+        return
+    _cache[key] = (time.monotonic() + TTL_SECONDS, result)
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+async def get_or_compute(
+    endpoint: str, project_id: int, compute: Callable[..., Awaitable[Any]], *args: Any
+) -> Any:
+    """Return ``compute(*args)``, reusing a recent result for identical inputs."""
+    key = _key(endpoint, project_id, args)
+    entry = _cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        _cache.move_to_end(key)
+        return entry[1]
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(compute(*args))
+        task.add_done_callback(lambda t: _on_done(key, t))
+        _inflight[key] = task
+    # Shield so one client disconnecting doesn't cancel the call for the others
+    return await asyncio.shield(task)
+
+
+def clear() -> None:
+    _cache.clear()
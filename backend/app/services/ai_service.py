@@ -2,6 +2,7 @@
 
 import json
 import re
+from typing import AsyncGenerator
 
 from app.services.gradient_service import gradient
 
@@ -18,6 +19,16 @@ def _parse_json(content: str, fallback: dict | list) -> dict | list:
         return fallback
 
 
+def _tasks_context(tasks: list[dict]) -> str:
+    """Project task snapshot for the system message.
+
+    Kept in the system message (the stable prompt prefix) and serialized
+    deterministically so repeated calls over an unchanged board share a
+    cacheable prefix.
+    """
+    return "\n\nPROJECT TASKS:\n" + json.dumps(tasks, indent=2, sort_keys=True)
+
+
 def _chunk_text(text: str, limit: int = _CHUNK_CHAR_LIMIT) -> list[str]:
     """Split long text into chunks on paragraph boundaries with overlap."""
     if len(text) <= limit:
@@ -209,19 +220,19 @@ async def extract_tasks_from_text(
 
 
 async def detect_blockers(tasks: list[dict]) -> dict:
-    tasks_summary = json.dumps(tasks, indent=2)
     messages = [
         {
             "role": "system",
             "content": (
                 "You are a project management AI. Analyze the project tasks and identify "
                 "potential blockers, dependency issues, and risks. Return valid JSON only."
+                + _tasks_context(tasks)
             ),
         },
         {
             "role": "user",
             "content": (
-                f"Analyze these tasks for blockers and dependencies:\n\n{tasks_summary}\n\n"
+                "Analyze the tasks above for blockers and dependencies.\n\n"
                 "Return JSON with this exact structure:\n"
                 '{\n'
                 '  "blockers": [\n'
@@ -296,7 +307,6 @@ async def plan_sprint(
 
 async def score_priorities(tasks: list[dict]) -> dict:
     """AI priority scoring — suggests reordering based on dependencies, urgency, impact."""
-    tasks_summary = json.dumps(tasks, indent=2)
     messages = [
         {
             "role": "system",
@@ -304,12 +314,13 @@ async def score_priorities(tasks: list[dict]) -> dict:
                 "You are a project management AI. Analyze tasks and suggest optimal priority "
                 "ordering based on dependencies, urgency, business impact, and effort. "
                 "Return valid JSON only."
+                + _tasks_context(tasks)
             ),
         },
         {
             "role": "user",
             "content": (
-                f"Score and reorder these tasks by priority:\n\n{tasks_summary}\n\n"
+                "Score and reorder the tasks above by priority.\n\n"
                 "Return JSON with this exact structure:\n"
                 '{\n'
                 '  "recommendations": [\n'
@@ -371,9 +382,9 @@ async def generate_standup(
     return _parse_json(content, {"date": "", "standups": [], "team_summary": "No data"})
 
 
-async def generate_digest(activities: list[dict], tasks: list[dict]) -> dict:
+def _digest_messages(activities: list[dict], tasks: list[dict]) -> list[dict]:
     context = json.dumps({"recent_activities": activities, "current_tasks": tasks}, indent=2)
-    messages = [
+    return [
         {
             "role": "system",
             "content": (
@@ -395,10 +406,21 @@ async def generate_digest(activities: list[dict], tasks: list[dict]) -> dict:
             ),
         },
     ]
+
+
+async def generate_digest(activities: list[dict], tasks: list[dict]) -> dict:
+    messages = _digest_messages(activities, tasks)
     content = await gradient.chat_completion(messages, max_tokens=2048, temperature=0.3)
     return _parse_json(content, {"summary": "No data available", "moved": [], "stuck": [], "at_risk": []})
 
 
+async def generate_digest_stream(activities: list[dict], tasks: list[dict]) -> AsyncGenerator[str, None]:
+    """Same prompt as generate_digest, yielding the raw JSON text as it is produced."""
+    messages = _digest_messages(activities, tasks)
+    async for chunk in gradient.chat_completion_stream(messages, max_tokens=2048, temperature=0.3):
+        yield chunk
+
+
 async def generate_pulse_insights(
     pulse_data: list[dict], completed_tasks: list[dict]
 ) -> dict:
@@ -0,0 +1,128 @@
+"""Short-lived cache of enabled ServiceConnection rows per (project_id, service_type)."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import select
+
+from app.db.database import async_session
+from app.models.service_connection import ServiceConnection
+
+TTL_SECONDS = 60.0
+MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class ConnectionSnapshot:
+    """Detached copy of the fields agents need from a ServiceConnection."""
+
+    project_id: int
+    service_type: str
+    base_url: Optional[str]
+    api_token: str
+    config: dict[str, Any]
+    gl_project_id: Optional[Any]  # config["project_id"], extracted once
+
+
+# (project_id, service_type) -> (expires_at, snapshot or None for "not connected");
+# project_id None holds the "any enabled connection" fallback for that service type
+_cache: OrderedDict[tuple[Optional[int], str], tuple[float, Optional[ConnectionSnapshot]]] = OrderedDict()
+_locks: dict[tuple[Optional[int], str], asyncio.Lock] = {}
+# project_id -> times its connections were invalidated, for caches derived from them
+_generations: dict[int, int] = {}
+
+
+def _snapshot(conn: ServiceConnection) -> ConnectionSnapshot:
+    config = dict(conn.config or {})
+    return ConnectionSnapshot(
+        project_id=conn.project_id,
+        service_type=conn.service_type,
+        base_url=conn.base_url,
+        api_token=conn.api_token,
+        config=config,
+        gl_project_id=config.get("project_id"),
+    )
+
+
+async def _load(project_id: Optional[int], service_type: str) -> Optional[ConnectionSnapshot]:
+    stmt = select(ServiceConnection).where(
+        ServiceConnection.service_type == service_type,
+        ServiceConnection.enabled == True,
+    )
+    if project_id is not None:
+        stmt = stmt.where(ServiceConnection.project_id == project_id)
+    async with async_session() as db:
+        result = await db.execute(stmt)
+        conn = result.scalars().first()
+        return _snapshot(conn) if conn else None
+
+
+def _lookup(key: tuple[Optional[int], str], now: float) -> tuple[bool, Optional[ConnectionSnapshot]]:
+    entry = _cache.get(key)
+    if entry and entry[0] > now:
+        _cache.move_to_end(key)
+        return True, entry[1]
+    return False, None
+
+
+async def get(project_id: int, service_type: str) -> Optional[ConnectionSnapshot]:
+    """Return the enabled connection for a project/service, or None if there is none."""
+    return await _get((project_id, service_type))
+
+
+async def get_any(service_type: str) -> Optional[ConnectionSnapshot]:
+    """Return some enabled connection of this type, for events with no project."""
+    return await _get((None, service_type))
+
+
+async def _get(key: tuple[Optional[int], str]) -> Optional[ConnectionSnapshot]:
+    project_id, service_type = key
+    hit, snapshot = _lookup(key, time.monotonic())
+    if hit:
+        return snapshot
+
+    # One loader per key; concurrent callers wait and then read the fresh entry.
+    # Locks only live while a load is in flight, so _locks stays small.
+    lock = _locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            hit, snapshot = _lookup(key, time.monotonic())
+            if hit:
+                return snapshot
+            snapshot = await _load(project_id, service_type)
+            _cache[key] = (time.monotonic() + TTL_SECONDS, snapshot)
+            _cache.move_to_end(key)
+            while len(_cache) > MAX_ENTRIES:
+                _cache.popitem(last=False)
+            return snapshot
+    finally:
+        if not lock.locked() and _locks.get(key) is lock:
+            del _locks[key]
+
+
+def generation(project_id: int) -> int:
+    """Changes whenever the project's connections are invalidated."""
+    return _generations.get(project_id, 0)
+
+
+def invalidate(project_id: int, service_type: Optional[str] = None) -> None:
+    """Drop cached entries for a project (optionally just one service type).
+
+    The project-less fallback for the same service type(s) is dropped too,
+    since it may have been resolved to this project's connection.
+    """
+    _generations[project_id] = _generations.get(project_id, 0) + 1
+    if service_type is not None:
+        _cache.pop((project_id, service_type), None)
+        _cache.pop((None, service_type), None)
+        return
+    for key in [k for k in _cache if k[0] == project_id or k[0] is None]:
+        _cache.pop(key, None)
+
+
+def clear() -> None:
+    _cache.clear()
+    _locks.clear()
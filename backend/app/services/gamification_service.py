@@ -151,6 +151,26 @@ async def get_or_create_stats(db: AsyncSession, user_id: int, project_id: int) -
     return stats
 
 
+async def get_or_create_stats_bulk(
+    db: AsyncSession, user_ids: list[int], project_id: int
+) -> dict[int, UserStats]:
+    """Stats for many members at once: one SELECT plus one batched INSERT for any missing."""
+    if not user_ids:
+        return {}
+    stmt = select(UserStats).where(
+        UserStats.project_id == project_id,
+        UserStats.user_id.in_(user_ids),
+    )
+    result = await db.execute(stmt)
+    by_user = {s.user_id: s for s in result.scalars()}
+    missing = [UserStats(user_id=uid, project_id=project_id) for uid in user_ids if uid not in by_user]
+    if missing:
+        db.add_all(missing)
+        await db.flush()  # one multi-row INSERT for the whole batch
+        by_user.update((s.user_id, s) for s in missing)
+    return by_user
+
+
 async def award_task_completion(
     db: AsyncSession, user_id: int, project_id: int, priority: str
 ) -> dict:
@@ -20,6 +20,22 @@ def _headers() -> dict:
     }
 
 
+def _with_cache_breakpoint(messages: list[dict]) -> list[dict]:
+    """Mark the leading system message (the stable prompt prefix) as cacheable."""
+    if not settings.gradient_prompt_cache or not messages:
+        return messages
+    first = messages[0]
+    if first.get("role") != "system" or not isinstance(first.get("content"), str):
+        return messages
+    cached = {
+        "role": "system",
+        "content": [
+            {"type": "text", "text": first["content"], "cache_control": {"type": "ephemeral"}}
+        ],
+    }
+    return [cached, *messages[1:]]
+
+
 class GradientService:
     """Client for Gradient AI platform APIs."""
 
@@ -92,7 +108,7 @@ class GradientService:
                 headers=_headers(),
                 json={
                     "model": model,
-                    "messages": messages,
+                    "messages": _with_cache_breakpoint(messages),
                     "max_tokens": max_tokens,
                     "temperature": temperature,
                 },
@@ -120,7 +136,7 @@ class GradientService:
                 headers=_headers(),
                 json={
                     "model": model,
-                    "messages": messages,
+                    "messages": _with_cache_breakpoint(messages),
                     "max_tokens": max_tokens,
                     "temperature": temperature,
                     "stream": True,
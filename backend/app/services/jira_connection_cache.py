@@ -0,0 +1,80 @@
+"""Short-lived cache of each project's JiraConnection row.
+
+Entries hold plain column values; a hit is re-attached to the caller's session
+with ``merge(load=False)`` (no SELECT), so endpoints can still update or
+delete the returned connection as usual.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.models import JiraConnection
+
+TTL_SECONDS = 60.0
+MAX_ENTRIES = 1024
+
+# project_id -> (expires_at, column values or None for "not connected")
+_cache: OrderedDict[int, tuple[float, Optional[dict[str, Any]]]] = OrderedDict()
+_locks: dict[int, asyncio.Lock] = {}
+
+
+def _values(conn: JiraConnection) -> dict[str, Any]:
+    return {attr.key: getattr(conn, attr.key) for attr in inspect(JiraConnection).column_attrs}
+
+
+async def _attach(db: AsyncSession, values: dict[str, Any]) -> JiraConnection:
+    conn = JiraConnection(**values)
+    make_transient_to_detached(conn)
+    return await db.merge(conn, load=False)
+
+
+def _lookup(project_id: int) -> tuple[bool, Optional[dict[str, Any]]]:
+    entry = _cache.get(project_id)
+    if entry and entry[0] > time.monotonic():
+        _cache.move_to_end(project_id)
+        return True, entry[1]
+    return False, None
+
+
+async def get(db: AsyncSession, project_id: int) -> Optional[JiraConnection]:
+    """Return the project's connection attached to ``db``, or None if there is none."""
+    hit, values = _lookup(project_id)
+    if hit:
+        return await _attach(db, values) if values is not None else None
+
+    # One loader per project; concurrent callers wait and then read the fresh entry.
+    # Locks only live while a load is in flight, so _locks stays small.
+    lock = _locks.setdefault(project_id, asyncio.Lock())
+    try:
+        async with lock:
+            hit, values = _lookup(project_id)
+            if hit:
+                return await _attach(db, values) if values is not None else None
+            result = await db.execute(
+                select(JiraConnection).where(JiraConnection.project_id == project_id)
+            )
+            conn = result.scalar_one_or_none()
+            _cache[project_id] = (time.monotonic() + TTL_SECONDS, _values(conn) if conn else None)
+            _cache.move_to_end(project_id)
+            while len(_cache) > MAX_ENTRIES:
+                _cache.popitem(last=False)
+            return conn
+    finally:
+        if not lock.locked() and _locks.get(project_id) is lock:
+            del _locks[project_id]
+
+
+def invalidate(project_id: int) -> None:
+    """Drop a project's entry after its connection is created, updated or removed."""
+    _cache.pop(project_id, None)
+
+
+def clear() -> None:
+    _cache.clear()
+    _locks.clear()
@@ -1,7 +1,12 @@
 """Jira Cloud REST API client — two-way sync between ShipIt and Jira."""
 
+import asyncio
+import time
+from typing import AsyncIterator, Optional
+
 import httpx
-from typing import Optional
+
+from app.adapters.http_client import get_http_client
 
 
 # ShipIt status ↔ Jira status name mapping
@@ -29,35 +34,107 @@ SPRINT_STATE_MAP = {
 }
 
 
+# Jira caps a JQL search page at 100 issues
+_SEARCH_BATCH_SIZE = 100
+
+_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+_TIMEOUT_SECONDS = 30.0
+
+# Atlassian rate limiting: 429 (and 503 under load) carry Retry-After; retry with
+# exponential backoff when they don't. A 429 is rejected before any work is done,
+# but a 503 may follow a committed write, so only reads are retried on 503
+_RETRY_ALWAYS = {429}
+_RETRY_READS = {503}
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_CAP_SECONDS = 30.0
+
+
+class _SiteThrottle:
+    """Request pacing shared by every JiraService talking to the same site."""
+
+    def __init__(self):
+        self.min_interval = 0.0  # from the x-ratelimit-* headers, once seen
+        self.next_slot = 0.0
+        self.paused_until = 0.0
+
+    async def wait(self) -> None:
+        # No await before the slot is claimed, so concurrent callers queue up in order
+        now = time.monotonic()
+        start = max(now, self.next_slot, self.paused_until)
+        self.next_slot = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def observe(self, resp: httpx.Response) -> None:
+        try:
+            interval = float(resp.headers["x-ratelimit-interval-seconds"])
+            fill_rate = float(resp.headers["x-ratelimit-fillrate"])
+        except (KeyError, ValueError):
+            return
+        if fill_rate > 0:
+            self.min_interval = interval / fill_rate
+
+    def pause(self, seconds: float) -> None:
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+_throttles: dict[str, _SiteThrottle] = {}
+
+
+def _should_retry(method: str, url: str, status_code: int) -> bool:
+    if status_code in _RETRY_ALWAYS:
+        return True
+    # JQL search is a read even though it's sent as a POST
+    is_read = method == "GET" or url.endswith("/search/jql")
+    return is_read and status_code in _RETRY_READS
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    try:
+        return min(float(resp.headers["retry-after"]), _BACKOFF_CAP_SECONDS)
+    except (KeyError, ValueError):
+        return min(_BACKOFF_BASE_SECONDS * 2 ** attempt, _BACKOFF_CAP_SECONDS)
+
+
 class JiraService:
     """Client for Jira Cloud REST API v3 using Basic Auth (email + API token)."""
 
-    def __init__(self, site: str, email: str, api_token: str):
+    def __init__(
+        self, site: str, email: str, api_token: str, client: Optional[httpx.AsyncClient] = None
+    ):
         site = site.strip().rstrip("/")
         self.base_url = f"https://{site}/rest/api/3"
         self.agile_url = f"https://{site}/rest/agile/1.0"
         self.auth = (email, api_token)
-
-    def _client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
-            auth=self.auth,
-            headers={"Accept": "application/json", "Content-Type": "application/json"},
-            timeout=30.0,
-        )
+        self._throttle = _throttles.setdefault(site, _SiteThrottle())
+        # Pooled keep-alive connections, so calls after the first skip the TLS handshake
+        self._http = client or get_http_client()
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Issue a request paced to the site's rate limit, retrying when throttled."""
+        for attempt in range(_MAX_ATTEMPTS):
+            await self._throttle.wait()
+            resp = await self._http.request(
+                method, url, auth=self.auth, headers=_HEADERS, timeout=_TIMEOUT_SECONDS, **kwargs
+            )
+            self._throttle.observe(resp)
+            if not _should_retry(method, url, resp.status_code) or attempt == _MAX_ATTEMPTS - 1:
+                break
+            # Hold back every request to this site, not just this one
+            self._throttle.pause(_retry_delay(resp, attempt))
+        resp.raise_for_status()
+        return resp
 
     async def test_connection(self) -> dict:
         """Test credentials by calling /myself."""
-        async with self._client() as client:
-            resp = await client.get(f"{self.base_url}/myself")
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._send("GET", f"{self.base_url}/myself")
+        return resp.json()
 
     async def list_projects(self) -> list[dict]:
         """List Jira projects accessible to the user."""
-        async with self._client() as client:
-            resp = await client.get(f"{self.base_url}/project")
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._send("GET", f"{self.base_url}/project")
+        return resp.json()
 
     async def create_issue(
         self,
@@ -91,109 +168,155 @@ class JiraService:
             }
         }
 
-        async with self._client() as client:
-            resp = await client.post(f"{self.base_url}/issue", json=payload)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._send("POST", f"{self.base_url}/issue", json=payload)
+        return resp.json()
 
     async def get_issue(self, issue_key: str) -> dict:
         """Get a single Jira issue by key."""
-        async with self._client() as client:
-            resp = await client.get(f"{self.base_url}/issue/{issue_key}")
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._send("GET", f"{self.base_url}/issue/{issue_key}")
+        return resp.json()
+
+    async def transition_issue(
+        self, issue_key: str, target_status: str, transitions: Optional[list[dict]] = None
+    ) -> bool:
+        """Transition a Jira issue to a target status name. Returns True on success.
 
-    async def transition_issue(self, issue_key: str, target_status: str) -> bool:
-        """Transition a Jira issue to a target status name. Returns True on success."""
+        ``transitions`` (e.g. from a search with ``expand="transitions"``) saves the lookup.
+        """
         jira_status = STATUS_TO_JIRA.get(target_status, target_status)
 
-        async with self._client() as client:
-            # Get available transitions
-            resp = await client.get(f"{self.base_url}/issue/{issue_key}/transitions")
-            resp.raise_for_status()
+        # Get available transitions
+        if transitions is None:
+            resp = await self._send("GET", f"{self.base_url}/issue/{issue_key}/transitions")
             transitions = resp.json().get("transitions", [])
 
-            # Find matching transition
-            target = None
-            for t in transitions:
-                if t["to"]["name"].lower() == jira_status.lower():
-                    target = t
-                    break
+        # Find matching transition
+        target = None
+        for t in transitions:
+            if t["to"]["name"].lower() == jira_status.lower():
+                target = t
+                break
 
-            if not target:
-                return False
+        if not target:
+            return False
 
-            # Execute transition
-            resp = await client.post(
-                f"{self.base_url}/issue/{issue_key}/transitions",
-                json={"transition": {"id": target["id"]}},
-            )
-            resp.raise_for_status()
-            return True
+        # Execute transition
+        await self._send(
+            "POST", f"{self.base_url}/issue/{issue_key}/transitions",
+            json={"transition": {"id": target["id"]}},
+        )
+        return True
 
     async def search_issues(
         self, project_key: str, max_results: int = 100
     ) -> list[dict]:
         """Search for issues in a Jira project using JQL (POST endpoint)."""
         jql = f"project = {project_key} ORDER BY created DESC"
-        async with self._client() as client:
-            resp = await client.post(
-                f"{self.base_url}/search/jql",
-                json={
-                    "jql": jql,
-                    "maxResults": max_results,
-                    "fields": ["summary", "status", "priority", "description", "sprint"],
-                },
-            )
-            resp.raise_for_status()
+        resp = await self._send(
+            "POST", f"{self.base_url}/search/jql",
+            json={
+                "jql": jql,
+                "maxResults": max_results,
+                "fields": ["summary", "status", "priority", "description", "sprint"],
+            },
+        )
+        return resp.json().get("issues", [])
+
+    async def iter_issue_pages(
+        self, project_key: str, page_size: int = 100
+    ) -> AsyncIterator[list[dict]]:
+        """Yield every issue in a Jira project one page at a time (newest first)."""
+        body = {
+            "jql": f"project = {project_key} ORDER BY created DESC",
+            "maxResults": page_size,
+            "fields": ["summary", "status", "priority", "description", "sprint"],
+        }
+        while True:
+            resp = await self._send("POST", f"{self.base_url}/search/jql", json=body)
+            data = resp.json()
+            issues = data.get("issues", [])
+            if issues:
+                yield issues
+            token = data.get("nextPageToken")
+            if not issues or not token or data.get("isLast", True):
+                return
+            body["nextPageToken"] = token
+
+    async def search_by_keys(
+        self,
+        issue_keys: list[str],
+        fields: tuple[str, ...] = ("status",),
+        expand: Optional[str] = None,
+    ) -> list[dict]:
+        """Fetch many issues by key via JQL, 100 keys per request; unknown keys are skipped."""
+        chunks = [
+            issue_keys[i:i + _SEARCH_BATCH_SIZE]
+            for i in range(0, len(issue_keys), _SEARCH_BATCH_SIZE)
+        ]
+
+        async def search(chunk: list[str]) -> list[dict]:
+            try:
+                resp = await self._send(
+                    "POST", f"{self.base_url}/search/jql",
+                    json={
+                        "jql": f"key in ({', '.join(chunk)})",
+                        "maxResults": len(chunk),
+                        "fields": list(fields),
+                        **({"expand": expand} if expand else {}),
+                    },
+                )
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code != 400:
+                    raise
+                # JQL rejects the whole query if one key was deleted or moved; fall back to
+                # per-key lookups for this chunk only
+                found = await asyncio.gather(
+                    *(self.get_issue(key) for key in chunk), return_exceptions=True
+                )
+                return [issue for issue in found if not isinstance(issue, BaseException)]
             return resp.json().get("issues", [])
 
+        results = await asyncio.gather(*(search(chunk) for chunk in chunks))
+        return [issue for issues in results for issue in issues]
+
     # --- Agile / Sprint API ---
 
     async def get_boards(self, project_key: str) -> list[dict]:
         """Get Jira boards for a project."""
-        async with self._client() as client:
-            resp = await client.get(
-                f"{self.agile_url}/board",
-                params={"projectKeyOrId": project_key},
-            )
-            resp.raise_for_status()
-            return resp.json().get("values", [])
+        resp = await self._send(
+            "GET", f"{self.agile_url}/board",
+            params={"projectKeyOrId": project_key},
+        )
+        return resp.json().get("values", [])
 
     async def get_sprints(self, board_id: int, state: str = "") -> list[dict]:
         """Get sprints for a board. state can be 'future', 'active', 'closed' or empty for all."""
         params = {}
         if state:
             params["state"] = state
-        async with self._client() as client:
-            resp = await client.get(
-                f"{self.agile_url}/board/{board_id}/sprint",
-                params=params,
-            )
-            resp.raise_for_status()
-            return resp.json().get("values", [])
+        resp = await self._send(
+            "GET", f"{self.agile_url}/board/{board_id}/sprint",
+            params=params,
+        )
+        return resp.json().get("values", [])
 
     async def get_sprint_issues(self, sprint_id: int) -> list[dict]:
         """Get issues in a sprint."""
-        async with self._client() as client:
-            resp = await client.get(
-                f"{self.agile_url}/sprint/{sprint_id}/issue",
-                params={"maxResults": 200},
-            )
-            resp.raise_for_status()
-            return resp.json().get("issues", [])
+        resp = await self._send(
+            "GET", f"{self.agile_url}/sprint/{sprint_id}/issue",
+            params={"maxResults": 200},
+        )
+        return resp.json().get("issues", [])
 
     async def move_issues_to_sprint(self, sprint_id: int, issue_keys: list[str]) -> bool:
         """Move issues into a Jira sprint."""
         if not issue_keys:
             return True
-        async with self._client() as client:
-            resp = await client.post(
-                f"{self.agile_url}/sprint/{sprint_id}/issue",
-                json={"issues": issue_keys},
-            )
-            resp.raise_for_status()
-            return True
+        await self._send(
+            "POST", f"{self.agile_url}/sprint/{sprint_id}/issue",
+            json={"issues": issue_keys},
+        )
+        return True
 
     async def create_sprint(
         self,
@@ -215,13 +338,11 @@ class JiraService:
         if goal:
             payload["goal"] = goal
 
-        async with self._client() as client:
-            resp = await client.post(
-                f"{self.agile_url}/sprint",
-                json=payload,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._send(
+            "POST", f"{self.agile_url}/sprint",
+            json=payload,
+        )
+        return resp.json()
 
     @staticmethod
     def parse_jira_sprint_state(state: str) -> str:
@@ -0,0 +1,77 @@
+"""Short-lived cache of each project's member roster as (user_id, name) pairs."""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ProjectMember, User
+
+TTL_SECONDS = 30.0
+MAX_ENTRIES = 1024
+
+Roster = tuple[tuple[int, str], ...]
+
+# project_id -> (expires_at, roster)
+_cache: OrderedDict[int, tuple[float, Roster]] = OrderedDict()
+_locks: dict[int, asyncio.Lock] = {}
+
+
+async def _load(db: AsyncSession, project_id: int) -> Roster:
+    result = await db.execute(
+        select(User.id, User.name)
+        .join(ProjectMember, ProjectMember.user_id == User.id)
+        .where(ProjectMember.project_id == project_id)
+        .order_by(ProjectMember.id)
+    )
+    return tuple((user_id, name) for user_id, name in result)
+
+
+def _lookup(project_id: int) -> Roster | None:
+    entry = _cache.get(project_id)
+    if entry and entry[0] > time.monotonic():
+        _cache.move_to_end(project_id)
+        return entry[1]
+    return None
+
+
+async def get(db: AsyncSession, project_id: int) -> Roster:
+    """Return the project's members, loading them with ``db`` on a miss."""
+    roster = _lookup(project_id)
+    if roster is not None:
+        return roster
+
+    # One loader per project; concurrent callers wait and then read the fresh entry.
+    # Locks only live while a load is in flight, so _locks stays small.
+    lock = _locks.setdefault(project_id, asyncio.Lock())
+    try:
+        async with lock:
+            roster = _lookup(project_id)
+            if roster is not None:
+                return roster
+            roster = await _load(db, project_id)
+            _cache[project_id] = (time.monotonic() + TTL_SECONDS, roster)
+            _cache.move_to_end(project_id)
+            while len(_cache) > MAX_ENTRIES:
+                _cache.popitem(last=False)
+            return roster
+    finally:
+        if not lock.locked() and _locks.get(project_id) is lock:
+            del _locks[project_id]
+
+
+async def is_member(db: AsyncSession, project_id: int, user_id: int) -> bool:
+    """Whether ``user_id`` belongs to the project, answered from the cached roster."""
+    return any(member_id == user_id for member_id, _ in await get(db, project_id))
+
+
+def invalidate(project_id: int) -> None:
+    """Drop a project's roster after its membership changes."""
+    _cache.pop(project_id, None)
+
+
+def clear() -> None:
+    _cache.clear()
+    _locks.clear()
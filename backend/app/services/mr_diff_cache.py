@@ -0,0 +1,82 @@
+"""Short-lived, request-coalescing cache of GitLab merge request diffs.
+
+Several agents react to the same MR event and each needs the diff; the first
+caller fetches it and concurrent/later callers reuse that result.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.adapters.gitlab_adapter import get_gitlab_adapter
+from app.services import connection_cache
+
+TTL_SECONDS = 300.0
+MAX_ENTRIES = 256
+
+DiffKey = tuple[int, int, Optional[str]]  # (project_id, mr_iid, head sha)
+FileDiffs = list[tuple[str, str]]  # [(path, diff)] per changed file
+DiffResult = tuple[str, list[str]]  # (diff text, file paths)
+
+_cache: OrderedDict[DiffKey, tuple[float, FileDiffs]] = OrderedDict()
+_inflight: dict[DiffKey, asyncio.Task] = {}
+
+
+async def _fetch(project_id: int, mr_iid: int) -> FileDiffs:
+    conn = await connection_cache.get(project_id, "gitlab")
+    if not conn or not conn.gl_project_id:
+        return []
+
+    gitlab = get_gitlab_adapter(conn.base_url or "https://gitlab.com", conn.api_token)
+    diffs = await gitlab.get_mr_diff(conn.gl_project_id, mr_iid)
+    return [(d.get("new_path", ""), d.get("diff", "")) for d in diffs]
+
+
+def _on_fetched(key: DiffKey, task: asyncio.Task) -> None:
+    _inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    result = task.result()
+    if not result:
+        return  # don't pin "no connection / empty diff" for the full TTL
+    _cache[key] = (time.monotonic() + TTL_SECONDS, result)
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+async def get_file_diffs(project_id: int, mr_iid: int, sha: Optional[str] = None) -> FileDiffs:
+    """Return [(path, diff)] for an MR, fetching from GitLab at most once."""
+    key = (project_id, mr_iid, sha)
+    entry = _cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        _cache.move_to_end(key)
+        return entry[1]
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch(project_id, mr_iid))
+        task.add_done_callback(lambda t: _on_fetched(key, t))
+        _inflight[key] = task
+    # Shield so one cancelled waiter doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def get_diff(
+    project_id: int, mr_iid: int, sha: Optional[str] = None, max_chars: Optional[int] = None
+) -> DiffResult:
+    """Return (diff_text, file_paths); with ``max_chars`` only that much diff is joined."""
+    file_diffs = await get_file_diffs(project_id, mr_iid, sha)
+    file_paths = [path for path, _ in file_diffs]
+    if max_chars is None:
+        return "\n".join(diff for _, diff in file_diffs), file_paths
+
+    parts: list[str] = []
+    size = 0
+    for _, diff in file_diffs:
+        if size >= max_chars:
+            break
+        parts.append(diff)
+        size += len(diff) + 1
+    return "\n".join(parts)[:max_chars], file_paths
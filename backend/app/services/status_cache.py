@@ -0,0 +1,37 @@
+"""Short-TTL cache of pre-encoded JSON bodies for hot, read-mostly agent endpoints."""
+
+import time
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic_core import to_json
+
+# key -> (expires_at, encoded JSON body)
+_cache: dict[str, tuple[float, bytes]] = {}
+
+
+def get(key: str) -> Optional[Response]:
+    """Return a ready-to-send JSON response for key, or None on miss/expiry."""
+    entry = _cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return Response(content=entry[1], media_type="application/json")
+    return None
+
+
+def put(key: str, payload: Any, ttl_seconds: float) -> Response:
+    """Encode payload once, cache the bytes and return them as a response."""
+    now = time.monotonic()
+    for k in [k for k, (expires_at, _) in _cache.items() if expires_at <= now]:
+        _cache.pop(k, None)
+    body = to_json(payload)
+    _cache[key] = (now + ttl_seconds, body)
+    return Response(content=body, media_type="application/json")
+
+
+def invalidate_prefix(prefix: str) -> None:
+    for key in [k for k in _cache if k.startswith(prefix)]:
+        _cache.pop(key, None)
+
+
+def clear() -> None:
+    _cache.clear()
@@ -0,0 +1,42 @@
+"""Shared fixtures: a throwaway SQLite database and a per-test event loop."""
+
+import asyncio
+import os
+import tempfile
+
+# Settings are read once at import time, so point them at a scratch DB first
+_DB_DIR = tempfile.mkdtemp(prefix="shipit-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/test.db"
+os.environ["DEBUG"] = "false"
+
+import pytest
+
+from app.db.database import engine, init_db
+from app.services import connection_cache, jira_connection_cache, member_cache
+
+
+async def _with_dispose(coro):
+    try:
+        return await coro
+    finally:
+        # Pooled aiosqlite connections belong to this loop; the next test gets a new one
+        await engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    asyncio.run(_with_dispose(init_db()))
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    connection_cache.clear()
+    member_cache.clear()
+    jira_connection_cache.clear()
+    yield
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine to completion on a fresh event loop."""
+    return lambda coro: asyncio.run(_with_dispose(coro))
@@ -0,0 +1,98 @@
+"""Invalidation of the connection, member roster and Jira connection caches."""
+
+from sqlalchemy import update
+
+from app.db.database import async_session
+from app.models import JiraConnection, Project, ProjectMember, User
+from app.models.service_connection import ServiceConnection
+from app.services import connection_cache, jira_connection_cache, member_cache
+
+
+async def _project_with_owner(name: str) -> tuple[int, int]:
+    async with async_session() as db:
+        user = User(name=name, email=f"{name}@shipit", password_hash="")
+        db.add(user)
+        await db.flush()
+        project = Project(name=f"{name} project", owner_id=user.id)
+        db.add(project)
+        await db.flush()
+        db.add(ProjectMember(project_id=project.id, user_id=user.id, role="owner"))
+        await db.commit()
+        return project.id, user.id
+
+
+def test_connection_cache_reloads_after_invalidate(run):
+    async def scenario():
+        project_id, _ = await _project_with_owner("conn-cache")
+        async with async_session() as db:
+            db.add(ServiceConnection(
+                project_id=project_id, service_type="gitlab", api_token="old", config={},
+            ))
+            await db.commit()
+
+        assert (await connection_cache.get(project_id, "gitlab")).api_token == "old"
+        async with async_session() as db:
+            await db.execute(
+                update(ServiceConnection)
+                .where(ServiceConnection.project_id == project_id)
+                .values(api_token="new")
+            )
+            await db.commit()
+        # Still served from the cache until the writer invalidates it
+        assert (await connection_cache.get(project_id, "gitlab")).api_token == "old"
+
+        generation = connection_cache.generation(project_id)
+        connection_cache.invalidate(project_id, "gitlab")
+        assert connection_cache.generation(project_id) == generation + 1
+        assert (await connection_cache.get(project_id, "gitlab")).api_token == "new"
+        assert not connection_cache._locks
+
+    run(scenario())
+
+
+def test_member_cache_sees_new_member_after_invalidate(run):
+    async def scenario():
+        project_id, owner_id = await _project_with_owner("member-cache")
+        async with async_session() as db:
+            assert await member_cache.is_member(db, project_id, owner_id)
+            newcomer = User(name="member-cache-new", email="new@shipit", password_hash="")
+            db.add(newcomer)
+            await db.flush()
+            db.add(ProjectMember(project_id=project_id, user_id=newcomer.id, role="member"))
+            await db.commit()
+
+            assert not await member_cache.is_member(db, project_id, newcomer.id)
+            member_cache.invalidate(project_id)
+            assert await member_cache.is_member(db, project_id, newcomer.id)
+        assert not member_cache._locks
+
+    run(scenario())
+
+
+def test_jira_connection_cache_tracks_create_and_delete(run):
+    async def scenario():
+        project_id, _ = await _project_with_owner("jira-cache")
+        async with async_session() as db:
+            assert await jira_connection_cache.get(db, project_id) is None
+
+            db.add(JiraConnection(
+                project_id=project_id, jira_site="https://x.atlassian.net",
+                jira_email="a@x", jira_api_token="t", jira_project_key="X",
+            ))
+            await db.commit()
+            # The cached "not connected" answer stands until invalidated
+            assert await jira_connection_cache.get(db, project_id) is None
+            jira_connection_cache.invalidate(project_id)
+
+        async with async_session() as db:
+            conn = await jira_connection_cache.get(db, project_id)
+            assert conn.jira_project_key == "X"
+            # A cache hit is attached to the caller's session, so it can be deleted
+            cached = await jira_connection_cache.get(db, project_id)
+            await db.delete(cached)
+            await db.commit()
+            jira_connection_cache.invalidate(project_id)
+            assert await jira_connection_cache.get(db, project_id) is None
+        assert not jira_connection_cache._locks
+
+    run(scenario())
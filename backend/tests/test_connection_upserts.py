@@ -0,0 +1,84 @@
+"""The single-statement upsert endpoints for agent configs and service connections."""
+
+import httpx
+from sqlalchemy import func, select
+
+from app.adapters import gitlab_adapter
+from app.db.database import async_session
+from app.main import app
+from app.models.agent_state import AgentConfig
+from app.models.service_connection import ServiceConnection
+from app.services import connection_cache
+
+
+def _client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test/api")
+
+
+async def _enter_project(client: httpx.AsyncClient, name: str) -> int:
+    """Sign in as ``name`` and create a project owned by them."""
+    user = (await client.post("/auth/enter", json={"name": name})).json()
+    client.headers["X-User-Id"] = str(user["id"])
+    project = (await client.post("/projects/", json={"name": f"{name} project"})).json()
+    return project["id"]
+
+
+async def _agent_config(project_id: int) -> AgentConfig:
+    async with async_session() as db:
+        return await db.scalar(select(AgentConfig).where(AgentConfig.project_id == project_id))
+
+
+def test_update_agent_config_only_changes_sent_fields(run):
+    async def scenario():
+        async with _client() as client:
+            project_id = await _enter_project(client, "upsert-config")
+            url = f"/projects/{project_id}/agents/security_compliance"
+            r = await client.put(url, json={"enabled": False})
+            assert r.status_code == 200
+            first = await _agent_config(project_id)
+            assert first.enabled is False
+
+            r = await client.put(url, json={"config": {"threshold": "high"}})
+            assert r.status_code == 200
+            second = await _agent_config(project_id)
+            assert second.id == first.id
+            assert second.enabled is False
+            assert second.config == {"threshold": "high"}
+            assert second.updated_at > first.updated_at
+
+            # An empty body leaves the row untouched
+            r = await client.put(url, json={})
+            assert r.status_code == 200
+            assert (await _agent_config(project_id)).updated_at == second.updated_at
+
+    run(scenario())
+
+
+def test_create_connection_upserts_and_drops_stale_caches(run):
+    async def scenario():
+        async with _client() as client:
+            project_id = await _enter_project(client, "upsert-connection")
+            url = f"/projects/{project_id}/connections"
+            body = {"service_type": "gitlab", "base_url": "https://gl.example", "api_token": "old"}
+            assert (await client.post(url, json=body)).status_code == 200
+            assert (await connection_cache.get(project_id, "gitlab")).api_token == "old"
+            old_adapter = gitlab_adapter.get_gitlab_adapter("https://gl.example", "old")
+
+            body["api_token"] = "new"
+            assert (await client.post(url, json=body)).status_code == 200
+
+            async with async_session() as db:
+                count = await db.scalar(
+                    select(func.count()).select_from(ServiceConnection)
+                    .where(ServiceConnection.project_id == project_id)
+                )
+            assert count == 1
+            assert (await connection_cache.get(project_id, "gitlab")).api_token == "new"
+            assert ("https://gl.example", "old") not in gitlab_adapter._adapter_pool
+            assert old_adapter._client is None
+
+            r = await client.delete(f"{url}/gitlab")
+            assert r.status_code == 200
+            assert await connection_cache.get(project_id, "gitlab") is None
+
+    run(scenario())
@@ -0,0 +1,70 @@
+"""SAST filtering of inline (combined) diffs."""
+
+import pytest
+
+from app.services import agent_ai_service
+
+LOCKFILE_SECTION = (
+    "diff --git a/package-lock.json b/package-lock.json\n"
+    "--- a/package-lock.json\n+++ b/package-lock.json\n"
+    '@@ -1 +1 @@\n-  "version": "1.0.0"\n+  "version": "1.0.1"\n'
+)
+SOURCE_SECTION = (
+    "diff --git a/app/db.py b/app/db.py\n"
+    "--- a/app/db.py\n+++ b/app/db.py\n"
+    '@@ -1 +1 @@\n+cursor.execute(f"SELECT * FROM users WHERE id = {user_id}")\n'
+)
+CLEAN_RESULT = '{"vulnerabilities": [], "overall_risk": "low", "passed": true, "summary": "ok"}'
+
+
+@pytest.fixture
+def prompts(monkeypatch):
+    """Capture every prompt sent to the AI instead of calling it."""
+    sent: list[str] = []
+
+    async def fake_ai_call(system, user, max_tokens=2048):
+        sent.append(user)
+        return CLEAN_RESULT
+
+    monkeypatch.setattr(agent_ai_service, "_ai_call", fake_ai_call)
+    return sent
+
+
+def test_split_combined_diff_attributes_sections_to_their_files():
+    pairs = agent_ai_service.split_combined_diff(
+        LOCKFILE_SECTION + SOURCE_SECTION, ["package-lock.json", "app/db.py"]
+    )
+    assert [path for path, _ in pairs] == ["package-lock.json", "app/db.py"]
+    assert pairs[1][1] == SOURCE_SECTION
+
+
+def test_headerless_diff_with_source_files_is_not_attributed_to_a_lockfile():
+    body = SOURCE_SECTION.split("\n", 1)[1]  # strip the diff --git header
+    pairs = agent_ai_service.split_combined_diff(body, ["package-lock.json", "app/db.py"])
+    assert pairs == [("", body)]
+
+
+def test_headerless_diff_for_a_single_file_keeps_its_path():
+    pairs = agent_ai_service.split_combined_diff("+x = 1\n", ["app/x.py"])
+    assert pairs == [("app/x.py", "+x = 1\n")]
+
+
+def test_security_scan_skips_lockfile_but_scans_source_in_inline_diff(run, prompts):
+    pairs = agent_ai_service.split_combined_diff(
+        LOCKFILE_SECTION + SOURCE_SECTION, ["package-lock.json", "app/db.py"]
+    )
+    result = run(agent_ai_service.security_scan(pairs))
+
+    assert result["passed"] is True
+    assert len(prompts) == 1
+    assert "cursor.execute" in prompts[0]
+    assert "package-lock.json" not in prompts[0]
+
+
+def test_security_scan_scans_unattributed_inline_diff(run, prompts):
+    body = SOURCE_SECTION.split("\n", 1)[1]
+    pairs = agent_ai_service.split_combined_diff(body, ["package-lock.json", "app/db.py"])
+    run(agent_ai_service.security_scan(pairs))
+
+    assert len(prompts) == 1
+    assert "cursor.execute" in prompts[0]